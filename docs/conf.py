@@ -291,6 +291,7 @@ rst_epilog = """
 .. |pp| replace:: `python-pptx`
 
 .. |Presentation| replace:: :class:`~pptx.presentation.Presentation`
+.. |PresentationFactory| replace:: :class:`~pptx.PresentationFactory`
 
 .. |PresentationPart| replace:: :class:`.PresentationPart`
 
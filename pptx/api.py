@@ -10,28 +10,138 @@ be named as internal (leading underscore).
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
+import shutil
+import tempfile
 
+from .compat import is_string
 from .opc.constants import CONTENT_TYPE as CT
 from .package import Package
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, lazy=False, workers=None):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *lazy* is |True|, images, media and other binary parts are not read
+    into memory until they are used, which greatly reduces the memory needed
+    to open a media-heavy presentation. The *pptx* file is held open and must
+    remain unchanged while the presentation is in use in that case, until the
+    presentation is closed by calling its :meth:`~.Presentation.close` method
+    or using it as a context manager::
+
+        with Presentation("deck.pptx", lazy=True) as prs:
+            ...
+
+    When *workers* is an integer greater than 1, the parts of the
+    presentation are read, inflated and parsed by that many threads in
+    parallel, which can shorten the time to open a very large presentation.
+    Otherwise the XML of a part is only parsed when that part is first used.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    return _presentation_part(
+        Package.open(pptx, lazy=lazy, workers=workers), pptx
+    ).presentation
 
-    if not _is_pptx_package(presentation_part):
-        tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
-        raise ValueError(tmpl % (pptx, presentation_part.content_type))
 
-    return presentation_part.presentation
+class PresentationFactory(object):
+    """
+    Produces any number of independent |Presentation| objects from a single
+    loading of *pptx*, where *pptx* has the same meaning as in
+    :func:`Presentation`.
+
+    Calling the factory returns a new presentation. Each one is like a
+    presentation freshly opened from *pptx* and can be changed and saved
+    without affecting the others, but is far cheaper to produce because the
+    package is not read again. The presentations share the bytes of their
+    parts; the XML of a part is only parsed, into a copy of its own, when
+    that part is first used by a presentation. *lazy* and *workers* apply to
+    the single loading of *pptx*.
+
+    When *lazy* is |True|, the presentations share binary parts they have not
+    changed by reading them, when needed, from a private temporary copy of
+    *pptx* made by the factory. So *pptx* itself is free to change, for
+    example by saving a presentation over it. An expanded (unzipped) *pptx*
+    directory is always read in full. The copy is removed when the factory is
+    closed, by calling :meth:`close` or using the factory as a context
+    manager. A presentation produced by a lazy factory that is to be used
+    after that must first be closed itself, which reads those parts into
+    memory.
+    """
+
+    def __init__(self, pptx=None, lazy=False, workers=None):
+        if pptx is None:
+            pptx = _default_pptx_path()
+        self._pptx_copy = None
+        source = pptx
+        if lazy and is_string(pptx) and os.path.isdir(pptx):
+            lazy = False
+        elif lazy and (not is_string(pptx) or os.path.isfile(pptx)):
+            source = self._pptx_copy = _private_copy(pptx)
+        package = Package.open(source, lazy=lazy, workers=workers)
+        _presentation_part(package, pptx)
+        self._package = package
+
+    def __call__(self):
+        """Return a new |Presentation| object copied from the loaded package."""
+        return self._open_package.clone().main_document_part.presentation
+
+    def __enter__(self):
+        """Enable use as a context-manager, closing this factory on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Close this factory on exit from context."""
+        self.close()
+
+    def close(self):
+        """
+        Close the package loaded by this factory, releasing any file it holds
+        open, then remove the private copy of *pptx* a lazy factory reads
+        from. The factory cannot produce presentations once closed; calling it
+        raises |ValueError|. Closing it again has no effect.
+        """
+        package, self._package = self._package, None
+        if package is not None:
+            package.close()
+        pptx_copy, self._pptx_copy = self._pptx_copy, None
+        if pptx_copy is not None:
+            pptx_copy.close()
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Return a new factory restored from *snapshot*, the bytes produced by
+        :meth:`snapshot`. This is much faster than loading the original file,
+        which is not needed. Each restored factory holds its own copy of the
+        parts in memory. A snapshot contains only plain data, never a class,
+        and each part is constructed from its content type just as it is when
+        a file is loaded.
+        """
+        factory = cls.__new__(cls)
+        factory._package = Package.from_snapshot(snapshot)
+        factory._pptx_copy = None
+        return factory
+
+    def snapshot(self):
+        """
+        Return bytes from which :meth:`from_snapshot` can restore a factory
+        equivalent to this one, for example in another process. The bytes can
+        be stored in a file; they are only valid for the version of |pp| that
+        produced them.
+        """
+        return self._open_package.snapshot()
+
+    @property
+    def _open_package(self):
+        """The package loaded by this factory, raising |ValueError| once closed."""
+        if self._package is None:
+            raise ValueError("I/O operation on closed PresentationFactory")
+        return self._package
 
 
 def _default_pptx_path():
@@ -42,6 +152,36 @@ def _default_pptx_path():
     return os.path.join(_thisdir, "templates", "default.pptx")
 
 
+def _private_copy(pptx):
+    """
+    Return an anonymous temporary file containing a copy of the package
+    *pptx*, a path or file-like object. The file is removed when closed.
+    """
+    pptx_copy = tempfile.TemporaryFile()
+    if is_string(pptx):
+        with open(pptx, "rb") as f:
+            shutil.copyfileobj(f, pptx_copy)
+    else:
+        pptx.seek(0)
+        shutil.copyfileobj(pptx, pptx_copy)
+    pptx_copy.seek(0)
+    return pptx_copy
+
+
+def _presentation_part(package, pptx):
+    """
+    Return the main document part of *package*, loaded from *pptx*, raising
+    |ValueError| if it is not a presentation part.
+    """
+    presentation_part = package.main_document_part
+
+    if not _is_pptx_package(presentation_part):
+        tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
+        raise ValueError(tmpl % (pptx, presentation_part.content_type))
+
+    return presentation_part
+
+
 def _is_pptx_package(prs_part):
     """
     Return |True| if *prs_part* is a valid main document part, |False|
@@ -10,11 +10,16 @@ import os
 
 from .compat import is_string
 from .opc.constants import CONTENT_TYPE as CT
+from .opc.serialized import DeferredBlob, FileBlob
 from .util import lazyproperty
 
 
 class Video(object):
-    """Immutable value object representing a video such as MP4."""
+    """Immutable value object representing a video such as MP4.
+
+    *blob* is either the bytes of the video or a |FileBlob| referring to a
+    video file, which is then only read when its bytes are needed.
+    """
 
     def __init__(self, blob, mime_type, filename):
         super(Video, self).__init__()
@@ -32,12 +37,14 @@ class Video(object):
         """Return a new |Video| object containing video in *movie_file*.
 
         *movie_file* can be either a path (string) or a file-like
-        (e.g. StringIO) object.
+        (e.g. StringIO) object. A video file at a path is not read into
+        memory; it is hashed and later copied into the package a chunk at a
+        time, so the file must remain in place until the presentation is
+        saved. A file-like object is read in full.
         """
         if is_string(movie_file):
             # treat movie_file as a path
-            with open(movie_file, "rb") as f:
-                blob = f.read()
+            blob = FileBlob(movie_file)
             filename = os.path.basename(movie_file)
         else:
             # assume movie_file is a file-like object
@@ -48,8 +55,12 @@ class Video(object):
 
     @property
     def blob(self):
-        """The bytestream of the media "file"."""
-        return self._blob
+        """The bytestream of the media "file".
+
+        This reads the whole file for a video loaded from a path.
+        """
+        blob = self._blob
+        return blob.load() if isinstance(blob, DeferredBlob) else blob
 
     @property
     def content_type(self):
@@ -78,6 +89,12 @@ class Video(object):
             CT.X_MS_VIDEO: "avi",
         }.get(self._mime_type, "vid")
 
+    @property
+    def deferred_blob(self):
+        """|DeferredBlob| referring to the video file, |None| when held in memory."""
+        blob = self._blob
+        return blob if isinstance(blob, DeferredBlob) else None
+
     @property
     def filename(self):
         """Return a filename.ext string appropriate to this video.
@@ -97,8 +114,17 @@ class Video(object):
         """The SHA1 hash digest for the binary "file" of this video.
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
+
+        The video file of a video loaded from a path is hashed a chunk at a
+        time.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        deferred_blob = self.deferred_blob
+        if deferred_blob is None:
+            return hashlib.sha1(self._blob).hexdigest()
+        sha1 = hashlib.sha1()
+        for chunk in deferred_blob.member_chunks()[1]:
+            sha1.update(chunk)
+        return sha1.hexdigest()
 
 
 SPEAKER_IMAGE_BYTES = base64.b64decode(
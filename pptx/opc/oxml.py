@@ -4,6 +4,7 @@
 
 from lxml import etree
 
+from ..compat import to_unicode
 from .constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
 from ..oxml import parse_xml, register_element_cls
 from ..oxml.simpletypes import (
@@ -39,6 +40,90 @@ def serialize_part_xml(part_elm):
     return xml
 
 
+def serialize_rels_xml(rels):
+    """Return bytes of `.rels` item XML for `rels`.
+
+    `rels` is a sequence of (rId, reltype, target_ref, is_external) tuples. Bytes are
+    the same as those of a serialized `CT_Relationships` element, but are composed
+    directly, without building an element tree.
+    """
+    items = [
+        '<Relationship Id="%s" Type="%s" Target="%s"%s/>'
+        % (
+            _escape_attr(rId),
+            _escape_attr(reltype),
+            _escape_attr(target_ref),
+            ' TargetMode="External"' if is_external else "",
+        )
+        for rId, reltype, target_ref, is_external in rels
+    ]
+    return _serialize_root("Relationships", nsmap["pr"], items)
+
+
+def serialize_types_xml(defaults, overrides):
+    """Return bytes of `[Content_Types].xml` item XML.
+
+    `defaults` is a sequence of (ext, content_type) pairs and `overrides` a sequence of
+    (partname, content_type) pairs, each written in the order given. The bytes are the
+    same as those of a serialized `CT_Types` element, but are composed directly.
+    """
+    items = [
+        '<Default Extension="%s" ContentType="%s"/>'
+        % (_escape_attr(ext), _escape_attr(content_type))
+        for ext, content_type in defaults
+    ]
+    items.extend(
+        '<Override PartName="%s" ContentType="%s"/>'
+        % (_escape_attr(partname), _escape_attr(content_type))
+        for partname, content_type in overrides
+    )
+    return _serialize_root("Types", nsmap["ct"], items)
+
+
+# --- "&" must come first so entities introduced by the others are not escaped again ---
+_attr_entities = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("\n", "&#10;"),
+    ("\r", "&#13;"),
+    ("\t", "&#9;"),
+)
+
+
+def _escape_attr(value):
+    """Return `value` escaped for use as an attribute value, as libxml2 does it.
+
+    `value` can be text or UTF-8 encoded bytes, like a Python 2 `str`. Text is returned.
+    """
+    value = to_unicode(value)
+    for char, entity in _attr_entities:
+        if char in value:
+            value = value.replace(char, entity)
+    return value
+
+
+def _serialize_root(tag, namespace, items):
+    """Return bytes of a standalone XML document having root `tag` containing `items`.
+
+    `items` is a sequence of str child element XML. The root element is self-closing
+    when `items` is empty, as it is when lxml serializes it.
+    """
+    declaration = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    if not items:
+        xml = '%s<%s xmlns="%s"/>' % (declaration, tag, namespace)
+    else:
+        xml = '%s<%s xmlns="%s">%s</%s>' % (
+            declaration,
+            tag,
+            namespace,
+            "".join(items),
+            tag,
+        )
+    return xml.encode("utf-8")
+
+
 class CT_Default(BaseOxmlElement):
     """
     ``<Default>`` element, specifying the default content type to be applied
@@ -7,16 +7,58 @@ presentations to and from a .pptx file.
 """
 
 import collections
+import io
+import os
+import pickle
+import posixpath
+
+from multiprocessing.pool import ThreadPool
+
+from lxml import etree
 
 from pptx.compat import is_string, Mapping
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
-from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml, serialize_rels_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
-from pptx.opc.serialized import PackageReader, PackageWriter
+from pptx.opc.serialized import DeferredBlob, PackageReader, PackageWriter
 from pptx.opc.shared import CaseInsensitiveDict
+from pptx.opc.spec import default_content_types
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsmap
 from pptx.util import lazyproperty
 
+# --- counts the `r:id` attributes having the value `rId` in an XML tree. Evaluated
+# --- entirely by libxml2, so no Python object is created per attribute.
+_rId_ref_count = etree.XPath("count(//@r:id[.=$rId])", namespaces=nsmap("r"))
+
+# --- values of all relationship-namespace attributes (r:id, r:embed, etc.) ---
+_rId_refs = etree.XPath("//@r:*", namespaces=nsmap("r"))
+
+# --- (ext, content_type) pairs expressed by a Default element in [Content_Types] ---
+_default_content_types = frozenset(default_content_types)
+
+# --- leads the bytes of a package snapshot, changed when the layout of one changes ---
+_SNAPSHOT_FORMAT = b"python-pptx-package-snapshot-2\n"
+
+# --- relationships of these types are only ever used by an explicit reference in the
+# --- XML of their source part, so one that is not referenced can be pruned.
+_PRUNABLE_RELTYPES = frozenset(
+    (
+        RT.AUDIO,
+        RT.CHART,
+        RT.DIAGRAM_COLORS,
+        RT.DIAGRAM_DATA,
+        RT.DIAGRAM_LAYOUT,
+        RT.DIAGRAM_QUICK_STYLE,
+        RT.HYPERLINK,
+        RT.IMAGE,
+        RT.MEDIA,
+        RT.OLE_OBJECT,
+        RT.PACKAGE,
+        RT.VIDEO,
+    )
+)
+
 
 class _RelatableMixin(object):
     """Provide relationship methods required by both the package and each part."""
@@ -35,11 +77,14 @@ class _RelatableMixin(object):
         If such a relationship already exists, its rId is returned. Otherwise the
         relationship is added and its new rId returned.
         """
-        return (
-            self._rels.get_or_add_ext_rel(reltype, target)
-            if is_external
-            else self._rels.get_or_add(reltype, target)
-        )
+        if is_external:
+            return self._rels.get_or_add_ext_rel(reltype, target)
+
+        rId = self._rels.get_or_add(reltype, target)
+        part_index = self._part_index
+        if part_index is not None:
+            part_index.add_rel(self, reltype, target)
+        return rId
 
     def related_part(self, rId):
         """Return related |Part| subtype identified by `rId`."""
@@ -49,6 +94,20 @@ class _RelatableMixin(object):
         """Return URL contained in target ref of relationship identified by `rId`."""
         return self._rels[rId].target_ref
 
+    def _drop_rel(self, rId):
+        """Remove relationship identified by `rId`, keeping the part index current."""
+        rel = self._rels.pop(rId)
+        part_index = self._part_index
+        if part_index is not None and not rel.is_external:
+            # --- the target part may no longer be reachable, which is only known after
+            # --- walking the relationship graph again.
+            part_index.invalidate()
+
+    @property
+    def _part_index(self):
+        """Optional |_PartIndex| of the package this object belongs to."""
+        return None
+
     @lazyproperty
     def _rels(self):
         """|Relationships| object containing relationships from this part to others."""
@@ -64,17 +123,83 @@ class OpcPackage(_RelatableMixin):
     to a package file or file-like object containing a package (.pptx file).
     """
 
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, lazy=False):
         self._pkg_file = pkg_file
+        self._lazy = lazy
+        self._package_reader = None
 
     @classmethod
-    def open(cls, pkg_file):
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        return cls(pkg_file)._load()
+    def open(cls, pkg_file, lazy=False, workers=None):
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `lazy` is True, the bytes of binary parts like images and media are left
+        in the package file until they are used, which keeps them out of memory. In
+        that case `pkg_file` must remain available and unchanged while the package is
+        in use, until the package is closed. When `workers` is greater than 1, parts are
+        read, inflated and parsed by that many threads in parallel. Otherwise the XML of
+        a part is parsed when it is first used.
+        """
+        return cls(pkg_file, lazy=lazy)._load(workers=workers)
+
+    def close(self):
+        """Release the package file held open by a lazily loaded package.
+
+        Each part blob still deferred is first read into memory, so the package remains
+        fully usable and can be saved after its package file is changed or removed.
+        Closing a package that holds no file open, or closing it again, only reads any
+        deferred blobs, like those a clone shares with the package it was cloned from.
+        """
+        for part in self.iter_parts():
+            part._load_deferred_blob()
+        package_reader, self._package_reader = self._package_reader, None
+        if package_reader is not None:
+            package_reader.close()
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Return a new |OpcPackage| instance restored from bytes `snapshot`.
+
+        `snapshot` is the bytes produced by :meth:`snapshot`. No zip archive is read and
+        no relationship XML is parsed. Each part is constructed by |PartFactory| from
+        its content type, and its XML is parsed when that part is first used. The
+        restored package holds its own copy of every blob.
+        Raises |ValueError| when `snapshot` was not produced by this version of the
+        snapshot format.
+        """
+        if not snapshot.startswith(_SNAPSHOT_FORMAT):
+            raise ValueError("not a package snapshot, or from an unsupported version")
+        pkg_rel_items, part_items = _SnapshotUnpickler(
+            io.BytesIO(snapshot[len(_SNAPSHOT_FORMAT) :])
+        ).load()
+
+        package = cls(None)
+        parts = [
+            PartFactory(PackURI(partname), content_type, package, blob)
+            for partname, content_type, blob, _ in part_items
+        ]
+        for part, part_item in zip(parts, part_items):
+            part._rels.load_from_snapshot(part_item[-1], parts)
+        package._rels.load_from_snapshot(pkg_rel_items, parts)
+        return package
+
+    def clone(self):
+        """Return a new package of this type containing a copy of each part of this one.
+
+        Parts of the copy share the blobs of these parts rather than copying them, so
+        the XML of a copied part is only parsed, from the shared bytes, when that part
+        is first used. Relationships are copied with their rIds. This package is not
+        changed and can be cloned again.
+        """
+        package = type(self)(self._pkg_file, lazy=self._lazy)
+        clones = {part: part.clone(package) for part in self.iter_parts()}
+        for part, clone in clones.items():
+            clone._rels.load_from_rels(part.rels, clones)
+        package._rels.load_from_rels(self._rels, clones)
+        return package
 
     def drop_rel(self, rId):
         """Remove relationship identified by `rId`."""
-        self._rels.pop(rId)
+        self._drop_rel(rId)
 
     def iter_parts(self):
         """Generate exactly one reference to each part in the package."""
@@ -115,6 +240,16 @@ class OpcPackage(_RelatableMixin):
         for rel in walk_rels(self._rels):
             yield rel
 
+    def iter_parts_with_reltypes(self, *reltypes):
+        """Generate each part in the package targeted by a relationship of `reltypes`.
+
+        Each part is generated once, even when it is the target of more than one such
+        relationship. Parts are found using the package part index rather than by
+        walking the relationship graph.
+        """
+        for part in self._part_index.parts_with_reltypes(reltypes):
+            yield part
+
     @property
     def main_document_part(self):
         """Return |Part| subtype serving as the main document part for this package.
@@ -134,30 +269,114 @@ class OpcPackage(_RelatableMixin):
         # --- of existing partnames that match tmpl. Speed up finding the next one
         # --- (maybe) by searching from the end downward rather than from 1 upward.
         prefix = tmpl[: (tmpl % 42).find("42")]
-        partnames = set(
-            p.partname for p in self.iter_parts() if p.partname.startswith(prefix)
-        )
-        for n in range(len(partnames) + 1, 0, -1):
+        part_index = self._part_index
+        for n in range(part_index.idx_count(prefix) + 1, 0, -1):
             candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
+            if candidate_partname not in part_index:
                 return PackURI(candidate_partname)
         raise Exception(  # pragma: no cover
             "ProgrammingError: ran out of candidate_partnames"
         )
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, compression=None, workers=None, prune=False):
         """Save this package to `pkg_file`.
 
-        `file` can be either a path to a file (a string) or a file-like object.
+        `file` can be either a path to a file (a string) or a file-like object. A path
+        to an existing directory saves the package in expanded form into that directory.
+        `compression` is an optional |CompressionPolicy| object determining how each
+        member of the zip package is compressed. When `workers` is greater than 1, parts
+        are serialized and compressed in parallel by that many threads. When `prune` is
+        True, unreferenced relationships are first removed from this package, such that
+        parts no longer reachable, like the image of a deleted picture, are not saved.
         """
-        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
+        if prune:
+            self._prune()
 
-    def _load(self):
+        parts = tuple(self.iter_parts())
+
+        # --- a lazily loaded package still reads blobs from its package file, so those
+        # --- must be read into memory before that file is overwritten.
+        if self._lazy and self._is_pkg_file(pkg_file):
+            self.close()
+
+        PackageWriter.write(
+            pkg_file, self._rels, parts, compression=compression, workers=workers
+        )
+
+    def snapshot(self):
+        """Return bytes containing the parts and relationships of this package.
+
+        The snapshot holds only plain data: the partname, content-type and blob of each
+        part, the blob of an XML part being its XML, along with the relationships
+        between parts.
+        It can be stored and restored any number of times with :meth:`from_snapshot`,
+        which is much faster than opening the package file again. Deferred blobs of a
+        lazily loaded package are read into the snapshot.
+        """
+        parts = tuple(self.iter_parts())
+        idxs = {part: idx for idx, part in enumerate(parts)}
+
+        def rel_items(rels):
+            return tuple(
+                (
+                    rel.rId,
+                    rel.reltype,
+                    rel.is_external,
+                    rel.target_ref if rel.is_external else idxs[rel.target_part],
+                )
+                for rel in rels
+            )
+
+        part_items = tuple(
+            (str(part.partname), part.content_type, part.blob, rel_items(part.rels))
+            for part in parts
+        )
+        return _SNAPSHOT_FORMAT + pickle.dumps(
+            (rel_items(self._rels), part_items), pickle.HIGHEST_PROTOCOL
+        )
+
+    def _is_pkg_file(self, pkg_file):
+        """True if `pkg_file` is the same file this package was loaded from."""
+        if pkg_file is self._pkg_file:
+            return True
+        if not (is_string(pkg_file) and is_string(self._pkg_file)):
+            return False
+        if not (os.path.exists(pkg_file) and os.path.exists(self._pkg_file)):
+            return False
+        return os.path.samefile(pkg_file, self._pkg_file)
+
+    def _prune(self):
+        """Remove each relationship of a prunable type its source part does not use.
+
+        A relationship is used when its rId appears in an attribute like `r:id` or
+        `r:embed` in the XML of its source part. Only relationship types that are always
+        used that way are pruned, others like slide-to-layout are implicit. Parts made
+        unreachable drop out of the package, along with their own relationships.
+        """
+        for part in tuple(self.iter_parts()):
+            if not isinstance(part, XmlPart):
+                continue
+            referenced_rIds = part.referenced_rIds
+            for rel in tuple(part.rels):
+                if rel.reltype not in _PRUNABLE_RELTYPES:
+                    continue
+                if rel.rId in referenced_rIds:
+                    continue
+                part._drop_rel(rel.rId)
+
+    def _load(self, workers=None):
         """Return the package after loading all parts and relationships."""
-        pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, self)
+        pkg_xml_rels, parts, self._package_reader = _PackageLoader.load(
+            self._pkg_file, self, lazy=self._lazy, workers=workers
+        )
         self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
         return self
 
+    @lazyproperty
+    def _part_index(self):
+        """|_PartIndex| of the parts in this package, used to find and name parts."""
+        return _PartIndex(self)
+
     @lazyproperty
     def _rels(self):
         """|Relationships| object containing relationships of this package."""
@@ -167,13 +386,15 @@ class OpcPackage(_RelatableMixin):
 class _PackageLoader(object):
     """Function-object that loads a package from disk (or other store)."""
 
-    def __init__(self, pkg_file, package):
+    def __init__(self, pkg_file, package, lazy=False, workers=None):
         self._pkg_file = pkg_file
         self._package = package
+        self._lazy = lazy
+        self._workers = workers
 
     @classmethod
-    def load(cls, pkg_file, package):
-        """Return (pkg_xml_rels, parts) pair resulting from loading `pkg_file`.
+    def load(cls, pkg_file, package, lazy=False, workers=None):
+        """Return (pkg_xml_rels, parts, package_reader) triple from loading `pkg_file`.
 
         The returned `parts` value is a {partname: part} mapping with each part in the
         package included and constructed complete with its relationships to other parts
@@ -182,17 +403,32 @@ class _PackageLoader(object):
         The returned `pkg_xml_rels` value is a `CT_Relationships` object containing the
         parsed package relationships. It is the caller's responsibility (the package
         object) to load those relationships into its |_Relationships| object.
+
+        When `lazy` is True, each part is constructed with a |DeferredBlob| rather than
+        its bytes, such that a part blob is only read from `pkg_file` when needed. The
+        returned `package_reader` is then the |PackageReader| those blobs are read from,
+        which the caller closes to release `pkg_file`. Otherwise it is |None| and
+        `pkg_file` is no longer in use once this method returns. When `workers` is
+        greater than 1, parts are constructed, including reading and inflating their
+        bytes and parsing their XML, by that many worker threads.
         """
-        return cls(pkg_file, package)._load()
+        return cls(pkg_file, package, lazy, workers)._load()
 
     def _load(self):
-        """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file."""
+        """Return (pkg_xml_rels, parts, package_reader) triple from loading pkg_file."""
         parts, xml_rels = self._parts, self._xml_rels
 
         for partname, part in parts.items():
             part.load_rels_from_xml(xml_rels[partname], parts)
 
-        return xml_rels["/"], parts
+        # --- a parallel load reads members on demand, so even when no blob is deferred
+        # --- the package reader can be holding the package file open.
+        package_reader = self._package_reader
+        if not self._lazy:
+            package_reader.close()
+            package_reader = None
+
+        return xml_rels["/"], parts, package_reader
 
     @lazyproperty
     def _content_types(self):
@@ -202,10 +438,19 @@ class _PackageLoader(object):
         """
         return _ContentTypeMap.from_xml(self._package_reader[CONTENT_TYPES_URI])
 
+    @property
+    def _is_parallel(self):
+        """True when parts are to be loaded by worker threads."""
+        return self._workers is not None and self._workers > 1
+
     @lazyproperty
     def _package_reader(self):
-        """|PackageReader| object providing access to package-items in pkg_file."""
-        return PackageReader(self._pkg_file)
+        """|PackageReader| object providing access to package-items in pkg_file.
+
+        Package items are read on demand when loading in parallel, so each worker
+        thread inflates the items it loads.
+        """
+        return PackageReader(self._pkg_file, lazy=self._lazy or self._is_parallel)
 
     @lazyproperty
     def _parts(self):
@@ -220,18 +465,42 @@ class _PackageLoader(object):
         package = self._package
         package_reader = self._package_reader
 
-        return {
-            partname: PartFactory(
-                partname,
-                content_types[partname],
-                package,
-                blob=package_reader[partname],
-            )
+        partnames = [
+            partname
             for partname in (p for p in self._xml_rels.keys() if p != "/")
             # --- invalid partnames can arise in some packages; ignore those rather
             # --- than raise an exception.
             if partname in package_reader
-        }
+        ]
+
+        def load_part(partname):
+            """Return part for `partname`, run on a worker thread in parallel mode.
+
+            A worker also parses the XML of an XML part, which lxml does while other
+            threads run, rather than leaving it to be parsed on first use.
+            """
+            part = PartFactory(
+                partname,
+                content_types[partname],
+                package,
+                blob=(
+                    package_reader.deferred_blob(partname)
+                    if self._lazy
+                    else package_reader[partname]
+                ),
+            )
+            if self._is_parallel and isinstance(part, XmlPart):
+                part.parse()
+            return part
+
+        if not self._is_parallel:
+            return {partname: load_part(partname) for partname in partnames}
+
+        pool = ThreadPool(self._workers)
+        try:
+            return dict(zip(partnames, pool.map(load_part, partnames)))
+        finally:
+            pool.terminate()
 
     @lazyproperty
     def _xml_rels(self):
@@ -281,11 +550,13 @@ class Part(_RelatableMixin):
     """
 
     def __init__(self, partname, content_type, package, blob=None):
-        # --- XmlPart subtypes, don't store a blob (the original XML) ---
+        # --- XmlPart subtypes store only the original XML blob until it is parsed ---
+        # --- `blob` is a |DeferredBlob| when the part is loaded lazily ---
         self._partname = partname
         self._content_type = content_type
         self._package = package
         self._blob = blob
+        self._content_types_key = None
 
     @classmethod
     def load(cls, partname, content_type, package, blob):
@@ -302,9 +573,11 @@ class Part(_RelatableMixin):
 
         May be text (XML generally) or binary. Intended to be overridden by subclasses.
         Default behavior is to return the blob initial loaded during `Package.open()`
-        operation.
+        operation. When that blob is deferred, it is read from the package file on each
+        access.
         """
-        return self._blob
+        blob = self._blob
+        return blob.load() if isinstance(blob, DeferredBlob) else blob
 
     @blob.setter
     def blob(self, bytes_):
@@ -320,6 +593,43 @@ class Part(_RelatableMixin):
         """Content-type (MIME-type) of this part."""
         return self._content_type
 
+    def clone(self, package):
+        """Return a new part of this type belonging to `package`, sharing this blob.
+
+        The new part has no relationships, those are the caller's to add.
+        """
+        return self.load(self._partname, self._content_type, package, self._blob)
+
+    @property
+    def content_types_key(self):
+        """(is_default, key) pair locating the content-type of this part.
+
+        When the content-type of this part is the default for its extension in
+        `[Content_Types].xml`, `is_default` is True and `key` is the lowercase
+        extension. Otherwise `is_default` is False and `key` is the partname, which
+        requires an Override element. Cached until the partname changes.
+        """
+        content_types_key = self._content_types_key
+        if content_types_key is None:
+            partname = self._partname
+            ext = partname.ext.lower()
+            content_types_key = self._content_types_key = (
+                (True, ext)
+                if (ext, self.content_type) in _default_content_types
+                else (False, partname)
+            )
+        return content_types_key
+
+    @property
+    def deferred_blob(self):
+        """|DeferredBlob| referring to the unchanged package bytes of this part.
+
+        |None| when the blob of this part is held in memory, which is always the case
+        for a part that was not loaded lazily or whose blob has since been assigned.
+        """
+        blob = self._blob
+        return blob if isinstance(blob, DeferredBlob) else None
+
     def drop_rel(self, rId):
         """Remove relationship identified by `rId` if its reference count is under 2.
 
@@ -327,7 +637,7 @@ class Part(_RelatableMixin):
         only XML parts can drop relationships.
         """
         if self._rel_ref_count(rId) < 2:
-            self._rels.pop(rId)
+            self._drop_rel(rId)
 
     def load_rels_from_xml(self, xml_rels, parts):
         """load _Relationships for this part from `xml_rels`.
@@ -356,7 +666,12 @@ class Part(_RelatableMixin):
                 "partname must be instance of PackURI, got '%s'"
                 % type(partname).__name__
             )
+        old_partname = self._partname
         self._partname = partname
+        self._content_types_key = None
+        part_index = self._part_index
+        if part_index is not None and partname != old_partname:
+            part_index.rename(self, old_partname)
 
     @lazyproperty
     def rels(self):
@@ -377,9 +692,23 @@ class Part(_RelatableMixin):
             file.seek(0)
         return file.read()
 
+    def _load_deferred_blob(self):
+        """Read a deferred blob into memory, so this part no longer needs the package.
+
+        A no-op if the blob of this part is not deferred.
+        """
+        if isinstance(self._blob, DeferredBlob):
+            self._blob = self._blob.load()
+
+    @property
+    def _part_index(self):
+        """Optional |_PartIndex| of the package this part belongs to."""
+        package = self._package
+        return None if package is None else package._part_index
+
     def _rel_ref_count(self, rId):
         """Return int count of references in this part's XML to `rId`."""
-        return len([r for r in self._element.xpath("//@r:id") if r == rId])
+        return int(_rId_ref_count(self._element, rId=rId))
 
     @lazyproperty
     def _rels(self):
@@ -392,22 +721,52 @@ class XmlPart(Part):
 
     Provides additional methods to the |Part| base class that take care of parsing and
     reserializing the XML payload and managing relationships to other parts.
+
+    A part loaded from a package keeps its XML as the original bytes until its element
+    is first accessed. A part that is never accessed is saved with those bytes as-is.
     """
 
-    def __init__(self, partname, content_type, package, element):
-        super(XmlPart, self).__init__(partname, content_type, package)
-        self._element = element
+    def __init__(self, partname, content_type, package, element, blob=None):
+        super(XmlPart, self).__init__(partname, content_type, package, blob)
+        self._parsed_element = element
 
     @classmethod
     def load(cls, partname, content_type, package, blob):
-        """Return instance of `cls` loaded with parsed XML from `blob`."""
-        return cls(partname, content_type, package, element=parse_xml(blob))
+        """Return instance of `cls` holding XML `blob`, to be parsed on first use."""
+        return cls(partname, content_type, package, element=None, blob=blob)
+
+    def parse(self):
+        """Parse the original XML of this part now rather than on first use.
+
+        Has no effect on a part that is already parsed.
+        """
+        self._element
 
     @property
     def blob(self):
-        """bytes XML serialization of this part."""
+        """bytes XML serialization of this part.
+
+        These are the original bytes loaded from the package when the element of this
+        part has never been accessed.
+        """
+        if self._blob is not None:
+            return super(XmlPart, self).blob
         return serialize_part_xml(self._element)
 
+    def clone(self, package):
+        """Return a new part of this type belonging to `package`, with this part's XML.
+
+        The new part shares the original bytes of this part when it has not been parsed
+        and parses them when first used.
+        """
+        blob = self._blob
+        return self.load(
+            self._partname,
+            self._content_type,
+            package,
+            serialize_part_xml(self._element) if blob is None else blob,
+        )
+
     @property
     def part(self):
         """This part.
@@ -418,6 +777,38 @@ class XmlPart(Part):
         """
         return self
 
+    @property
+    def referenced_rIds(self):
+        """Set of str rIds referenced in the XML of this part, like {"rId2", "rId7"}.
+
+        These are the values of all attributes in the relationships namespace, like
+        `r:id` and `r:embed`. A part that has not been parsed is scanned from its
+        original XML and is left unparsed.
+        """
+        element = (
+            self._parsed_element
+            if self._blob is None
+            else parse_xml(super(XmlPart, self).blob)
+        )
+        return set(_rId_refs(element))
+
+    @property
+    def _element(self):
+        """Root element of this part, parsed from the original XML on first access.
+
+        The original XML is discarded once parsed because the element may be changed
+        from then on.
+        """
+        if self._blob is not None:
+            self._parsed_element = parse_xml(super(XmlPart, self).blob)
+            self._blob = None
+        return self._parsed_element
+
+    @_element.setter
+    def _element(self, element):
+        self._parsed_element = element
+        self._blob = None
+
 
 class PartFactory(object):
     """Constructs a registered subtype of |Part|.
@@ -443,6 +834,17 @@ class PartFactory(object):
         return Part
 
 
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler for the plain data of a package snapshot.
+
+    A snapshot contains only tuples, strings, bytes, ints and bools, so any reference
+    to a class or function means the bytes are not a snapshot and none is imported.
+    """
+
+    def find_class(self, module, name):
+        raise ValueError("not a package snapshot, or from an unsupported version")
+
+
 class _ContentTypeMap(object):
     """Value type providing dict semantics for looking up content type by partname."""
 
@@ -481,6 +883,158 @@ class _ContentTypeMap(object):
         return cls(overrides, defaults)
 
 
+class _PartIndex(object):
+    """Index of the parts reachable from a package, kept current as the package changes.
+
+    Parts are indexed by partname and by the relationship types that target them, which
+    allows partnames to be allocated and parts of a type to be found without walking
+    the relationship graph each time. The index is built on first use. Relationships
+    added from then on extend it; removing an internal relationship discards it to be
+    rebuilt when next used, since only a new walk can tell which parts are orphaned.
+    """
+
+    def __init__(self, package):
+        self._package = package
+        self._is_built = False
+
+    def __contains__(self, partname):
+        """True when a part reachable from the package has `partname`."""
+        self._build()
+        return self._partnames[partname] > 0
+
+    def add_rel(self, source, reltype, target_part):
+        """Add the parts newly made reachable by a `reltype` rel from `source`."""
+        if not self._is_built:
+            return
+        if source is not self._package and source not in self._parts:
+            return
+        self._add_target(reltype, target_part)
+
+    def contains_part(self, part):
+        """True when `part` is reachable from the package."""
+        self._build()
+        return part in self._parts
+
+    def idx_count(self, prefix):
+        """Return the number of distinct idxs used by partnames starting with `prefix`.
+
+        `prefix` is the portion of an "array" partname before its idx, like
+        "/ppt/slides/slide".
+        """
+        self._build()
+        return len(self._idxs[prefix])
+
+    def invalidate(self):
+        """Discard the index, such that it is rebuilt when next used."""
+        self._is_built = False
+
+    def next_available_idx(self, prefix):
+        """Return the lowest int idx not used by a partname starting with `prefix`."""
+        self._build()
+        idxs = self._idxs[prefix]
+        idx = self._idx_floors.get(prefix, 1)
+        while idx in idxs:
+            idx += 1
+        self._idx_floors[prefix] = idx
+        return idx
+
+    def parts_with_reltypes(self, reltypes):
+        """Return list of distinct parts targeted by a relationship of `reltypes`."""
+        self._build()
+        parts, seen = [], set()
+        for reltype in reltypes:
+            for part in self._parts_by_reltype.get(reltype, ()):
+                if part in seen:
+                    continue
+                seen.add(part)
+                parts.append(part)
+        return parts
+
+    def rename(self, part, old_partname):
+        """Update the index after the partname of `part` changed from `old_partname`."""
+        if not self._is_built or part not in self._parts:
+            return
+        self._remove_partname(old_partname)
+        self._add_partname(part.partname)
+
+    def _add_partname(self, partname):
+        """Index `partname` of a part newly reachable from the package.
+
+        Partnames are counted because two parts can briefly share a partname while
+        parts are renamed one after another, like when slides are reordered.
+        """
+        self._partnames[partname] += 1
+        prefix, idx = self._split_partname(partname)
+        if idx is not None:
+            self._idxs[prefix][idx] += 1
+
+    def _add_target(self, reltype, part):
+        """Index `part` as a `reltype` target, along with parts reachable from it."""
+        pending = [(reltype, part)]
+        while pending:
+            reltype, part = pending.pop()
+            if (reltype, part) not in self._reltype_targets:
+                self._reltype_targets.add((reltype, part))
+                self._parts_by_reltype[reltype].append(part)
+            if part in self._parts:
+                continue
+            self._parts.add(part)
+            self._add_partname(part.partname)
+            pending.extend(
+                (rel.reltype, rel.target_part)
+                for rel in part.rels
+                if not rel.is_external
+            )
+
+    def _build(self):
+        """Index the parts of the package by walking its rels graph, unless current."""
+        if self._is_built:
+            return
+        self._parts = set()
+        self._partnames = collections.Counter()
+        self._parts_by_reltype = collections.defaultdict(list)
+        self._reltype_targets = set()
+        self._idxs = collections.defaultdict(collections.Counter)
+        self._idx_floors = {}
+        self._is_built = True
+        for rel in self._package._rels:
+            if rel.is_external:
+                continue
+            self._add_target(rel.reltype, rel.target_part)
+
+    def _remove_partname(self, partname):
+        """Remove `partname` from the index, making its idx available again.
+
+        The partname remains in the index while another part still has it.
+        """
+        partnames = self._partnames
+        partnames[partname] -= 1
+        if partnames[partname] < 1:
+            del partnames[partname]
+        prefix, idx = self._split_partname(partname)
+        if idx is None:
+            return
+        idxs = self._idxs[prefix]
+        idxs[idx] -= 1
+        if idxs[idx] < 1:
+            del idxs[idx]
+        if idx < self._idx_floors.get(prefix, 1):
+            self._idx_floors[prefix] = idx
+
+    @staticmethod
+    def _split_partname(partname):
+        """Return (prefix, idx) pair for `partname`, like ("/ppt/media/image", 3).
+
+        `idx` is |None| for a partname that does not end in an integer before its
+        extension, like "/ppt/presentation.xml".
+        """
+        root = posixpath.splitext(partname)[0]
+        prefix = root.rstrip("0123456789")
+        if prefix == root or prefix.endswith("/"):
+            return partname, None
+        return prefix, int(root[len(prefix) :])
+
+
 class _Relationships(Mapping):
     """Collection of |_Relationship| instances, largely having dict semantics.
 
@@ -557,8 +1111,44 @@ class _Relationships(Mapping):
                         continue
                 yield _Relationship.from_xml(base_uri, rel_elm, parts)
 
-        self._rels.clear()
-        self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._replace_rels(iter_valid_rels())
+
+    def load_from_rels(self, rels, parts):
+        """Replace any relationships in this collection with copies of those in `rels`.
+
+        `parts` is a dict mapping each target part in `rels` to the part targeted by its
+        copy. Copies keep the rId of their original.
+        """
+        base_uri = self._base_uri
+        self._replace_rels(
+            _Relationship(
+                base_uri,
+                rel.rId,
+                rel.reltype,
+                target_mode=RTM.EXTERNAL if rel.is_external else RTM.INTERNAL,
+                target=rel.target_ref if rel.is_external else parts[rel.target_part],
+            )
+            for rel in rels
+        )
+
+    def load_from_snapshot(self, rel_items, parts):
+        """Replace any relationships in this collection with those in `rel_items`.
+
+        `rel_items` is a sequence of (rId, reltype, is_external, target) tuples. The
+        `target` of an external relationship is its target ref. That of an internal
+        relationship is the key in `parts` of its target part.
+        """
+        base_uri = self._base_uri
+        self._replace_rels(
+            _Relationship(
+                base_uri,
+                rId,
+                reltype,
+                target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
+                target=target if is_external else parts[target],
+            )
+            for rId, reltype, is_external, target in rel_items
+        )
 
     def part_with_reltype(self, reltype):
         """Return target part of relationship with matching `reltype`.
@@ -583,6 +1173,8 @@ class _Relationships(Mapping):
 
         The caller is responsible for ensuring it is no longer required.
         """
+        rel = self._rels[rId]
+        self._unindex_rel(rel)
         return self._rels.pop(rId)
 
     @property
@@ -592,21 +1184,23 @@ class _Relationships(Mapping):
         This value is suitable for storage as a .rels file in an OPC package. Includes
         a `<?xml` header with encoding as UTF-8.
         """
-        rels_elm = CT_Relationships.new()
-        for rel in self:
-            rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
-        return rels_elm.xml
+        return serialize_rels_xml(
+            (rel.rId, rel.reltype, rel.target_ref, rel.is_external) for rel in self
+        )
 
     def _add_relationship(self, reltype, target, is_external=False):
         """Return str rId of |_Relationship| newly added to spec."""
         rId = self._next_rId
-        self._rels[rId] = _Relationship(
+        rel = _Relationship(
             self._base_uri,
             rId,
             reltype,
             target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
             target=target,
         )
+        # --- index before adding, the indexes are built from `._rels` on first use ---
+        self._index_rel(rel)
+        self._rels[rId] = rel
         return rId
 
     def _get_matching(self, reltype, target, is_external=False):
@@ -614,15 +1208,26 @@ class _Relationships(Mapping):
 
         Returns `None` on no matching relationship
         """
-        for rel in self._rels_by_reltype[reltype]:
-            if rel.is_external != is_external:
-                continue
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                continue
-            return rel.rId
+        return self._rIds_by_target.get((reltype, target, is_external))
 
-        return None
+    def _index_rel(self, rel):
+        """Add `rel` to the reltype and target indexes of this collection."""
+        self._rels_by_reltype[rel.reltype].append(rel)
+        self._rIds_by_target.setdefault(self._target_key(rel), rel.rId)
+
+    @lazyproperty
+    def _rIds_by_target(self):
+        """dict {(reltype, target, is_external): rId} for relationships in collection.
+
+        `target` is the target part of an internal relationship and the target ref of an
+        external one. Where more than one relationship matches, the first is indexed.
+        Kept current as relationships are added and removed.
+        """
+        rIds_by_target = {}
+        for rels in self._rels_by_reltype.values():
+            for rel in rels:
+                rIds_by_target.setdefault(self._target_key(rel), rel.rId)
+        return rIds_by_target
 
     @property
     def _next_rId(self):
@@ -644,14 +1249,47 @@ class _Relationships(Mapping):
         """dict {rId: _Relationship} containing relationships of this collection."""
         return dict()
 
-    @property
+    @lazyproperty
     def _rels_by_reltype(self):
-        """defaultdict {reltype: [rels]} for all relationships in collection."""
+        """defaultdict {reltype: [rels]} for all relationships in collection.
+
+        Kept current as relationships are added and removed.
+        """
         D = collections.defaultdict(list)
         for rel in self:
             D[rel.reltype].append(rel)
         return D
 
+    def _replace_rels(self, rels):
+        """Replace any relationships in this collection with the `rels` sequence."""
+        self._rels.clear()
+        self._rels_by_reltype.clear()
+        self._rIds_by_target.clear()
+        for rel in rels:
+            self._index_rel(rel)
+            self._rels[rel.rId] = rel
+
+    @staticmethod
+    def _target_key(rel):
+        """Return (reltype, target, is_external) key of `rel` in `._rIds_by_target`."""
+        is_external = rel.is_external
+        target = rel.target_ref if is_external else rel.target_part
+        return (rel.reltype, target, is_external)
+
+    def _unindex_rel(self, rel):
+        """Remove `rel` from the reltype and target indexes of this collection."""
+        rels_of_reltype = self._rels_by_reltype[rel.reltype]
+        rels_of_reltype.remove(rel)
+        key = self._target_key(rel)
+        if self._rIds_by_target.get(key) != rel.rId:
+            return
+        del self._rIds_by_target[key]
+        # --- a duplicate relationship to the same target takes its place, if any ---
+        for other in rels_of_reltype:
+            if self._target_key(other) == key:
+                self._rIds_by_target[key] = other.rId
+                break
+
 
 class _Relationship(object):
     """Value object describing link from a part or package to another part."""
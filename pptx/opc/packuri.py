@@ -5,12 +5,15 @@
 import posixpath
 import re
 
+from pptx.util import lazyproperty
+
 
 class PackURI(str):
     """Proxy for a pack URI (partname).
 
     Provides utility properties the baseURI and the filename slice. Behaves as |str|
-    otherwise.
+    otherwise. Each derived property is computed on first access and cached, so a
+    partname shared by a part and its relationships only pays for that once.
     """
 
     _filename_re = re.compile("([a-zA-Z]+)([0-9][0-9]*)?")
@@ -26,11 +29,20 @@ class PackURI(str):
         Return a |PackURI| instance containing the absolute pack URI formed by
         translating *relative_ref* onto *baseURI*.
         """
+        # --- fast path for the common forms, like "../slideLayouts/slideLayout1.xml"
+        # --- and "slides/slide1.xml", that need no normalization other than (at most)
+        # --- one leading step up from baseURI.
+        base, ref = baseURI.rstrip("/"), relative_ref
+        if ref.startswith("../"):
+            base, ref = base.rpartition("/")[0], ref[3:]
+        if "//" not in "/%s/" % ref and "./" not in "%s/" % ref:
+            return PackURI("%s/%s" % (base, ref))
+
         joined_uri = posixpath.join(baseURI, relative_ref)
         abs_uri = posixpath.abspath(joined_uri)
         return PackURI(abs_uri)
 
-    @property
+    @lazyproperty
     def baseURI(self):
         """
         The base URI of this pack URI, the directory portion, roughly
@@ -39,7 +51,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[0]
 
-    @property
+    @lazyproperty
     def ext(self):
         """
         The extension portion of this pack URI, e.g. ``'xml'`` for
@@ -49,7 +61,7 @@ class PackURI(str):
         raw_ext = posixpath.splitext(self)[1]
         return raw_ext[1:] if raw_ext.startswith(".") else raw_ext
 
-    @property
+    @lazyproperty
     def filename(self):
         """
         The "filename" portion of this pack URI, e.g. ``'slide1.xml'`` for
@@ -58,7 +70,7 @@ class PackURI(str):
         """
         return posixpath.split(self)[1]
 
-    @property
+    @lazyproperty
     def idx(self):
         """Optional int partname index.
 
@@ -77,7 +89,7 @@ class PackURI(str):
             return int(match.group(2))
         return None
 
-    @property
+    @lazyproperty
     def membername(self):
         """
         The pack URI with the leading slash stripped off, the form used as
@@ -100,7 +112,7 @@ class PackURI(str):
             relpath = posixpath.relpath(self, baseURI)
         return relpath
 
-    @property
+    @lazyproperty
     def rels_uri(self):
         """
         The pack URI of the .rels part corresponding to the current pack URI.
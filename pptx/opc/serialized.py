@@ -2,19 +2,35 @@
 
 """API for reading/writing serialized Open Packaging Convention (OPC) package."""
 
+import fnmatch
 import os
 import posixpath
+import sys
+import threading
+import time
 import zipfile
+import zlib
 
-from pptx.compat import Container, is_string
+from multiprocessing.pool import ThreadPool
+
+from pptx.compat import BytesIO, Container, is_string
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.opc.oxml import CT_Types, serialize_part_xml
+from pptx.opc.oxml import serialize_types_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
-from pptx.opc.shared import CaseInsensitiveDict
-from pptx.opc.spec import default_content_types
 from pptx.util import lazyproperty
 
+# --- general-purpose flag bit 3, set when sizes and CRC follow member data ---
+_DATA_DESCRIPTOR_FLAG = 0x08
+_RAW_CHUNK_SIZE = 1024 * 1024
+
+# --- `ZipFile.open()` can write a member a chunk at a time from Python 3.6 ---
+_CAN_STREAM_MEMBERS = sys.version_info >= (3, 6)
+
+# --- whether zip members can be copied without recompressing them in this Python,
+# --- None until determined by `_can_copy_raw()`.
+_raw_copy_works = None
+
 
 class PackageReader(Container):
     """Provides access to package-parts of an OPC package with dict semantics.
@@ -23,8 +39,9 @@ class PackageReader(Container):
     structure, perhaps by unzipping a .pptx file.
     """
 
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, lazy=False):
         self._pkg_file = pkg_file
+        self._lazy = lazy
 
     def __contains__(self, pack_uri):
         """Return True when part identified by `pack_uri` is present in package."""
@@ -34,6 +51,21 @@ class PackageReader(Container):
         """Return bytes for part corresponding to `pack_uri`."""
         return self._blob_reader[pack_uri]
 
+    def close(self):
+        """Release the package file when this reader holds it open.
+
+        Deferred blobs produced by this reader can no longer be loaded once it is
+        closed. Closing more than once has no further effect.
+        """
+        self._blob_reader.close()
+
+    def deferred_blob(self, pack_uri):
+        """Return |DeferredBlob| referring to bytes of part identified by `pack_uri`.
+
+        The bytes are not read from the package until the deferred blob is loaded.
+        """
+        return DeferredBlob(self._blob_reader, pack_uri)
+
     def rels_xml_for(self, partname):
         """Return optional rels item XML for `partname`.
 
@@ -46,7 +78,7 @@ class PackageReader(Container):
     @lazyproperty
     def _blob_reader(self):
         """|_PhysPkgReader| subtype providing read access to the package file."""
-        return _PhysPkgReader.factory(self._pkg_file)
+        return _PhysPkgReader.factory(self._pkg_file, lazy=self._lazy)
 
 
 class PackageWriter(object):
@@ -55,29 +87,35 @@ class PackageWriter(object):
     `pkg_file` can be either a path to a zip file (a string) or a file-like object.
     `pkg_rels` is the |_Relationships| object containing relationships for the package.
     `parts` is a sequence of |Part| subtype instance to be written to the package.
+    `compression` is an optional |CompressionPolicy| object determining how each member
+    is compressed. When `workers` is greater than 1, parts are serialized and compressed
+    by that many worker threads.
 
     Its single API classmethod is :meth:`write`. This class is not intended to be
     instantiated.
     """
 
-    def __init__(self, pkg_file, pkg_rels, parts):
+    def __init__(self, pkg_file, pkg_rels, parts, compression=None, workers=None):
         self._pkg_file = pkg_file
         self._pkg_rels = pkg_rels
         self._parts = parts
+        self._compression = compression
+        self._workers = workers
 
     @classmethod
-    def write(cls, pkg_file, pkg_rels, parts):
+    def write(cls, pkg_file, pkg_rels, parts, compression=None, workers=None):
         """Write a physical package (.pptx file) to `pkg_file`.
 
         The serialized package contains `pkg_rels` and `parts`, a content-types stream
         based on the content type of each part, and a .rels file for each part that has
         relationships.
         """
-        cls(pkg_file, pkg_rels, parts)._write()
+        cls(pkg_file, pkg_rels, parts, compression, workers)._write()
 
     def _write(self):
         """Write physical package (.pptx file)."""
-        with _PhysPkgWriter.factory(self._pkg_file) as phys_writer:
+        phys_writer = _PhysPkgWriter.factory(self._pkg_file, self._compression)
+        with phys_writer:
             self._write_content_types_stream(phys_writer)
             self._write_pkg_rels(phys_writer)
             self._write_parts(phys_writer)
@@ -89,23 +127,138 @@ class PackageWriter(object):
         in the package.
         """
         phys_writer.write(
-            CONTENT_TYPES_URI,
-            serialize_part_xml(_ContentTypesItem.xml_for(self._parts)),
+            CONTENT_TYPES_URI, _ContentTypesItem.xml_for(self._parts), CT.XML
         )
 
     def _write_parts(self, phys_writer):
         """Write blob of each part in `parts` to the package.
 
+        A part still holding a deferred blob has not changed since it was loaded and is
+        copied from its source package as-is when the physical writer can manage that.
         A rels item for each part is also written when the part has relationships.
         """
+        if self._workers is not None and self._workers > 1:
+            return self._write_parts_in_parallel(phys_writer)
+
         for part in self._parts:
-            phys_writer.write(part.partname, part.blob)
+            partname, content_type = part.partname, part.content_type
+            deferred_blob = part.deferred_blob
+            if deferred_blob is None:
+                phys_writer.write(partname, part.blob, content_type)
+            else:
+                phys_writer.write_deferred(partname, deferred_blob, content_type)
             if part._rels:
-                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+                phys_writer.write(
+                    partname.rels_uri, part.rels.xml, CT.OPC_RELATIONSHIPS
+                )
+
+    def _write_parts_in_parallel(self, phys_writer):
+        """Write each part in `parts` and its rels item using a pool of worker threads.
+
+        The workers serialize and compress each part and its rels item. The finished
+        members are written to the package in `parts` order on this thread, so the
+        resulting package is the same as one written sequentially.
+        """
+
+        def prepare(part):
+            """Return (part, part_member, rels_member) triple, run on a worker thread.
+
+            `part_member` is |None| for a part holding a deferred blob, which is written
+            on the main thread. `rels_member` is |None| when the part has no rels.
+            """
+            partname = part.partname
+            part_member = (
+                None
+                if part.deferred_blob is not None
+                else phys_writer.prepare(partname, part.blob, part.content_type)
+            )
+            rels_member = (
+                phys_writer.prepare(
+                    partname.rels_uri, part.rels.xml, CT.OPC_RELATIONSHIPS
+                )
+                if part._rels
+                else None
+            )
+            return part, part_member, rels_member
+
+        pool = ThreadPool(self._workers)
+        try:
+            for part, part_member, rels_member in pool.imap(prepare, self._parts):
+                if part_member is None:
+                    phys_writer.write_deferred(
+                        part.partname, part.deferred_blob, part.content_type
+                    )
+                else:
+                    phys_writer.write_prepared(part_member)
+                if rels_member is not None:
+                    phys_writer.write_prepared(rels_member)
+        finally:
+            pool.terminate()
 
     def _write_pkg_rels(self, phys_writer):
         """Write the XML rels item for *pkg_rels* ('/_rels/.rels') to the package."""
-        phys_writer.write(PACKAGE_URI.rels_uri, self._pkg_rels.xml)
+        phys_writer.write(
+            PACKAGE_URI.rels_uri, self._pkg_rels.xml, CT.OPC_RELATIONSHIPS
+        )
+
+
+class CompressionPolicy(object):
+    """Determines how each member of a zip package is compressed when it is saved.
+
+    Members having a content-type matching one of the `stored` patterns are written
+    without compression (`ZIP_STORED`). A pattern is a content-type like "image/png" or
+    a wildcard form like "video/*". By default these are the content-types of media
+    and embedded packages that are already compressed, where deflating again costs time
+    for little or no reduction in size.
+
+    All other members, including all XML, are deflated at `level`, from 1 (fastest) to
+    9 (smallest). The zlib default level is used when `level` is |None|. The bytes of a
+    member written at a level are read into memory in full. |ValueError| is raised when
+    `level` is given in a version of Python that cannot compress a member at a level.
+
+    An instance can be passed as the `compression` argument of
+    :meth:`.Presentation.save`.
+    """
+
+    PRECOMPRESSED_CONTENT_TYPES = (
+        CT.GIF,
+        CT.JPEG,
+        CT.MS_PHOTO,
+        CT.PNG,
+        CT.PML_PRESENTATION,
+        CT.SML_SHEET,
+        CT.WML_DOCUMENT,
+        CT.X_FONTDATA,
+        "audio/*",
+        "video/*",
+    )
+
+    def __init__(self, stored=PRECOMPRESSED_CONTENT_TYPES, level=None):
+        if level is not None and not _can_compress_at_level():
+            raise ValueError(
+                "compression level is not supported in this version of Python"
+            )
+        self._stored = tuple(stored)
+        self._level = level
+        self._compression_by_content_type = {}
+
+    def compression_for(self, content_type):
+        """Return (compress_type, compresslevel) pair for member having `content_type`.
+
+        `compress_type` is one of `zipfile.ZIP_STORED` or `zipfile.ZIP_DEFLATED`.
+        `compresslevel` is an int or |None| and is always |None| for a stored member.
+        """
+        compression = self._compression_by_content_type.get(content_type)
+        if compression is None:
+            is_stored = any(
+                fnmatch.fnmatchcase(content_type, pattern) for pattern in self._stored
+            )
+            compression = self._compression_by_content_type[content_type] = (
+                (zipfile.ZIP_STORED, None)
+                if is_stored
+                else (zipfile.ZIP_DEFLATED, self._level)
+            )
+        return compression
 
 
 class _PhysPkgReader(Container):
@@ -117,20 +270,53 @@ class _PhysPkgReader(Container):
             "`%s` must implement `.__contains__()`" % type(self).__name__
         )
 
+    def close(self):
+        """Release any file held open by this reader.
+
+        This default implementation holds no file open between reads and does nothing.
+        """
+        pass
+
+    def member_chunks(self, pack_uri):
+        """Return (size, chunks) pair for the bytes of member `pack_uri`.
+
+        `size` is the int count of bytes in the member and `chunks` is an iterator of
+        those bytes in order. This default implementation reads the whole member as a
+        single chunk, subclasses that can read a member incrementally override it.
+        """
+        blob = self[pack_uri]
+        return len(blob), iter((blob,))
+
+    def raw_member(self, pack_uri):
+        """Return optional (zinfo, chunks) pair for stored form of member `pack_uri`.
+
+        Only a reader holding a zip archive open can provide this, other readers return
+        |None|. `zinfo` is the `ZipInfo` object for the member and `chunks` is an
+        iterator of the still-compressed bytes of that member.
+        """
+        return None
+
     @classmethod
-    def factory(cls, pkg_file):
-        """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`."""
+    def factory(cls, pkg_file, lazy=False):
+        """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`.
+
+        When `lazy` is True, a zip package is read member-by-member on demand rather
+        than being fully inflated on first access. A directory package is always read
+        on demand.
+        """
+        ZipPkgReaderCls = _LazyZipPkgReader if lazy else _ZipPkgReader
+
         # --- for pkg_file other than str, assume it's a stream and pass it to Zip
         # --- reader to sort out
         if not is_string(pkg_file):
-            return _ZipPkgReader(pkg_file)
+            return ZipPkgReaderCls(pkg_file)
 
         # --- otherwise we treat `pkg_file` as a path ---
         if os.path.isdir(pkg_file):
             return _DirPkgReader(pkg_file)
 
         if zipfile.is_zipfile(pkg_file):
-            return _ZipPkgReader(pkg_file)
+            return ZipPkgReaderCls(pkg_file)
 
         raise PackageNotFoundError("Package not found at '%s'" % pkg_file)
 
@@ -157,6 +343,16 @@ class _DirPkgReader(_PhysPkgReader):
         except IOError:
             raise KeyError("no member '%s' in package" % pack_uri)
 
+    def member_chunks(self, pack_uri):
+        """Return (size, chunks) pair for the file corresponding to `pack_uri`.
+
+        The file is read a chunk at a time as `chunks` is consumed.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        if not os.path.isfile(path):
+            raise KeyError("no member '%s' in package" % pack_uri)
+        return os.path.getsize(path), _iter_file_chunks(path)
+
 
 class _ZipPkgReader(_PhysPkgReader):
     """Implements |PhysPkgReader| interface for a zip-file OPC package."""
@@ -184,24 +380,276 @@ class _ZipPkgReader(_PhysPkgReader):
             return {PackURI("/%s" % name): z.read(name) for name in z.namelist()}
 
 
+class _LazyZipPkgReader(_ZipPkgReader):
+    """Implements |PhysPkgReader| interface for a zip-file package read on demand.
+
+    The zip archive is held open for the lifetime of this reader and each member is
+    read and decompressed only when its bytes are requested. The package file must not
+    be changed or closed while this reader is in use, until :meth:`close` is called.
+
+    Members can be read from more than one thread at a time, each member is inflated
+    on the thread reading it.
+    """
+
+    def __init__(self, pkg_file):
+        super(_LazyZipPkgReader, self).__init__(pkg_file)
+        self._lock = threading.Lock()
+
+    def __contains__(self, pack_uri):
+        """Return True when part identified by `pack_uri` is present in zip archive."""
+        return pack_uri in self._membernames
+
+    def __getitem__(self, pack_uri):
+        """Return bytes for part corresponding to `pack_uri`, read from the archive.
+
+        Raises |KeyError| if no matching member is present in zip archive.
+        """
+        if pack_uri not in self._membernames:
+            raise KeyError("no member '%s' in package" % pack_uri)
+
+        # --- opening and closing a member updates shared state of the zip file, but
+        # --- reading and inflating its bytes can safely proceed concurrently.
+        with self._lock:
+            member = self._zipf.open(pack_uri[1:])
+        try:
+            return member.read()
+        finally:
+            with self._lock:
+                member.close()
+
+    def close(self):
+        """Close the zip archive held open by this reader.
+
+        A stream passed as the package file is not itself closed.
+        """
+        with self._lock:
+            self._zipf.close()
+
+    def member_chunks(self, pack_uri):
+        """Return (size, chunks) pair for member `pack_uri`, inflated as it is read.
+
+        Only one chunk of the member is held in memory at a time.
+        """
+        zinfo = self._zipf.getinfo(pack_uri[1:])
+        return zinfo.file_size, self._iter_chunks(zinfo)
+
+    def raw_member(self, pack_uri):
+        """Return (zinfo, chunks) pair for the compressed form of member `pack_uri`.
+
+        `chunks` generates the bytes of the member exactly as stored in the archive,
+        without decompressing them. |None| when stored bytes cannot be copied reliably
+        in this version of Python.
+        """
+        if not _can_copy_raw():
+            return None
+        zinfo = self._zipf.getinfo(pack_uri[1:])
+        return zinfo, self._iter_raw_chunks(zinfo)
+
+    def _iter_chunks(self, zinfo):
+        """Generate the decompressed bytes of the member described by `zinfo`."""
+        with self._lock:
+            member = self._zipf.open(zinfo)
+        try:
+            while True:
+                chunk = member.read(_RAW_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            with self._lock:
+                member.close()
+
+    def _iter_raw_chunks(self, zinfo):
+        """Generate the compressed bytes of the member described by `zinfo`."""
+        with self._zipf.open(zinfo) as member:
+            # --- the underlying stream of an opened member is positioned at the start
+            # --- of its compressed bytes. Reading that directly bypasses inflation.
+            stream = member._fileobj
+            remaining = zinfo.compress_size
+            while remaining > 0:
+                chunk = stream.read(min(remaining, _RAW_CHUNK_SIZE))
+                if not chunk:
+                    raise zipfile.BadZipfile(
+                        "unexpected end of member '%s'" % zinfo.filename
+                    )
+                remaining -= len(chunk)
+                yield chunk
+
+    @lazyproperty
+    def _membernames(self):
+        """set of str partname for each member of the zip archive, like "/ppt/a.xml".
+
+        These are the same as the pack-URI for each member.
+        """
+        return set("/%s" % name for name in self._zipf.namelist())
+
+    @lazyproperty
+    def _zipf(self):
+        """`ZipFile` instance held open for reading."""
+        return zipfile.ZipFile(self._pkg_file, "r")
+
+
+class DeferredBlob(object):
+    """Reference to the bytes of a package member, read from the package only on use.
+
+    A part loaded from a lazily-read package holds one of these in place of its blob so
+    the member is not inflated into memory unless that blob is actually needed.
+    """
+
+    def __init__(self, phys_reader, pack_uri):
+        self._phys_reader = phys_reader
+        self._pack_uri = pack_uri
+
+    def load(self):
+        """Return bytes of the referenced package member, read afresh on each call."""
+        return self._phys_reader[self._pack_uri]
+
+    def member_chunks(self):
+        """Return (size, chunks) pair for the referenced bytes, read as consumed.
+
+        `size` is the int count of bytes and `chunks` an iterator of them in order, such
+        that the bytes can be copied without all being held in memory at once.
+        """
+        return self._phys_reader.member_chunks(self._pack_uri)
+
+    def raw_member(self):
+        """Return optional (zinfo, chunks) pair for stored form of referenced member.
+
+        |None| when the package this blob comes from is not a zip archive held open for
+        reading.
+        """
+        return self._phys_reader.raw_member(self._pack_uri)
+
+
+class FileBlob(DeferredBlob):
+    """Reference to the bytes of the file at `path`, read from that file only on use.
+
+    A part holding one of these is written to a package by copying the file a chunk at
+    a time, so its bytes are never all in memory at once, which matters for a large
+    video. The file must remain in place and unchanged while the part is in use.
+    """
+
+    def __init__(self, path):
+        self._path = path
+
+    def load(self):
+        """Return bytes of the referenced file, read fresh from the filesystem."""
+        with open(self._path, "rb") as f:
+            return f.read()
+
+    def member_chunks(self):
+        """Return (size, chunks) pair for the referenced file, read as consumed."""
+        return os.path.getsize(self._path), _iter_file_chunks(self._path)
+
+    def raw_member(self):
+        """Always |None|, a file has no stored (compressed) form."""
+        return None
+
+
 class _PhysPkgWriter(object):
     """Base class for physical package writer objects."""
 
+    def prepare(self, pack_uri, blob, content_type=None):
+        """Return a member object ready to be written by :meth:`write_prepared`.
+
+        Subclasses can override this to do work like compression in advance. It must be
+        safe to call from any thread and must not change the physical package.
+        """
+        return pack_uri, blob, content_type
+
+    def write_deferred(self, pack_uri, deferred_blob, content_type=None):
+        """Write bytes referred to by `deferred_blob` as member `pack_uri`.
+
+        Subclasses can override this to transfer the bytes without fully loading them.
+        """
+        self.write(pack_uri, deferred_blob.load(), content_type)
+
+    def write_prepared(self, member):
+        """Write `member`, as produced by :meth:`prepare`, to the package."""
+        pack_uri, blob, content_type = member
+        self.write(pack_uri, blob, content_type)
+
     @classmethod
-    def factory(cls, pkg_file):
+    def factory(cls, pkg_file, compression=None):
         """Return |_PhysPkgWriter| subtype instance appropriage for `pkg_file`.
 
-        Currently the only subtype is `_ZipPkgWriter`, but a `_DirPkgWriter` could be
-        implemented or even a `_StreamPkgWriter`.
+        A `_DirPkgWriter` is returned when `pkg_file` is the path of an existing
+        directory and a `_StreamPkgWriter` for a stream that cannot seek, like a socket
+        or HTTP response. A `_ZipPkgWriter` is returned otherwise. `compression` is an
+        optional |CompressionPolicy| object, it does not apply to a directory.
         """
-        return _ZipPkgWriter(pkg_file)
+        if is_string(pkg_file) and os.path.isdir(pkg_file):
+            return _DirPkgWriter(pkg_file)
+
+        if not is_string(pkg_file):
+            seekable = getattr(pkg_file, "seekable", None)
+            is_seekable = (
+                seekable() if callable(seekable) else hasattr(pkg_file, "seek")
+            )
+            if not is_seekable:
+                return _StreamPkgWriter(pkg_file, compression)
+
+        return _ZipPkgWriter(pkg_file, compression)
+
+
+class _DirPkgWriter(_PhysPkgWriter):
+    """Implements |PhysPkgWriter| interface for a package expanded into a directory.
+
+    Each package item is written as a plain file at the path corresponding to its
+    membername below the directory at `path`, the same layout produced by unzipping a
+    .pptx file. Subdirectories are created as required. Files already present in the
+    directory are overwritten when they correspond to a package item but are otherwise
+    left in place.
+    """
+
+    def __init__(self, path):
+        self._path = os.path.abspath(path)
+
+    def __enter__(self):
+        """Enable use as a context-manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Nothing to clean up on exit, each file is closed as soon as it is written."""
+        pass
+
+    def write(self, pack_uri, blob, content_type=None):
+        """Write `blob` to the file in package directory corresponding to `pack_uri`."""
+        with self._open(pack_uri) as f:
+            f.write(blob)
+
+    def write_deferred(self, pack_uri, deferred_blob, content_type=None):
+        """Write bytes referred to by `deferred_blob` as file for `pack_uri`.
+
+        The bytes are copied a chunk at a time.
+        """
+        _, chunks = deferred_blob.member_chunks()
+        with self._open(pack_uri) as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    def _open(self, pack_uri):
+        """Return file object open for writing at path corresponding to `pack_uri`.
+
+        Any directories on that path that do not yet exist are created.
+        """
+        path = os.path.join(self._path, *pack_uri.membername.split("/"))
+        dirpath = os.path.dirname(path)
+        if not os.path.isdir(dirpath):
+            os.makedirs(dirpath)
+        return open(path, "wb")
 
 
 class _ZipPkgWriter(_PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package.
 
-    def __init__(self, pkg_file):
+    Each member is deflated at the default level unless a |CompressionPolicy| object is
+    provided as `compression`.
+    """
+
+    def __init__(self, pkg_file, compression=None):
         self._pkg_file = pkg_file
+        self._compression = compression
 
     def __enter__(self):
         """Enable use as a context-manager. Opening zip for writing happens here."""
@@ -215,9 +663,142 @@ class _ZipPkgWriter(_PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
-        """Write `blob` to zip package with membername corresponding to `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+    def prepare(self, pack_uri, blob, content_type=None):
+        """Return (pack_uri, zinfo, data) triple for `blob`, compressed ready to write.
+
+        `zinfo` is a `ZipInfo` object carrying the CRC, sizes and compression method of
+        the member and `data` is its compressed bytes. The archive is not touched, so
+        this can safely run on a worker thread. The blob is left for :meth:`write` to
+        compress when compressed bytes cannot be copied reliably in this version of
+        Python.
+        """
+        if not _can_copy_raw():
+            return super(_ZipPkgWriter, self).prepare(pack_uri, blob, content_type)
+
+        compress_type, compresslevel = (
+            (zipfile.ZIP_DEFLATED, None)
+            if self._compression is None
+            else self._compression.compression_for(content_type)
+        )
+        zinfo = zipfile.ZipInfo(pack_uri.membername, time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        zinfo.external_attr = 0o600 << 16
+        zinfo.CRC = zlib.crc32(blob) & 0xFFFFFFFF
+        zinfo.file_size = len(blob)
+
+        if compress_type == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel,
+                zlib.DEFLATED,
+                -15,
+            )
+            data = compressor.compress(blob) + compressor.flush()
+        else:
+            data = blob
+
+        zinfo.compress_size = len(data)
+        return pack_uri, zinfo, data
+
+    def write(self, pack_uri, blob, content_type=None):
+        """Write `blob` to zip package with membername corresponding to `pack_uri`.
+
+        `content_type` determines the compression of the member when this writer has a
+        compression policy. A member deflated at a level set by the policy is compressed
+        with zlib, as :meth:`prepare` does, where that is supported.
+        """
+        if self._compression is None:
+            return self._zipf.writestr(pack_uri.membername, blob)
+
+        compress_type, compresslevel = self._compression.compression_for(content_type)
+        if compresslevel is None:
+            return self._zipf.writestr(pack_uri.membername, blob, compress_type)
+        if _can_copy_raw():
+            return self.write_prepared(self.prepare(pack_uri, blob, content_type))
+        self._zipf.writestr(pack_uri.membername, blob, compress_type, compresslevel)
+
+    def write_deferred(self, pack_uri, deferred_blob, content_type=None):
+        """Write bytes referred to by `deferred_blob` as member `pack_uri`.
+
+        When the deferred blob comes from a zip archive its stored bytes are copied
+        directly, without inflating and deflating them again. This is skipped when the
+        compression policy calls for a different compression method than the member
+        has in its source archive. Otherwise the bytes are read and compressed a chunk
+        at a time, so they are never all held in memory at once.
+        """
+        raw_member = deferred_blob.raw_member()
+        if raw_member is not None:
+            src_zinfo, chunks = raw_member
+            if (
+                self._compression is None
+                or self._compression.compression_for(content_type)[0]
+                == src_zinfo.compress_type
+            ):
+                return self._write_raw(pack_uri, src_zinfo, chunks)
+
+        self._write_chunks(pack_uri, deferred_blob, content_type)
+
+    def write_prepared(self, member):
+        """Write `member`, as produced by :meth:`prepare`, to the zip archive."""
+        if not _can_copy_raw():
+            return super(_ZipPkgWriter, self).write_prepared(member)
+        pack_uri, zinfo, data = member
+        self._write_raw(pack_uri, zinfo, (data,))
+
+    def _write_chunks(self, pack_uri, deferred_blob, content_type):
+        """Write bytes of `deferred_blob` as member `pack_uri`, a chunk at a time.
+
+        The member is compressed as :meth:`write` would compress it. Its size is known
+        in advance, so the zip64 extensions are used only when the size calls for them.
+        The bytes are read in full and passed to :meth:`write` instead when this version
+        of Python cannot write a member in chunks, or when the compression policy sets a
+        compression level, which `ZipFile` only accepts for a whole member.
+        """
+        compress_type, compresslevel = (
+            (zipfile.ZIP_DEFLATED, None)
+            if self._compression is None
+            else self._compression.compression_for(content_type)
+        )
+        if not _CAN_STREAM_MEMBERS or compresslevel is not None:
+            return self.write(pack_uri, deferred_blob.load(), content_type)
+
+        size, chunks = deferred_blob.member_chunks()
+        zinfo = zipfile.ZipInfo(pack_uri.membername, time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size = size
+        with self._zipf.open(zinfo, "w") as member:
+            for chunk in chunks:
+                member.write(chunk)
+
+    def _write_raw(self, pack_uri, src_zinfo, chunks):
+        """Write compressed `chunks` as member `pack_uri` described by `src_zinfo`.
+
+        The member keeps the compression method, CRC and sizes recorded in `src_zinfo`.
+        These are written in its local header, so no data descriptor is needed. This
+        relies on `ZipFile` internals, so is only used when :func:`_can_copy_raw` finds
+        they work as expected.
+        """
+        zipf = self._zipf
+        zinfo = zipfile.ZipInfo(pack_uri.membername, src_zinfo.date_time)
+        zinfo.compress_type = src_zinfo.compress_type
+        zinfo.flag_bits = src_zinfo.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+        zinfo.external_attr = src_zinfo.external_attr
+        zinfo.CRC = src_zinfo.CRC
+        zinfo.compress_size = src_zinfo.compress_size
+        zinfo.file_size = src_zinfo.file_size
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+        zipf._writecheck(zinfo)
+        if getattr(zipf, "_seekable", False):
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        for chunk in chunks:
+            zipf.fp.write(chunk)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
 
     @lazyproperty
     def _zipf(self):
@@ -225,6 +806,109 @@ class _ZipPkgWriter(_PhysPkgWriter):
         return zipfile.ZipFile(self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED)
 
 
+class _StreamPkgWriter(_ZipPkgWriter):
+    """Implements |PhysPkgWriter| interface for a zip package written to a stream.
+
+    The stream need only have a `write()` method, it is never sought or read. The local
+    header of each member defers its CRC and sizes to a data descriptor following the
+    member data, so no byte already written needs to be revisited and each member goes
+    to the stream as soon as it is produced.
+    """
+
+    @lazyproperty
+    def _zipf(self):
+        """`ZipFile` instance open for writing to the stream."""
+        return zipfile.ZipFile(
+            _WriteOnlyStream(self._pkg_file), "w", compression=zipfile.ZIP_DEFLATED
+        )
+
+
+def _can_compress_at_level():
+    """True when a zip member can be deflated at a given level in this Python.
+
+    The level is applied by compressing the member with zlib when compressed bytes can
+    be copied into the archive, and otherwise relies on the `compresslevel` argument
+    of `ZipFile.writestr()`, new in Python 3.7.
+    """
+    return _can_copy_raw() or sys.version_info >= (3, 7)
+
+
+def _can_copy_raw():
+    """True when compressed zip members can be copied as-is in this Python.
+
+    Copying the compressed bytes of a member reads and writes through undocumented
+    `zipfile` internals that can change between Python releases. So the first time it
+    is needed, a small archive is copied that way and checked. When anything about that
+    goes wrong, members are instead decompressed and compressed again through the
+    public `zipfile` API.
+    """
+    global _raw_copy_works
+    if _raw_copy_works is None:
+        _raw_copy_works = _check_raw_copy()
+    return _raw_copy_works
+
+
+def _check_raw_copy():
+    """Return True when a raw-copied member reads back intact, False otherwise."""
+    blob = b"<raw-copy-check/>" * 64
+    src, dst = BytesIO(), BytesIO()
+    try:
+        with zipfile.ZipFile(src, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("a.xml", blob)
+        reader = _LazyZipPkgReader(src)
+        zinfo = reader._zipf.getinfo("a.xml")
+        with _ZipPkgWriter(dst) as writer:
+            writer._write_raw(PackURI("/b.xml"), zinfo, reader._iter_raw_chunks(zinfo))
+            writer.write(PackURI("/c.xml"), blob)
+            writer._write_raw(PackURI("/d.xml"), zinfo, reader._iter_raw_chunks(zinfo))
+        reader.close()
+        with zipfile.ZipFile(dst) as zipf:
+            return zipf.testzip() is None and all(
+                zipf.read(name) == blob for name in ("b.xml", "c.xml", "d.xml")
+            )
+    except Exception:
+        return False
+
+
+def _iter_file_chunks(path):
+    """Generate the bytes of the file at `path`, reading one chunk at a time."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_RAW_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+class _WriteOnlyStream(object):
+    """Wraps `stream` to provide only the `write()`, `tell()` and `flush()` methods.
+
+    `tell()` reports the count of bytes written so far. Because this wrapper has no
+    `seek()` method, a `ZipFile` writing to it uses data descriptors rather than seeking
+    back to complete the header of each member.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._offset = 0
+
+    def flush(self):
+        """Flush the wrapped stream when it supports that."""
+        flush = getattr(self._stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def tell(self):
+        """Return int count of bytes written to the wrapped stream."""
+        return self._offset
+
+    def write(self, data):
+        """Write `data` to the wrapped stream and return the count of bytes written."""
+        self._stream.write(data)
+        self._offset += len(data)
+        return len(data)
+
+
 class _ContentTypesItem(object):
     """Composes content-types "part" ([Content_Types].xml) for a collection of parts."""
 
@@ -242,38 +926,31 @@ class _ContentTypesItem(object):
 
     @lazyproperty
     def _xml(self):
-        """lxml.etree._Element containing the content-types item.
+        """bytes XML of the content-types item.
 
-        This XML object is suitable for serialization to the `[Content_Types].xml` item
-        for an OPC package. Although the sequence of elements is not strictly
-        significant, as an aid to testing and readability Default elements are sorted by
-        extension and Override elements are sorted by partname.
+        These bytes are suitable for storage as the `[Content_Types].xml` item of an OPC
+        package. Although the sequence of elements is not strictly significant, as an
+        aid to testing and readability Default elements are sorted by extension and
+        Override elements are sorted by partname.
         """
         defaults, overrides = self._defaults_and_overrides
-        _types_elm = CT_Types.new()
-
-        for ext, content_type in sorted(defaults.items()):
-            _types_elm.add_default(ext, content_type)
-        for partname, content_type in sorted(overrides.items()):
-            _types_elm.add_override(partname, content_type)
-
-        return _types_elm
+        return serialize_types_xml(sorted(defaults.items()), sorted(overrides.items()))
 
     @lazyproperty
     def _defaults_and_overrides(self):
         """pair of dict (defaults, overrides) accounting for all parts.
 
         `defaults` is {ext: content_type} and overrides is {partname: content_type}.
+        Each part classifies itself, caching the result until its partname changes.
         """
-        defaults = CaseInsensitiveDict(rels=CT.OPC_RELATIONSHIPS, xml=CT.XML)
+        defaults = {"rels": CT.OPC_RELATIONSHIPS, "xml": CT.XML}
         overrides = dict()
 
         for part in self._parts:
-            partname, content_type = part.partname, part.content_type
-            ext = partname.ext
-            if (ext.lower(), content_type) in default_content_types:
-                defaults[ext] = content_type
+            is_default, key = part.content_types_key
+            if is_default:
+                defaults[key] = part.content_type
             else:
-                overrides[partname] = content_type
+                overrides[key] = part.content_type
 
         return defaults, overrides
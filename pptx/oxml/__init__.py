@@ -7,7 +7,9 @@ Also makes available a handful of functions that wrap its typical uses.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
 import os
+import threading
 
 from lxml import etree
 
@@ -16,8 +18,34 @@ from .ns import NamespacePrefixedTag
 
 # configure etree XML parser -------------------------------
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+
+
+def _new_oxml_parser():
+    """Return a new XML parser configured to construct the custom element classes."""
+    parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+    parser.set_element_class_lookup(element_class_lookup)
+    return parser
+
+
+oxml_parser = _new_oxml_parser()
+
+
+class _ThreadParser(threading.local):
+    """Holds the parser used by `parse_xml()` in each thread.
+
+    An lxml parser can only parse one document at a time, so threads parsing in parallel
+    each need their own. `parser` is |None| in `owner`, the thread that imports this
+    module, which uses `oxml_parser`. Each other thread gets a parser of its own the
+    first time it parses.
+    """
+
+    def __init__(self, owner):
+        self.parser = (
+            None if threading.current_thread() is owner else _new_oxml_parser()
+        )
+
+
+_thread_parser = _ThreadParser(threading.current_thread())
 
 
 def parse_from_template(template_name):
@@ -37,10 +65,31 @@ def parse_xml(xml):
     Return root lxml element obtained by parsing XML character string in
     *xml*, which can be either a Python 2.x string or unicode.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    parser = _thread_parser.parser
+    root_element = etree.fromstring(xml, oxml_parser if parser is None else parser)
     return root_element
 
 
+def parse_prototype(xml):
+    """Return a new element tree equivalent to the one obtained by parsing *xml*.
+
+    *xml* is only parsed the first time it is seen. The resulting tree is kept as a
+    prototype and each call returns a deep copy of it, which takes about half the time
+    parsing does. This suits constant XML templates like a new table cell or text
+    body. Each distinct *xml* string is kept for the life of the process, so *xml*
+    should not contain instance values like shape ids, names, or positions.
+    """
+    try:
+        prototype = _prototypes[xml]
+    except KeyError:
+        prototype = _prototypes[xml] = parse_xml(xml)
+    return copy.deepcopy(prototype)
+
+
+# ---element trees kept by `parse_prototype()`, keyed by the XML each was parsed from---
+_prototypes = {}
+
+
 def register_element_cls(nsptagname, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
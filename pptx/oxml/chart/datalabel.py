@@ -5,7 +5,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from pptx.enum.chart import XL_DATA_LABEL_POSITION
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.text import CT_TextBody
 from pptx.oxml.xmlchemy import (
@@ -84,7 +84,7 @@ class CT_DLbl(BaseOxmlElement):
         client. Failure to set the idx value will likely result in any
         changes not being visible and may result in a repair error on open.
         """
-        return parse_xml(
+        return parse_prototype(
             "<c:dLbl %s>\n"
             '  <c:idx val="666"/>\n'
             "  <c:spPr/>\n"
@@ -193,7 +193,7 @@ class CT_DLbls(BaseOxmlElement):
     @classmethod
     def new_dLbls(cls):
         """Return a newly created "loose" `c:dLbls` element."""
-        return parse_xml(
+        return parse_prototype(
             "<c:dLbls %s>\n"
             '  <c:showLegendKey val="0"/>\n'
             '  <c:showVal val="0"/>\n'
@@ -236,19 +236,19 @@ class CT_DLbls(BaseOxmlElement):
         `val=true`, which is not what we need so we override to make val
         explicitly False.
         """
-        return parse_xml('<c:showCatName %s val="0"/>' % nsdecls("c"))
+        return parse_prototype('<c:showCatName %s val="0"/>' % nsdecls("c"))
 
     def _new_showLegendKey(self):
-        return parse_xml('<c:showLegendKey %s val="0"/>' % nsdecls("c"))
+        return parse_prototype('<c:showLegendKey %s val="0"/>' % nsdecls("c"))
 
     def _new_showPercent(self):
-        return parse_xml('<c:showPercent %s val="0"/>' % nsdecls("c"))
+        return parse_prototype('<c:showPercent %s val="0"/>' % nsdecls("c"))
 
     def _new_showSerName(self):
-        return parse_xml('<c:showSerName %s val="0"/>' % nsdecls("c"))
+        return parse_prototype('<c:showSerName %s val="0"/>' % nsdecls("c"))
 
     def _new_showVal(self):
-        return parse_xml('<c:showVal %s val="0"/>' % nsdecls("c"))
+        return parse_prototype('<c:showVal %s val="0"/>' % nsdecls("c"))
 
     def _new_txPr(self):
         return CT_TextBody.new_txPr()
@@ -4,7 +4,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
     ST_LayoutMode,
@@ -185,7 +185,7 @@ class CT_Title(BaseOxmlElement):
     @staticmethod
     def new_title():
         """Return "loose" `c:title` element containing default children."""
-        return parse_xml(
+        return parse_prototype(
             "<c:title %s>"
             "  <c:layout/>"
             '  <c:overlay val="0"/>'
@@ -203,7 +203,7 @@ class CT_Tx(BaseOxmlElement):
     rich = ZeroOrOne("c:rich")
 
     def _new_rich(self):
-        return parse_xml(
+        return parse_prototype(
             "<c:rich %s>"
             "  <a:bodyPr/>"
             "  <a:lstStyle/>"
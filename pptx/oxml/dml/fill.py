@@ -7,7 +7,7 @@ lxml custom element classes for DrawingML-related XML elements.
 from __future__ import absolute_import
 
 from pptx.enum.dml import MSO_PATTERN_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
     ST_Percentage,
@@ -64,7 +64,7 @@ class CT_GradientFillProperties(BaseOxmlElement):
     @classmethod
     def new_gradFill(cls):
         """Return newly-created "loose" default gradient subtree."""
-        return parse_xml(
+        return parse_prototype(
             '<a:gradFill %s rotWithShape="1">\n'
             "  <a:gsLst>\n"
             '    <a:gs pos="0">\n'
@@ -120,7 +120,7 @@ class CT_GradientStopList(BaseOxmlElement):
         An `a:gsLst` element must have at least two `a:gs` children. These
         are the default from the PowerPoint built-in "White" template.
         """
-        return parse_xml(
+        return parse_prototype(
             "<a:gsLst %s>\n"
             '  <a:gs pos="0">\n'
             '    <a:schemeClr val="accent1">\n'
@@ -168,7 +168,7 @@ class CT_PatternFillProperties(BaseOxmlElement):
         xml = (
             "<a:bgClr %s>\n" ' <a:srgbClr val="FFFFFF"/>\n' "</a:bgClr>\n"
         ) % nsdecls("a")
-        bgClr = parse_xml(xml)
+        bgClr = parse_prototype(xml)
         return bgClr
 
     def _new_fgClr(self):
@@ -176,7 +176,7 @@ class CT_PatternFillProperties(BaseOxmlElement):
         xml = (
             "<a:fgClr %s>\n" ' <a:srgbClr val="000000"/>\n' "</a:fgClr>\n"
         ) % nsdecls("a")
-        fgClr = parse_xml(xml)
+        fgClr = parse_prototype(xml)
         return fgClr
 
 
@@ -128,6 +128,10 @@ def nsuri(nspfx):
     return _nsmap[nspfx]
 
 
+# ---Clark names memoized by `qn()`, keyed by namespace-prefixed tag---
+_clark_names = {}
+
+
 def qn(namespace_prefixed_tag):
     """
     Return a Clark-notation qualified tag name corresponding to
@@ -135,5 +139,9 @@ def qn(namespace_prefixed_tag):
     *qualified name*. As an example, ``qn('p:cSld')`` returns
     ``'{http://schemas.../main}cSld'``.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _clark_names[namespace_prefixed_tag]
+    except KeyError:
+        clark_name = NamespacePrefixedTag(namespace_prefixed_tag).clark_name
+        _clark_names[namespace_prefixed_tag] = clark_name
+        return clark_name
@@ -48,12 +48,30 @@ class CT_SlideIdList(BaseOxmlElement):
 
     sldId = ZeroOrMore("p:sldId")
 
+    # ---(count, max-id) pair recorded when slide IDs were last allocated. lxml can
+    # ---discard this along with the element proxy, which only costs a rescan.
+    _id_high_water = (-1, 255)
+
     def add_sldId(self, rId):
         """
         Return a reference to a newly created <p:sldId> child element having
         its r:id attribute set to *rId*.
         """
-        return self._add_sldId(id=self._next_id, rId=rId)
+        return self.add_sldIds([rId])[0]
+
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly created <p:sldId> child elements, one for each
+        of *rIds* in order. The slide IDs are allocated as a batch, the
+        existing IDs are only examined once.
+        """
+        next_id = self._next_id
+        sldIds = [
+            self._add_sldId(id=next_id + offset, rId=rId)
+            for offset, rId in enumerate(rIds)
+        ]
+        self._id_high_water = (len(self), next_id + len(sldIds) - 1)
+        return sldIds
 
     @property
     def _next_id(self):
@@ -62,9 +80,15 @@ class CT_SlideIdList(BaseOxmlElement):
         at 256. The next integer value greater than the max value in use is
         chosen, which minimizes that chance of reusing the id of a deleted
         slide.
+
+        The max value is remembered from the last allocation and the existing
+        IDs are only examined again when slides were added or removed since.
         """
-        id_str_lst = self.xpath("./p:sldId/@id")
-        return max([255] + [int(id_str) for id_str in id_str_lst]) + 1
+        count, max_id = self._id_high_water
+        if count != len(self):
+            id_str_lst = self.xpath("./p:sldId/@id")
+            max_id = max([255] + [int(id_str) for id_str in id_str_lst])
+        return max_id + 1
 
 
 class CT_SlideMasterIdList(BaseOxmlElement):
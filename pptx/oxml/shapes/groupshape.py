@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from lxml import etree
+
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
 from pptx.oxml import parse_xml
 from pptx.oxml.ns import nsdecls, qn
@@ -15,6 +17,10 @@ from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
 from pptx.util import Emu
 
+# --- EXSLT `math:max()` finds the largest id within libxml2, without a Python object
+# --- per id, NaN when there is no id or one is not a number
+_max_id = etree.XPath("math:max(//@id)", namespaces={"math": "http://exslt.org/math"})
+
 
 class CT_GroupShape(BaseShapeElement):
     """
@@ -53,21 +59,26 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(cxnSp, "p:extLst")
         return cxnSp
 
-    def add_freeform_sp(self, x, y, cx, cy):
-        """Append a new freeform `p:sp` with specified position and size."""
-        shape_id = self._next_shape_id
+    def add_freeform_sp(self, x, y, cx, cy, shape_id=None):
+        """Append a new freeform `p:sp` with specified position and size.
+
+        The next available shape id in this shape tree is used when *shape_id* is not
+        specified.
+        """
+        shape_id = self._next_shape_id if shape_id is None else shape_id
         name = "Freeform %d" % (shape_id - 1,)
         sp = CT_Shape.new_freeform_sp(shape_id, name, x, y, cx, cy)
         self.insert_element_before(sp, "p:extLst")
         return sp
 
-    def add_grpSp(self):
+    def add_grpSp(self, shape_id=None):
         """Return `p:grpSp` element newly appended to this shape tree.
 
         The element contains no sub-shapes, is positioned at (0, 0), and has
-        width and height of zero.
+        width and height of zero. The next available shape id in this shape tree
+        is used when *shape_id* is not specified.
         """
-        shape_id = self._next_shape_id
+        shape_id = self._next_shape_id if shape_id is None else shape_id
         name = "Group %d" % (shape_id - 1,)
         grpSp = CT_GroupShape.new_grpSp(shape_id, name)
         self.insert_element_before(grpSp, "p:extLst")
@@ -154,8 +165,13 @@ class CT_GroupShape(BaseShapeElement):
         (XML id-values have document scope).
 
         In practice, its minimum value is 1 because the spTree element itself
-        is always assigned id="1".
+        is always assigned id="1". The ids are only parsed one by one in Python
+        when one of them is not a number.
         """
+        max_id = _max_id(self)
+        if max_id == max_id:
+            return int(max_id)
+
         id_str_lst = self.xpath("//@id")
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         return max(used_ids) if used_ids else 0
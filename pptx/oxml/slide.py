@@ -4,7 +4,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from pptx.oxml import parse_from_template, parse_xml
+from pptx.oxml import parse_from_template, parse_prototype, parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import XsdString
@@ -51,7 +51,7 @@ class CT_Background(BaseOxmlElement):
             "  <a:effectLst/>\n"
             "</p:bgPr>" % nsdecls("a", "p")
         )
-        bgPr = parse_xml(xml)
+        bgPr = parse_prototype(xml)
         self._insert_bgPr(bgPr)
         return bgPr
 
@@ -168,7 +168,7 @@ class CT_Slide(_BaseSlideElement):
     @classmethod
     def new(cls):
         """Return new `p:sld` element configured as base slide shape."""
-        return parse_xml(cls._sld_xml())
+        return parse_prototype(cls._sld_xml())
 
     @property
     def bg(self):
@@ -200,7 +200,7 @@ class CT_Slide(_BaseSlideElement):
         replaced.
         """
         self.remove(self.get_or_add_timing())
-        timing = parse_xml(self._childTnLst_timing_xml())
+        timing = parse_prototype(self._childTnLst_timing_xml())
         self._insert_timing(timing)
         return timing.xpath("./p:tnLst/p:par/p:cTn/p:childTnLst")[0]
 
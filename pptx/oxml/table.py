@@ -5,7 +5,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
@@ -101,8 +101,7 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
+        tbl = parse_prototype(cls._tbl_tmpl() % (tableStyleId))
 
         # add specified number of rows and columns
         rowheight = height // rows
@@ -300,9 +299,7 @@ class CT_TableCell(BaseOxmlElement):
     @classmethod
     def new(cls):
         """Return a new `a:tc` element subtree."""
-        xml = cls._tc_tmpl()
-        tc = parse_xml(xml)
-        return tc
+        return parse_prototype(cls._tc_tmpl())
 
     @property
     def row_idx(self):
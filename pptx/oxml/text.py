@@ -15,7 +15,7 @@ from pptx.enum.text import (
     PP_PARAGRAPH_ALIGNMENT,
 )
 from pptx.exc import InvalidXmlError
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
@@ -123,9 +123,7 @@ class CT_TextBody(BaseOxmlElement):
         """
         Return a new ``<p:txBody>`` element tree
         """
-        xml = cls._txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return parse_prototype(cls._txBody_tmpl())
 
     @classmethod
     def new_a_txBody(cls):
@@ -133,9 +131,7 @@ class CT_TextBody(BaseOxmlElement):
         Return a new ``<a:txBody>`` element tree, suitable for use in a table
         cell and possibly other situations.
         """
-        xml = cls._a_txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return parse_prototype(cls._a_txBody_tmpl())
 
     @classmethod
     def new_p_txBody(cls):
@@ -143,8 +139,7 @@ class CT_TextBody(BaseOxmlElement):
         Return a new ``<p:txBody>`` element tree, suitable for use in an
         ``<p:sp>`` element.
         """
-        xml = cls._p_txBody_tmpl()
-        return parse_xml(xml)
+        return parse_prototype(cls._p_txBody_tmpl())
 
     @classmethod
     def new_txPr(cls):
@@ -163,8 +158,7 @@ class CT_TextBody(BaseOxmlElement):
             "  </a:p>\n"
             "</c:txPr>\n"
         ) % nsdecls("c", "a")
-        txPr = parse_xml(xml)
-        return txPr
+        return parse_prototype(xml)
 
     def unclear_content(self):
         """Ensure p:txBody has at least one a:p child.
@@ -429,7 +423,7 @@ class CT_TextParagraph(BaseOxmlElement):
 
     def _new_r(self):
         r_xml = "<a:r %s><a:t/></a:r>" % nsdecls("a")
-        return parse_xml(r_xml)
+        return parse_prototype(r_xml)
 
 
 class CT_TextParagraphProperties(BaseOxmlElement):
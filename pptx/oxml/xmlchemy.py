@@ -152,7 +152,7 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
+    @lazyproperty
     def _clark_name(self):
         if ":" in self._attr_name:
             return qn(self._attr_name)
@@ -338,8 +338,10 @@ class _BaseChildElement(object):
         element.
         """
 
+        successor_tags = _successor_tags(self._successors)
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            obj._insert_before_successors(child, successor_tags)
             return child
 
         _insert_child.__doc__ = (
@@ -390,8 +392,10 @@ class _BaseChildElement(object):
         matching tag name or |None| if not present.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -409,8 +413,10 @@ class _BaseChildElement(object):
         property descriptor.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -514,8 +520,10 @@ class OneAndOnlyOne(_BaseChildElement):
         descriptor.
         """
 
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
@@ -751,7 +759,22 @@ class _OxmlElementBase(etree.ElementBase):
         return None
 
     def insert_element_before(self, elm, *tagnames):
-        successor = self.first_child_found_in(*tagnames)
+        return self._insert_before_successors(elm, _successor_tags(tagnames))
+
+    def _insert_before_successors(self, elm, successor_tags):
+        """Return *elm* after inserting it before any trailing successor children.
+
+        *successor_tags* is a set of Clark names for the tags that must follow *elm*.
+        Successors always come last in a schema-conforming element, so the insertion
+        point is found by scanning back from the last child until a non-successor
+        child is reached. Only the successors present are visited, so appending to
+        an element with many children, like `p:spTree`, is not slowed down by them.
+        """
+        successor = None
+        for child in self.iterchildren(etree.Element, reversed=True):
+            if child.tag not in successor_tags:
+                break
+            successor = child
         if successor is not None:
             successor.addprevious(elm)
         else:
@@ -788,8 +811,36 @@ class _OxmlElementBase(etree.ElementBase):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
         XML namespace mapping in centralized location.
+
+        Each distinct *xpath_str* is compiled once and the compiled expression
+        reused on subsequent calls.
         """
-        return super(BaseOxmlElement, self).xpath(xpath_str, namespaces=_nsmap)
+        return _compiled_xpath(xpath_str)(self)
+
+
+def _successor_tags(tagnames):
+    """Return a frozenset of the Clark names for the namespace-prefixed *tagnames*."""
+    return frozenset(qn(tagname) for tagname in tagnames)
+
+
+def _compiled_xpath(xpath_str):
+    """Return the compiled |etree.XPath| object for *xpath_str*.
+
+    Compiled expressions are kept in a module-level registry. Some call sites format
+    an index into the expression, so the registry is emptied when it reaches
+    `_XPATH_CACHE_MAX` entries rather than being allowed to grow without bound.
+    """
+    try:
+        return _xpaths[xpath_str]
+    except KeyError:
+        if len(_xpaths) >= _XPATH_CACHE_MAX:
+            _xpaths.clear()
+        xpath = _xpaths[xpath_str] = etree.XPath(xpath_str, namespaces=_nsmap)
+        return xpath
+
+
+_XPATH_CACHE_MAX = 1024
+_xpaths = {}
 
 
 BaseOxmlElement = MetaOxmlElement(
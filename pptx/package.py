@@ -2,6 +2,8 @@
 
 """Overall .pptx package."""
 
+import collections
+
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import OpcPackage
 from pptx.opc.packuri import PackURI
@@ -49,23 +51,7 @@ class Package(OpcPackage):
         partname, by sequence number. *ext* is used as the extention on the
         returned partname.
         """
-
-        def first_available_image_idx():
-            image_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/image")
-                    and part.partname.idx is not None
-                ]
-            )
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs) + 1
-
-        idx = first_available_image_idx()
+        idx = self._part_index.next_available_idx("/ppt/media/image")
         return PackURI("/ppt/media/image%d.%s" % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -75,22 +61,7 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-
-        def first_available_media_idx():
-            media_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
-                ]
-            )
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs) + 1
-
-        idx = first_available_media_idx()
+        idx = self._part_index.next_available_idx("/ppt/media/media")
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
     @property
@@ -129,16 +100,7 @@ class _ImageParts(object):
         """
         Generate a reference to each |ImagePart| object in the package.
         """
-        image_parts = []
-        for rel in self._package.iter_rels():
-            if rel.is_external:
-                continue
-            if rel.reltype != RT.IMAGE:
-                continue
-            image_part = rel.target_part
-            if image_part in image_parts:
-                continue
-            image_parts.append(image_part)
+        for image_part in self._package.iter_parts_with_reltypes(RT.IMAGE):
             yield image_part
 
     def get_or_add_image_part(self, image_file):
@@ -150,7 +112,10 @@ class _ImageParts(object):
         """
         image = Image.from_file(image_file)
         image_part = self._find_by_sha1(image.sha1)
-        return ImagePart.new(self._package, image) if image_part is None else image_part
+        if image_part is None:
+            image_part = ImagePart.new(self._package, image)
+            self._image_parts_by_sha1[image.sha1].append(image_part)
+        return image_part
 
     def _find_by_sha1(self, sha1):
         """
@@ -158,13 +123,23 @@ class _ImageParts(object):
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
+        return _first_part_in_package(self._package, self._image_parts_by_sha1, sha1)
+
+    @lazyproperty
+    def _image_parts_by_sha1(self):
+        """defaultdict {sha1: [image_part, ...]} of the image parts in the package.
+
+        Built on first use, hashing each image once, and kept current as image parts
+        are added. A part that has since dropped out of the package is removed when it
+        is next looked up, so it is never handed out again.
+        """
+        image_parts_by_sha1 = collections.defaultdict(list)
         for image_part in self:
             # ---skip unknown/unsupported image types, like SVG---
             if not hasattr(image_part, "sha1"):
                 continue
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+            image_parts_by_sha1[image_part.sha1].append(image_part)
+        return image_parts_by_sha1
 
 
 class _MediaParts(object):
@@ -181,18 +156,8 @@ class _MediaParts(object):
     def __iter__(self):
         """Generate a reference to each |MediaPart| object in the package."""
         # A media part can appear in more than one relationship (and commonly
-        # does in the case of video). Use media_parts to keep track of those
-        # that have been "yielded"; they can be skipped if they occur again.
-        media_parts = []
-        for rel in self._package.iter_rels():
-            if rel.is_external:
-                continue
-            if rel.reltype not in (RT.MEDIA, RT.VIDEO):
-                continue
-            media_part = rel.target_part
-            if media_part in media_parts:
-                continue
-            media_parts.append(media_part)
+        # does in the case of video). Each is only generated once.
+        for media_part in self._package.iter_parts_with_reltypes(RT.MEDIA, RT.VIDEO):
             yield media_part
 
     def get_or_add_media_part(self, media):
@@ -205,6 +170,7 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            self._media_parts_by_sha1[media.sha1].append(media_part)
         return media_part
 
     def _find_by_sha1(self, sha1):
@@ -214,7 +180,30 @@ class _MediaParts(object):
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
+        return _first_part_in_package(self._package, self._media_parts_by_sha1, sha1)
+
+    @lazyproperty
+    def _media_parts_by_sha1(self):
+        """defaultdict {sha1: [media_part, ...]} of the media parts in the package.
+
+        Built on first use and kept current as media parts are added. A part that has
+        since dropped out of the package is removed when it is next looked up.
+        """
+        media_parts_by_sha1 = collections.defaultdict(list)
         for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
+            media_parts_by_sha1[media_part.sha1].append(media_part)
+        return media_parts_by_sha1
+
+
+def _first_part_in_package(package, parts_by_sha1, sha1):
+    """Return first part in `parts_by_sha1[sha1]` still in `package`, or |None|.
+
+    Parts no longer in the package, like the image of a deleted picture, are removed
+    from the list as they are found, so a lookup never re-walks all parts of a kind.
+    """
+    parts = parts_by_sha1.get(sha1)
+    if not parts:
         return None
+    part_index = package._part_index
+    parts[:] = [part for part in parts if part_index.contains_part(part)]
+    return parts[0] if parts else None
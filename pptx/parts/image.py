@@ -101,7 +101,7 @@ class ImagePart(Part):
         The SHA1 hash digest for the image binary of this image part, like:
         ``'1be010ea47803b00e140b852765cdf84f491da47'``.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return hashlib.sha1(self.blob).hexdigest()
 
     @property
     def _dpi(self):
@@ -5,7 +5,6 @@
 import hashlib
 
 from pptx.opc.package import Part
-from pptx.util import lazyproperty
 
 
 class MediaPart(Part):
@@ -15,23 +14,41 @@ class MediaPart(Part):
     `ppt/media/media[1-9][0-9]*.*`.
     """
 
+    def __init__(self, partname, content_type, package, blob=None, sha1=None):
+        super(MediaPart, self).__init__(partname, content_type, package, blob)
+        self._sha1 = sha1
+
     @classmethod
     def new(cls, package, media):
         """Return new |MediaPart| instance containing `media`.
 
-        `media` must be a |Media| object.
+        `media` must be a |Media| object. A media file loaded from a path is not read,
+        the part refers to that file and it is copied into the package when saved.
         """
+        deferred_blob = media.deferred_blob
         return cls(
             package.next_media_partname(media.ext),
             media.content_type,
             package,
-            media.blob,
+            media.blob if deferred_blob is None else deferred_blob,
+            sha1=media.sha1,
         )
 
-    @lazyproperty
+    @property
     def sha1(self):
         """The SHA1 hash digest for the media binary of this media part.
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
+
+        A deferred blob is hashed a chunk at a time rather than being loaded.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._sha1 is None:
+            deferred_blob = self.deferred_blob
+            if deferred_blob is None:
+                sha1 = hashlib.sha1(self.blob)
+            else:
+                sha1 = hashlib.sha1()
+                for chunk in deferred_blob.member_chunks()[1]:
+                    sha1.update(chunk)
+            self._sha1 = sha1.hexdigest()
+        return self._sha1
@@ -2,6 +2,8 @@
 
 """Presentation part, the main part in a .pptx package."""
 
+import copy
+
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import XmlPart
 from pptx.opc.packuri import PackURI
@@ -27,6 +29,30 @@ class PresentationPart(XmlPart):
         rId = self.relate_to(slide_part, RT.SLIDE)
         return rId, slide_part.slide
 
+    def add_slides(self, slide_layout, count, sld):
+        """Return list of (rId, slide) pairs for `count` newly created slides.
+
+        Each slide inherits appearance from `slide_layout` and contains a copy of the
+        `p:sld` element `sld`. Each partname is the next one available, as it is for
+        :meth:`add_slide`.
+        """
+        package, slide_layout_part = self.package, slide_layout.part
+        rIds_and_slides = []
+        for _ in range(count):
+            slide_part = SlidePart.new(
+                self._next_slide_partname,
+                package,
+                slide_layout_part,
+                sld=copy.deepcopy(sld),
+            )
+            rId = self.relate_to(slide_part, RT.SLIDE)
+            rIds_and_slides.append((rId, slide_part.slide))
+        return rIds_and_slides
+
+    def close(self):
+        """Release the package file held open by a lazily loaded package."""
+        self.package.close()
+
     @property
     def core_properties(self):
         """
@@ -98,13 +124,18 @@ class PresentationPart(XmlPart):
             slide_part = self.related_part(rId)
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compression=None, workers=None, prune=False):
         """Save this presentation package to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. `compression` is an optional |CompressionPolicy| object and
+        `workers` the optional number of threads used to serialize parts. Unreferenced
+        relationships and the parts only they reach are removed first when `prune` is
+        True.
         """
-        self.package.save(path_or_stream)
+        self.package.save(
+            path_or_stream, compression=compression, workers=workers, prune=prune
+        )
 
     def slide_id(self, slide_part):
         """Return the slide-id associated with `slide_part`."""
@@ -116,6 +147,5 @@ class PresentationPart(XmlPart):
     @property
     def _next_slide_partname(self):
         """Return |PackURI| instance containing next available slide partname."""
-        sldIdLst = self._element.get_or_add_sldIdLst()
-        partname_str = "/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)
-        return PackURI(partname_str)
+        idx = self._part_index.next_available_idx("/ppt/slides/slide")
+        return PackURI("/ppt/slides/slide%d.xml" % idx)
@@ -21,6 +21,9 @@ class BaseSlidePart(XmlPart):
     notes-master, and handout-master parts.
     """
 
+    # --- largest id returned by `next_shape_id()`, its shape may not be added yet ---
+    _last_shape_id = 0
+
     def get_image(self, rId):
         """
         Return an |Image| object containing the image related to this slide
@@ -47,6 +50,35 @@ class BaseSlidePart(XmlPart):
         """
         return self._element.cSld.name
 
+    def next_shape_id(self):
+        """Return an unused shape id for a new shape in this slide.
+
+        Each call returns a new id, greater than the last and than any id used in the
+        slide XML. The XML is checked on each call, so a shape added by any means is
+        seen. Ids are assigned by this part rather than by a shapes collection, so any
+        number of |Slide| or shapes objects for this slide can add shapes without id
+        collisions.
+        """
+        shape_id = self._last_shape_id = (
+            max(self._element.cSld.spTree.max_shape_id, self._last_shape_id) + 1
+        )
+        return shape_id
+
+    def unique_shape_name(self, basename, numpart):
+        """Return a shape name like 'Title 2' not yet used in this slide.
+
+        The name is *basename* followed by *numpart*, where *numpart* is incremented
+        as necessary to make the name unique. The names in use are read from the slide
+        XML on each call, into a set so each candidate name is checked in constant
+        time, so a shape added or renamed by any means is seen.
+        """
+        names = set(self._element.xpath("//p:cNvPr/@name"))
+        name = "%s %d" % (basename, numpart)
+        while name in names:
+            numpart += 1
+            name = "%s %d" % (basename, numpart)
+        return name
+
 
 class NotesMasterPart(BaseSlidePart):
     """Notes master part.
@@ -152,12 +184,16 @@ class SlidePart(BaseSlidePart):
     """Slide part. Corresponds to package files ppt/slides/slide[1-9][0-9]*.xml."""
 
     @classmethod
-    def new(cls, partname, package, slide_layout_part):
+    def new(cls, partname, package, slide_layout_part, sld=None):
         """Return newly-created blank slide part.
 
         The new slide-part has `partname` and a relationship to `slide_layout_part`.
+        When `sld` is provided, the slide-part contains that `p:sld` element rather
+        than a new blank one.
         """
-        slide_part = cls(partname, CT.PML_SLIDE, package, CT_Slide.new())
+        slide_part = cls(
+            partname, CT.PML_SLIDE, package, CT_Slide.new() if sld is None else sld
+        )
         slide_part.relate_to(slide_layout_part, RT.SLIDE_LAYOUT)
         return slide_part
 
@@ -14,6 +14,24 @@ class Presentation(PartElementProxy):
     create a presentation.
     """
 
+    def __enter__(self):
+        """Enable use as a context-manager, closing this presentation on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Close this presentation on exit from context."""
+        self.close()
+
+    def close(self):
+        """
+        Release the *pptx* file held open by a presentation opened with
+        ``lazy=True``. Images, media and other binary parts not yet read from
+        that file are read into memory first, so the presentation remains
+        fully usable and can be saved after the file is changed or removed.
+        Has no effect other than that on a presentation not opened lazily.
+        """
+        self.part.close()
+
     @property
     def core_properties(self):
         """
@@ -31,12 +49,32 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    def save(self, file, compression=None, workers=None, prune=False):
         """
         Save this presentation to *file*, where *file* can be either a path
-        to a file (a string) or a file-like object.
-        """
-        self.part.save(file)
+        to a file (a string) or a file-like object. The file-like object need
+        not support seeking, so a presentation can be written directly to
+        a socket or HTTP response, one item at a time. When *file* is the path
+        of an existing directory, the presentation is saved in expanded form,
+        each item as a separate uncompressed file, as though unzipped into
+        that directory.
+
+        *compression* is an optional
+        :class:`pptx.opc.serialized.CompressionPolicy` object controlling the
+        zip compression of each item in the saved file, for example to store
+        already-compressed images and video without deflating them again.
+
+        When *workers* is an integer greater than 1, the slides, charts and
+        other parts of the presentation are serialized and compressed by that
+        many threads in parallel. The saved file has the same items in the
+        same order either way.
+
+        When *prune* is |True|, images, media, charts, hyperlinks and the like
+        that are no longer referenced by any slide, for example because the
+        shape using them was deleted, are removed from the presentation before
+        it is saved, so the saved file does not carry their weight.
+        """
+        self.part.save(file, compression=compression, workers=workers, prune=prune)
 
     @property
     def slide_height(self):
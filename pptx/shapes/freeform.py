@@ -128,9 +128,13 @@ class FreeformBuilder(Sequence):
         *origin_x* and *origin_y* are specified in slide coordinates, and
         represent the location of the local coordinates origin on the slide.
         """
-        spTree = self._shapes._spTree
-        return spTree.add_freeform_sp(
-            origin_x + self._left, origin_y + self._top, self._width, self._height
+        shapes = self._shapes
+        return shapes._spTree.add_freeform_sp(
+            origin_x + self._left,
+            origin_y + self._top,
+            self._width,
+            self._height,
+            shapes._next_shape_id(),
         )
 
     def _add_line_segment(self, x, y):
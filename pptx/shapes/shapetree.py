@@ -67,7 +67,7 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree, parent):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._turbo_add_enabled = False
 
     def __getitem__(self, idx):
         """
@@ -100,7 +100,7 @@ class _BaseShapes(ParentedElementProxy):
         """Add a new placeholder shape based on *placeholder*."""
         sp = placeholder.element
         ph_type, orient, sz, idx = (sp.ph_type, sp.ph_orient, sp.ph_sz, sp.ph_idx)
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
@@ -133,30 +133,19 @@ class _BaseShapes(ParentedElementProxy):
     def turbo_add_enabled(self):
         """True if "turbo-add" mode is enabled. Read/Write.
 
-        EXPERIMENTAL: This feature can radically improve performance when
-        adding large numbers (hundreds of shapes) to a slide. It works by
-        caching the last shape ID used and incrementing that value to assign
-        the next shape id. This avoids repeatedly searching all shape ids in
-        the slide each time a new ID is required.
-
-        Performance is not noticeably improved for a slide with a relatively
-        small number of shapes, but because the search time rises with the
-        square of the shape count, this option can be useful for optimizing
-        generation of a slide composed of many shapes.
-
-        Shape-id collisions can occur (causing a repair error on load) if
-        more than one |Slide| object is used to interact with the same slide
-        in the presentation. Note that the |Slides| collection creates a new
-        |Slide| object each time a slide is accessed
-        (e.g. `slide = prs.slides[0]`, so you must be careful to limit use to
-        a single |Slide| object.
+        DEPRECATED: This setting no longer has any effect and is retained only so
+        existing code continues to run. Shape ids are now always assigned by the
+        slide part, which finds the largest id in use without parsing each id in
+        Python. This removes most of the cost "turbo-add" mode was introduced to
+        avoid when adding large numbers of shapes to a slide, without its risk of
+        shape-id collisions when more than one |Slide| object is used for the same
+        slide.
         """
-        return self._cached_max_shape_id is not None
+        return self._turbo_add_enabled
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value):
-        enable = bool(value)
-        self._cached_max_shape_id = self._spTree.max_shape_id if enable else None
+        self._turbo_add_enabled = bool(value)
 
     @staticmethod
     def _is_member_elm(shape_elm):
@@ -192,30 +181,16 @@ class _BaseShapes(ParentedElementProxy):
             basename = "Vertical %s" % basename
 
         # increment numpart as necessary to make name unique
-        numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
-        while True:
-            name = "%s %d" % (basename, numpart)
-            if name not in names:
-                break
-            numpart += 1
-
-        return name
+        return self.part.unique_shape_name(basename, id - 1)
 
-    @property
     def _next_shape_id(self):
         """Return a unique shape id suitable for use with a new shape.
 
-        The returned id is 1 greater than the maximum shape id used so far.
-        In practice, the minimum id is 2 because the spTree element is always
-        assigned id="1".
+        The returned id is greater than any shape id used so far in the slide, as
+        tracked by the slide part. In practice, the minimum id is 2 because the spTree
+        element is always assigned id="1". Each call returns a new id.
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
-
-        return self._spTree.max_shape_id + 1
+        return self.part.next_shape_id()
 
     def _shape_factory(self, shape_elm):
         """
@@ -271,7 +246,7 @@ class _BaseGroupShapes(_BaseShapes):
         it contains; its position and extents are recalculated each time
         a shape is added to it.
         """
-        grpSp = self._element.add_grpSp()
+        grpSp = self._element.add_grpSp(self._next_shape_id())
         for shape in shapes:
             grpSp.insert_element_before(shape._element, "p:extLst")
         if shapes:
@@ -305,7 +280,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         graphicFrame = _OleObjectElementCreator.graphicFrame(
             self,
-            self._next_shape_id,
+            self._next_shape_id(),
             object_file,
             prog_id,
             left,
@@ -396,7 +371,7 @@ class _BaseGroupShapes(_BaseShapes):
         The `p:graphicFrame` element has the specified position and size and
         refers to the chart part identified by *rId*.
         """
-        shape_id = self._next_shape_id
+        shape_id = self._next_shape_id()
         name = "Chart %d" % (shape_id - 1)
         graphicFrame = CT_GraphicalObjectFrame.new_chart_graphicFrame(
             shape_id, name, rId, x, y, cx, cy
@@ -411,7 +386,7 @@ class _BaseGroupShapes(_BaseShapes):
         beginning at (*begin_x*, *begin_y*) and extending to
         (*end_x*, *end_y*).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = "Connector %d" % (id_ - 1)
 
         flipH, flipV = begin_x > end_x, begin_y > end_y
@@ -430,7 +405,7 @@ class _BaseGroupShapes(_BaseShapes):
         appended to the shape tree, causing it to be displayed first in
         z-order on the slide.
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         scaled_cx, scaled_cy = image_part.scale(cx, cy)
         name = "Picture %d" % (id_ - 1)
         desc = image_part.desc
@@ -443,7 +418,7 @@ class _BaseGroupShapes(_BaseShapes):
         `p:sp` element is of *autoshape_type* at position (*x*, *y*) and of
         size (*cx*, *cy*).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = "%s %d" % (autoshape_type.basename, id_ - 1)
         sp = self._grpSp.add_autoshape(id_, name, autoshape_type.prst, x, y, cx, cy)
         return sp
@@ -453,7 +428,7 @@ class _BaseGroupShapes(_BaseShapes):
 
         Element has position (*x*, *y*) and size (*cx*, *cy*).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = "TextBox %d" % (id_ - 1)
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
         return sp
@@ -520,10 +495,14 @@ class SlideShapes(_BaseGroupShapes):
         *top*), having size (*width*, *height*), and containing *movie_file*.
         Before the video is started, *poster_frame_image* is displayed as
         a placeholder for the video.
+
+        When *movie_file* is a path, the video is not read into memory; it is
+        copied into the package when the presentation is saved, so the file
+        must remain in place until then.
         """
         movie_pic = _MoviePicElementCreator.new_movie_pic(
             self,
-            self._next_shape_id,
+            self._next_shape_id(),
             movie_file,
             left,
             top,
@@ -584,7 +563,7 @@ class SlideShapes(_BaseGroupShapes):
         Return a newly added ``<p:graphicFrame>`` element containing a table
         as specified by the parameters.
         """
-        _id = self._next_shape_id
+        _id = self._next_shape_id()
         name = "Table %d" % (_id - 1)
         graphicFrame = self._spTree.add_table(_id, name, rows, cols, x, y, cx, cy)
         return graphicFrame
@@ -283,6 +283,23 @@ class Slides(ParentedElementProxy):
         self._sldIdLst.add_sldId(rId)
         return slide
 
+    def add_slides(self, slide_layout, count):
+        """
+        Return a list of *count* newly added slides that inherit layout from
+        *slide_layout*, appended in order.
+
+        The result is the same as calling :meth:`add_slide` *count* times, but
+        the time taken grows only linearly with the number of slides. The
+        layout placeholders are cloned once and copied to each other slide,
+        and partnames and slide ids are allocated as a batch.
+        """
+        if count < 1:
+            return []
+        slide = self.add_slide(slide_layout)
+        rIds_and_slides = self.part.add_slides(slide_layout, count - 1, slide._element)
+        self._sldIdLst.add_sldIds([rId for rId, _ in rIds_and_slides])
+        return [slide] + [slide for _, slide in rIds_and_slides]
+
     def get(self, slide_id, default=None):
         """
         Return the slide identified by integer *slide_id* in this
@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 import pytest
 
+from lxml import etree
+
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.oxml import (
     CT_Default,
@@ -15,6 +17,8 @@ from pptx.opc.oxml import (
     CT_Types,
     oxml_tostring,
     serialize_part_xml,
+    serialize_rels_xml,
+    serialize_types_xml,
 )
 from pptx.oxml import parse_xml
 
@@ -180,3 +184,66 @@ class Describe_serialize_part_xml(object):
         )
         xml_bytes = unicode_xml.encode("utf-8")
         return xml_bytes
+
+
+class Describe_serialize_rels_xml(object):
+    """Unit-test suite for `pptx.opc.oxml.serialize_rels_xml` function."""
+
+    @pytest.mark.parametrize(
+        "rels",
+        (
+            (),
+            (
+                ("rId1", "http://rt/slide", "../slides/slide1.xml", False),
+                ("rId2", "http://rt/hlink", 'http://x.com/?a=1&b="<2>"', True),
+                ("rId3", "http://rt/hlink", "http://y.com/ÅØ\tz", True),
+            ),
+        ),
+    )
+    def it_produces_the_same_xml_as_a_serialized_rels_element(self, rels):
+        rels_elm = CT_Relationships.new()
+        for rId, reltype, target_ref, is_external in rels:
+            rels_elm.add_rel(rId, reltype, target_ref, is_external)
+
+        xml = serialize_rels_xml(rels)
+
+        assert xml.startswith(_declaration)
+        assert _canonical(xml) == _canonical(rels_elm.xml)
+
+    def it_accepts_utf8_encoded_bytes_values(self):
+        target_ref = "http://y.com/ÅØ"
+        rels = (("rId1", "http://rt/hlink", target_ref, True),)
+        byte_rels = (("rId1", "http://rt/hlink", target_ref.encode("utf-8"), True),)
+
+        assert serialize_rels_xml(byte_rels) == serialize_rels_xml(rels)
+
+
+class Describe_serialize_types_xml(object):
+    """Unit-test suite for `pptx.opc.oxml.serialize_types_xml` function."""
+
+    def it_produces_the_same_xml_as_a_serialized_types_element(self):
+        defaults = (("png", "image/png"), ("xml", "application/xml"))
+        overrides = (
+            ("/ppt/slides/slide1.xml", "app/vnd.sld"),
+            ("/ppt/media/a&b.bin", "app/vnd.x"),
+        )
+        types = CT_Types.new()
+        for ext, content_type in defaults:
+            types.add_default(ext, content_type)
+        for partname, content_type in overrides:
+            types.add_override(partname, content_type)
+
+        xml = serialize_types_xml(defaults, overrides)
+
+        assert xml.startswith(_declaration)
+        assert _canonical(xml) == _canonical(serialize_part_xml(types))
+
+
+# --- helpers --------------------------------------------------------
+
+_declaration = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+
+def _canonical(xml):
+    """Canonical form of `xml` bytes, the same however attributes are ordered."""
+    return etree.tostring(etree.fromstring(xml), method="c14n")
@@ -5,6 +5,7 @@
 import collections
 import io
 import itertools
+import pickle
 
 import pytest
 
@@ -21,12 +22,16 @@ from pptx.opc.package import (
     XmlPart,
     _ContentTypeMap,
     _PackageLoader,
+    _PartIndex,
     _RelatableMixin,
     _Relationship,
     _Relationships,
+    _SNAPSHOT_FORMAT,
 )
 from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import DeferredBlob, PackageReader
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.parts.presentation import PresentationPart
 
 from ..unitutil.cxml import element
@@ -40,6 +45,7 @@ from ..unitutil.mock import (
     instance_mock,
     method_mock,
     property_mock,
+    var_mock,
 )
 
 
@@ -72,6 +78,21 @@ class Describe_RelatableMixin(object):
         relationships_.get_or_add.assert_called_once_with(RT.SLIDE, part_)
         assert rId == "rId42"
 
+    def and_it_adds_the_relationship_to_the_part_index(
+        self, request, _rels_prop_, relationships_, part_
+    ):
+        relationships_.get_or_add.return_value = "rId42"
+        _rels_prop_.return_value = relationships_
+        part_index_ = instance_mock(request, _PartIndex)
+        property_mock(
+            request, _RelatableMixin, "_part_index", return_value=part_index_
+        )
+        mixin = _RelatableMixin()
+
+        mixin.relate_to(part_, RT.SLIDE)
+
+        part_index_.add_rel.assert_called_once_with(mixin, RT.SLIDE, part_)
+
     def and_it_can_establish_a_relationship_to_an_external_link(
         self, request, _rels_prop_, relationships_
     ):
@@ -141,10 +162,105 @@ class DescribeOpcPackage(object):
 
         package = OpcPackage.open("package.pptx")
 
-        _init_.assert_called_once_with(ANY, "package.pptx")
-        _load_.assert_called_once_with(ANY)
+        _init_.assert_called_once_with(ANY, "package.pptx", lazy=False)
+        _load_.assert_called_once_with(ANY, workers=None)
         assert package is package_
 
+    def it_can_clone_itself(self):
+        package = OpcPackage("prs.pptx")
+        slide = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package, None, b"<sld/>"
+        )
+        image = Part(PackURI("/ppt/media/image1.png"), CT.PNG, package, b"png")
+        package.relate_to(slide, RT.OFFICE_DOCUMENT)
+        slide.relate_to("http://url", RT.HYPERLINK, is_external=True)
+        slide.relate_to(image, RT.IMAGE)
+
+        clone = package.clone()
+
+        assert type(clone) is OpcPackage
+        assert clone._pkg_file == "prs.pptx"
+        slide_clone, image_clone = clone.iter_parts()
+        assert slide_clone is not slide
+        assert slide_clone.package is clone
+        assert slide_clone.partname == slide.partname
+        assert slide_clone.blob is slide.blob
+        assert image_clone.blob is image.blob
+        assert clone.part_related_by(RT.OFFICE_DOCUMENT) is slide_clone
+        assert slide_clone.rels["rId1"].target_ref == "http://url"
+        assert slide_clone.rels["rId2"].target_part is image_clone
+        assert slide.rels["rId2"].target_part is image
+
+    def it_can_be_restored_from_a_snapshot_of_itself(self, request):
+        part_type_for = {CT.PML_SLIDE: XmlPart}
+        var_mock(
+            request, "pptx.opc.package.PartFactory.part_type_for", new=part_type_for
+        )
+        package = OpcPackage("prs.pptx")
+        slide = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package, None, b"<sld/>"
+        )
+        image = Part(PackURI("/ppt/media/image1.png"), CT.PNG, package, b"png")
+        package.relate_to(slide, RT.OFFICE_DOCUMENT)
+        slide.relate_to("http://url", RT.HYPERLINK, is_external=True)
+        slide.relate_to(image, RT.IMAGE)
+
+        restored = OpcPackage.from_snapshot(package.snapshot())
+
+        assert type(restored) is OpcPackage
+        slide_copy, image_copy = restored.iter_parts()
+        assert type(slide_copy) is XmlPart
+        assert slide_copy.package is restored
+        assert slide_copy.partname == "/ppt/slides/slide1.xml"
+        assert isinstance(slide_copy.partname, PackURI)
+        assert slide_copy.content_type == CT.PML_SLIDE
+        assert slide_copy._blob == b"<sld/>"
+        assert type(image_copy) is Part
+        assert image_copy.blob == b"png"
+        assert restored.part_related_by(RT.OFFICE_DOCUMENT) is slide_copy
+        assert slide_copy.rels["rId1"].target_ref == "http://url"
+        assert slide_copy.rels["rId2"].target_part is image_copy
+
+    def and_its_snapshot_leads_with_the_format_and_holds_only_plain_data(self):
+        package = OpcPackage("prs.pptx")
+        slide = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package, None, b"<sld/>"
+        )
+        package.relate_to(slide, RT.OFFICE_DOCUMENT)
+
+        snapshot = package.snapshot()
+
+        assert snapshot.startswith(_SNAPSHOT_FORMAT)
+        assert pickle.loads(snapshot[len(_SNAPSHOT_FORMAT) :]) == (
+            (("rId1", RT.OFFICE_DOCUMENT, False, 0),),
+            (("/ppt/slides/slide1.xml", CT.PML_SLIDE, b"<sld/>", ()),),
+        )
+
+    @pytest.mark.parametrize(
+        "snapshot",
+        (
+            b"python-pptx-package-snapshot-1\n" + pickle.dumps(((), ())),
+            pickle.dumps(("python-pptx-package-snapshot-1", (), ())),
+            b"",
+        ),
+    )
+    def but_it_raises_on_a_snapshot_it_cannot_restore(self, request, snapshot):
+        _SnapshotUnpickler_ = class_mock(request, "pptx.opc.package._SnapshotUnpickler")
+
+        with pytest.raises(ValueError) as e:
+            OpcPackage.from_snapshot(snapshot)
+
+        _SnapshotUnpickler_.assert_not_called()
+        assert str(e.value) == "not a package snapshot, or from an unsupported version"
+
+    def and_it_refuses_to_import_a_class_named_in_a_snapshot(self):
+        snapshot = _SNAPSHOT_FORMAT + pickle.dumps(((), ((Part, "x", "y", b"", ()),)))
+
+        with pytest.raises(ValueError) as e:
+            OpcPackage.from_snapshot(snapshot)
+
+        assert str(e.value) == "not a package snapshot, or from an unsupported version"
+
     def it_can_drop_a_relationship(self, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
 
@@ -152,6 +268,21 @@ class DescribeOpcPackage(object):
 
         relationships_.pop.assert_called_once_with("rId42")
 
+    @pytest.mark.parametrize("is_external, calls", ((True, []), (False, [call()])))
+    def and_it_invalidates_its_part_index_when_dropping_an_internal_relationship(
+        self, request, _rels_prop_, relationships_, is_external, calls
+    ):
+        _rels_prop_.return_value = relationships_
+        relationships_.pop.return_value = instance_mock(
+            request, _Relationship, is_external=is_external
+        )
+        part_index_ = instance_mock(request, _PartIndex)
+        property_mock(request, OpcPackage, "_part_index", return_value=part_index_)
+
+        OpcPackage(None).drop_rel("rId42")
+
+        assert part_index_.invalidate.call_args_list == calls
+
     def it_can_iterate_over_its_parts(self, request):
         part_, part_2_ = [
             instance_mock(request, Part, name="part_%d" % i) for i in range(2)
@@ -233,23 +364,31 @@ class DescribeOpcPackage(object):
         part_related_by_.assert_called_once_with(package, RT.OFFICE_DOCUMENT)
         assert presentation_part is presentation_part_
 
+    def it_can_iterate_the_parts_having_a_reltype(self, request):
+        parts_ = [instance_mock(request, Part) for _ in range(2)]
+        part_index_ = instance_mock(request, _PartIndex)
+        part_index_.parts_with_reltypes.return_value = parts_
+        property_mock(request, OpcPackage, "_part_index", return_value=part_index_)
+        package = OpcPackage(None)
+
+        parts = list(package.iter_parts_with_reltypes(RT.MEDIA, RT.VIDEO))
+
+        part_index_.parts_with_reltypes.assert_called_once_with((RT.MEDIA, RT.VIDEO))
+        assert parts == parts_
+
     @pytest.mark.parametrize(
         "ns, expected_n",
         (((), 1), ((1,), 2), ((1, 2), 3), ((2, 4), 3), ((1, 4), 3)),
     )
     def it_can_find_the_next_available_partname(self, request, ns, expected_n):
         tmpl = "/x%d.xml"
-        method_mock(
-            request,
-            OpcPackage,
-            "iter_parts",
-            return_value=(instance_mock(request, Part, partname=tmpl % n) for n in ns),
-        )
+        package = OpcPackage(None)
+        for n in ns:
+            package.relate_to(Part(PackURI(tmpl % n), None, package), RT.SLIDE)
         next_partname = tmpl % expected_n
         PackURI_ = class_mock(
             request, "pptx.opc.package.PackURI", return_value=PackURI(next_partname)
         )
-        package = OpcPackage(None)
 
         partname = package.next_partname(tmpl)
 
@@ -265,20 +404,115 @@ class DescribeOpcPackage(object):
 
         package.save("prs.pptx")
 
-        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_)
+        PackageWriter_.write.assert_called_once_with(
+            "prs.pptx", relationships_, parts_, compression=None, workers=None
+        )
+
+    def but_it_reads_deferred_blobs_first_when_saving_over_its_lazy_pkg_file(
+        self, request, _rels_prop_, relationships_
+    ):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        close_ = method_mock(request, OpcPackage, "close")
+        package = OpcPackage(pkg_path, lazy=True)
+
+        package.save(pkg_path)
+
+        close_.assert_called_once_with(package)
+        PackageWriter_.write.assert_called_once_with(
+            pkg_path, relationships_, parts_, compression=None, workers=None
+        )
+
+    def it_does_not_mistake_a_new_file_for_a_removed_pkg_file(self, tmpdir):
+        pkg_path = str(tmpdir.join("gone.pptx"))
+        package = OpcPackage(pkg_path, lazy=True)
+        assert package._is_pkg_file(absjoin(test_file_dir, "test.pptx")) is False
+
+    def it_reads_deferred_blobs_and_releases_its_pkg_file_on_close(self):
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        package = OpcPackage.open(pkg_path, lazy=True)
+        package_reader = package._package_reader
+        blobs = {part.partname: part.blob for part in package.iter_parts()}
+
+        package.close()
+
+        assert package._package_reader is None
+        with pytest.raises((RuntimeError, ValueError)):
+            package_reader[PackURI("/ppt/presentation.xml")]
+        for part in package.iter_parts():
+            assert part.deferred_blob is None
+            assert part.blob == blobs[part.partname]
+        package.close()
+
+    def it_can_close_a_clone_without_closing_its_original(self):
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        package = OpcPackage.open(pkg_path, lazy=True)
+        clone = package.clone()
+
+        clone.close()
+
+        assert all(part.deferred_blob is None for part in clone.iter_parts())
+        assert package._package_reader is not None
+        assert package.main_document_part.blob is not None
+
+    def and_it_prunes_unreferenced_relationships_first_when_asked(
+        self, request, _rels_prop_, relationships_
+    ):
+        _rels_prop_.return_value = relationships_
+        _prune_ = method_mock(request, OpcPackage, "_prune")
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(()))
+        class_mock(request, "pptx.opc.package.PackageWriter")
+        package = OpcPackage(None)
+
+        package.save("prs.pptx", prune=True)
+
+        _prune_.assert_called_once_with(package)
+
+    def it_can_prune_unreferenced_relationships_to_help(self):
+        package = OpcPackage(None)
+        slide = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"),
+            None,
+            package,
+            element("p:sld/p:cSld/p:spTree/p:pic/p:blipFill/a:blip{r:embed=rId2}"),
+        )
+        layout = Part(PackURI("/ppt/slideLayouts/slideLayout1.xml"), None, package)
+        image, image_2 = (
+            Part(PackURI("/ppt/media/image%d.png" % n), None, package) for n in (1, 2)
+        )
+        package.relate_to(slide, RT.OFFICE_DOCUMENT)
+        slide.relate_to(layout, RT.SLIDE_LAYOUT)
+        slide.relate_to(image, RT.IMAGE)
+        slide.relate_to(image_2, RT.IMAGE)
+        slide.relate_to("http://url", RT.HYPERLINK, is_external=True)
+
+        package._prune()
+
+        assert sorted(rel.rId for rel in slide.rels) == ["rId1", "rId2"]
+        assert list(package.iter_parts()) == [slide, layout, image]
 
     def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_):
         _PackageLoader_ = class_mock(request, "pptx.opc.package._PackageLoader")
-        _PackageLoader_.load.return_value = "pkg-rels-xml", {"partname": "part"}
+        _PackageLoader_.load.return_value = (
+            "pkg-rels-xml",
+            {"partname": "part"},
+            "package-reader",
+        )
         _rels_prop_.return_value = relationships_
         package = OpcPackage("prs.pptx")
 
         return_value = package._load()
 
-        _PackageLoader_.load.assert_called_once_with("prs.pptx", package)
+        _PackageLoader_.load.assert_called_once_with(
+            "prs.pptx", package, lazy=False, workers=None
+        )
         relationships_.load_from_xml.assert_called_once_with(
             PACKAGE_URI, "pkg-rels-xml", {"partname": "part"}
         )
+        assert package._package_reader == "package-reader"
         assert return_value is package
 
     def it_constructs_its_relationships_object_to_help(self, request, relationships_):
@@ -313,17 +547,21 @@ class Describe_PackageLoader(object):
             request,
             _PackageLoader,
             "_load",
-            return_value=(pkg_xml_rels_, {"partname": "part"}),
+            return_value=(pkg_xml_rels_, {"partname": "part"}, None),
         )
 
-        pkg_xml_rels, parts = _PackageLoader.load("prs.pptx", package_)
+        pkg_xml_rels, parts, package_reader = _PackageLoader.load(
+            "prs.pptx", package_
+        )
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", package_)
+        _init_.assert_called_once_with(ANY, "prs.pptx", package_, False, None)
         _load_.assert_called_once_with(ANY)
         assert pkg_xml_rels is pkg_xml_rels_
         assert parts == {"partname": "part"}
+        assert package_reader is None
 
-    def it_loads_the_package_to_help(self, request, _xml_rels_prop_):
+    @pytest.mark.parametrize("lazy", (True, False))
+    def it_loads_the_package_to_help(self, request, lazy, _xml_rels_prop_):
         parts_ = {
             "partname_%d" % n: instance_mock(request, Part, partname="partname_%d" % n)
             for n in range(1, 4)
@@ -339,9 +577,13 @@ class Describe_PackageLoader(object):
             )
         )
         _xml_rels_prop_.return_value = rels_
-        package_loader = _PackageLoader(None, None)
+        package_reader_ = instance_mock(request, PackageReader)
+        property_mock(
+            request, _PackageLoader, "_package_reader", return_value=package_reader_
+        )
+        package_loader = _PackageLoader(None, None, lazy=lazy)
 
-        pkg_xml_rels, parts = package_loader._load()
+        pkg_xml_rels, parts, package_reader = package_loader._load()
 
         for part_ in parts_.values():
             part_.load_rels_from_xml.assert_called_once_with(
@@ -349,6 +591,9 @@ class Describe_PackageLoader(object):
             )
         assert pkg_xml_rels is rels_["/"]
         assert parts is parts_
+        # --- the package file is released right away unless blobs are deferred ---
+        assert package_reader is (package_reader_ if lazy else None)
+        assert package_reader_.close.call_count == (0 if lazy else 1)
 
     def it_loads_the_xml_relationships_from_the_package_to_help(self, request):
         pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
@@ -390,6 +635,25 @@ class Describe_PackageLoader(object):
             "/docProps/core.xml": core_xml_rels,
         }
 
+    def it_can_load_the_parts_in_parallel(self):
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        parts = _PackageLoader(pkg_path, OpcPackage(pkg_path))._parts
+
+        parallel_parts = _PackageLoader(
+            pkg_path, OpcPackage(pkg_path), workers=2
+        )._parts
+
+        assert sorted(parallel_parts) == sorted(parts)
+        for partname, part in parts.items():
+            parallel_part = parallel_parts[partname]
+            assert type(parallel_part) is type(part)
+            if not isinstance(part, XmlPart):
+                assert parallel_part.blob == part.blob
+                continue
+            assert part._blob is not None
+            assert parallel_part._blob is None
+            assert parallel_part._element.xml == part._element.xml
+
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -416,6 +680,43 @@ class DescribePart(object):
     def it_uses_the_load_blob_as_its_blob(self):
         assert Part(None, None, None, b"blob").blob == b"blob"
 
+    def and_it_reads_a_deferred_blob_on_access(self, request):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.load.return_value = b"blob"
+        part = Part(None, None, None, deferred_blob_)
+
+        assert part.blob == b"blob"
+        deferred_blob_.load.assert_called_once_with()
+
+    @pytest.mark.parametrize("is_deferred", (True, False))
+    def it_provides_access_to_its_deferred_blob(self, request, is_deferred):
+        blob = instance_mock(request, DeferredBlob) if is_deferred else b"blob"
+        part = Part(None, None, None, blob)
+
+        assert part.deferred_blob is (blob if is_deferred else None)
+
+    def it_can_load_its_deferred_blob_into_memory(self, request):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.load.return_value = b"blob"
+        part = Part(None, None, None, deferred_blob_)
+
+        part._load_deferred_blob()
+
+        assert part._blob == b"blob"
+
+    def it_can_clone_itself(self, request, package_):
+        partname = PackURI("/ppt/media/image1.png")
+        blob = instance_mock(request, DeferredBlob)
+        part = Part(partname, CT.PNG, None, blob)
+
+        clone = part.clone(package_)
+
+        assert type(clone) is Part
+        assert clone.partname is partname
+        assert clone.content_type == CT.PNG
+        assert clone.package is package_
+        assert clone.deferred_blob is blob
+
     def it_can_change_its_blob(self):
         part = Part(None, None, None, b"old-blob")
         part.blob = b"new-blob"
@@ -424,6 +725,27 @@ class DescribePart(object):
     def it_knows_its_content_type(self):
         assert Part(None, CT.PML_SLIDE, None).content_type == CT.PML_SLIDE
 
+    @pytest.mark.parametrize(
+        "partname, content_type, expected_value",
+        (
+            ("/ppt/media/image1.PNG", CT.PNG, (True, "png")),
+            ("/ppt/slides/slide1.xml", CT.PML_SLIDE, (False, "/ppt/slides/slide1.xml")),
+        ),
+    )
+    def it_knows_where_its_content_type_is_declared(
+        self, partname, content_type, expected_value
+    ):
+        part = Part(PackURI(partname), content_type, None)
+        assert part.content_types_key == expected_value
+
+    def but_it_recomputes_that_when_its_partname_changes(self):
+        part = Part(PackURI("/ppt/media/image1.png"), CT.PNG, None)
+        assert part.content_types_key == (True, "png")
+
+        part.partname = PackURI("/ppt/media/image1.bin")
+
+        assert part.content_types_key == (False, "/ppt/media/image1.bin")
+
     @pytest.mark.parametrize("ref_count, calls", ((2, []), (1, [call("rId42")])))
     def it_can_drop_a_relationship(self, request, relationships_, ref_count, calls):
         _rel_ref_count_ = method_mock(
@@ -437,6 +759,13 @@ class DescribePart(object):
         _rel_ref_count_.assert_called_once_with(part, "rId42")
         assert relationships_.pop.call_args_list == calls
 
+    def it_provides_access_to_the_part_index_of_its_package(self, request, package_):
+        part_index_ = instance_mock(request, _PartIndex)
+        package_._part_index = part_index_
+
+        assert Part(None, None, package_)._part_index is part_index_
+        assert Part(None, None, None)._part_index is None
+
     def it_knows_the_package_it_belongs_to(self, package_):
         assert Part(None, None, package_).package is package_
 
@@ -448,6 +777,18 @@ class DescribePart(object):
         part.partname = PackURI("/new/part/name")
         assert part.partname == PackURI("/new/part/name")
 
+    def and_it_updates_the_part_index_when_its_partname_changes(
+        self, request, package_
+    ):
+        part_index_ = instance_mock(request, _PartIndex)
+        package_._part_index = part_index_
+        part = Part(PackURI("/old/part/name"), None, package_)
+
+        part.partname = PackURI("/old/part/name")
+        part.partname = PackURI("/new/part/name")
+
+        part_index_.rename.assert_called_once_with(part, PackURI("/old/part/name"))
+
     def it_provides_access_to_its_relationships_for_traversal(
         self, request, relationships_
     ):
@@ -493,18 +834,93 @@ class DescribeXmlPart(object):
 
     def it_can_be_constructed_by_PartFactory(self, request):
         partname = PackURI("/ppt/slides/slide1.xml")
-        element_ = element("p:sld")
         package_ = instance_mock(request, OpcPackage)
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
+        _init_ = initializer_mock(request, XmlPart)
+
+        part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
+
+        _init_.assert_called_once_with(
+            part, partname, CT.PML_SLIDE, package_, element=None, blob=b"blob"
+        )
+        assert isinstance(part, XmlPart)
+        parse_xml_.assert_not_called()
+
+    def it_can_clone_itself_sharing_its_original_xml(self, request):
+        package_ = instance_mock(request, OpcPackage)
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
+        xml_part = XmlPart(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, None)
+        xml_part._blob = b"<p:sld/>"
+
+        clone = xml_part.clone(package_)
+
+        assert type(clone) is XmlPart
+        assert clone.partname == "/ppt/slides/slide1.xml"
+        assert clone.content_type == CT.PML_SLIDE
+        assert clone.package is package_
+        assert clone._blob is xml_part._blob
+        parse_xml_.assert_not_called()
+
+    def but_it_clones_the_current_xml_once_parsed(self, request):
+        xml_part = XmlPart(None, None, None, element("p:sld/p:cSld"))
+
+        clone = xml_part.clone(None)
+
+        assert clone._blob == xml_part.blob
+        assert clone._element is not xml_part._element
+        assert clone._element.xml == xml_part._element.xml
+
+    def it_parses_its_blob_on_first_access_to_its_element(self, request):
+        element_ = element("p:sld")
         parse_xml_ = function_mock(
             request, "pptx.opc.package.parse_xml", return_value=element_
         )
-        _init_ = initializer_mock(request, XmlPart)
+        xml_part = XmlPart(None, None, None, None, blob=b"blob")
 
-        part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
+        elm = xml_part._element
+        elm_2 = xml_part._element
 
         parse_xml_.assert_called_once_with(b"blob")
-        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element_)
-        assert isinstance(part, XmlPart)
+        assert elm is element_
+        assert elm_2 is element_
+        assert xml_part.deferred_blob is None
+
+    def and_it_reads_a_deferred_blob_to_parse_it(self, request):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.load.return_value = b"blob"
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
+        xml_part = XmlPart(None, None, None, None, blob=deferred_blob_)
+        assert xml_part.deferred_blob is deferred_blob_
+
+        xml_part._element
+
+        parse_xml_.assert_called_once_with(b"blob")
+        assert xml_part.deferred_blob is None
+
+    def it_can_parse_its_blob_before_its_element_is_used(self, request):
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(
+            request, "pptx.opc.package.parse_xml", return_value=element_
+        )
+        xml_part = XmlPart(None, None, None, None, blob=b"blob")
+
+        xml_part.parse()
+        xml_part.parse()
+
+        parse_xml_.assert_called_once_with(b"blob")
+        assert xml_part._blob is None
+        assert xml_part._element is element_
+
+    def it_provides_its_original_blob_when_never_parsed(self, request):
+        serialize_part_xml_ = function_mock(
+            request, "pptx.opc.package.serialize_part_xml"
+        )
+        xml_part = XmlPart(None, None, None, None, blob=b"<p:sld/>")
+
+        blob = xml_part.blob
+
+        serialize_part_xml_.assert_not_called()
+        assert blob == b"<p:sld/>"
 
     def it_can_serialize_to_xml(self, request):
         element_ = element("p:sld")
@@ -522,17 +938,48 @@ class DescribeXmlPart(object):
         xml_part = XmlPart(None, None, None, None)
         assert xml_part.part is xml_part
 
+    @pytest.mark.parametrize("is_parsed", (True, False))
+    def it_knows_the_rIds_referenced_in_its_XML(self, request, is_parsed):
+        xml = (
+            '<p:sld %s><p:a r:id="rId1"/><p:b r:embed="rId4" r:link="rId1"/>'
+            '<p:c id="rId9"/></p:sld>' % nsdecls("p", "r")
+        )
+        parse_xml_ = function_mock(
+            request, "pptx.opc.package.parse_xml", side_effect=parse_xml
+        )
+        xml_part = (
+            XmlPart(None, None, None, parse_xml(xml))
+            if is_parsed
+            else XmlPart(None, None, None, None, blob=xml.encode("utf-8"))
+        )
+        parse_xml_.reset_mock()
+
+        assert xml_part.referenced_rIds == {"rId1", "rId4"}
+        # --- an unparsed part is scanned without being left parsed ---
+        assert parse_xml_.call_count == (0 if is_parsed else 1)
+        assert (xml_part._parsed_element is None) is not is_parsed
+
+    @pytest.mark.parametrize(
+        "rId, expected_value", (("rId1", 2), ("rId2", 1), ("rId3", 0))
+    )
+    def it_knows_the_reference_count_of_a_rId_to_help(self, rId, expected_value):
+        sld = element(
+            "p:sld/(p:a{r:id=rId1},p:b{r:id=rId2}/p:c{r:id=rId1,r:embed=rId3})"
+        )
+        xml_part = XmlPart(None, None, None, sld)
+        assert xml_part._rel_ref_count(rId) == expected_value
+
 
 class DescribePartFactory(object):
     """Unit-test suite for `pptx.opc.package.PartFactory` objects."""
 
     def it_constructs_custom_part_type_for_registered_content_types(
-        self, request, package_, part_
+        self, request, monkeypatch, package_, part_
     ):
         SlidePart_ = class_mock(request, "pptx.opc.package.XmlPart")
         SlidePart_.load.return_value = part_
         partname = PackURI("/ppt/slides/slide7.xml")
-        PartFactory.part_type_for[CT.PML_SLIDE] = SlidePart_
+        monkeypatch.setitem(PartFactory.part_type_for, CT.PML_SLIDE, SlidePart_)
 
         part = PartFactory(partname, CT.PML_SLIDE, package_, b"blob")
 
@@ -639,6 +1086,134 @@ class Describe_ContentTypeMap(object):
         )
 
 
+class Describe_PartIndex(object):
+    """Unit-test suite for `pptx.opc.package._PartIndex` objects."""
+
+    def it_indexes_the_parts_reachable_from_the_package(self, graph):
+        package, prs, slide, image, orphan = graph
+        part_index = package._part_index
+
+        assert "/ppt/presentation.xml" in part_index
+        assert "/ppt/slides/slide1.xml" in part_index
+        assert "/ppt/orphan1.xml" not in part_index
+        assert part_index.parts_with_reltypes((RT.IMAGE,)) == [image]
+        assert part_index.parts_with_reltypes((RT.SLIDE, RT.IMAGE)) == [slide, image]
+        assert part_index.idx_count("/ppt/slides/slide") == 1
+        assert part_index.idx_count("/ppt/charts/chart") == 0
+
+    def it_adds_parts_made_reachable_by_a_new_relationship(self, graph):
+        package, prs, slide, image, orphan = graph
+        part_index = package._part_index
+        assert "/ppt/orphan1.xml" not in part_index
+        slide_2 = Part(PackURI("/ppt/slides/slide2.xml"), None, package)
+        slide_2.relate_to(orphan, RT.CHART)
+
+        assert "/ppt/slides/slide2.xml" not in part_index
+        prs.relate_to(slide_2, RT.SLIDE)
+
+        assert "/ppt/slides/slide2.xml" in part_index
+        assert "/ppt/orphan1.xml" in part_index
+        assert part_index.parts_with_reltypes((RT.SLIDE,)) == [slide, slide_2]
+        assert part_index.parts_with_reltypes((RT.CHART,)) == [orphan]
+
+    def it_rebuilds_after_an_internal_relationship_is_dropped(self, graph):
+        package, prs, slide, image, orphan = graph
+        part_index = package._part_index
+        assert "/ppt/media/image3.png" in part_index
+
+        slide.drop_rel("rId1")
+
+        assert "/ppt/media/image3.png" not in part_index
+        assert part_index.parts_with_reltypes((RT.IMAGE,)) == []
+
+    def it_follows_the_partname_changes_of_its_parts(self, graph):
+        package, prs, slide, image, orphan = graph
+        part_index = package._part_index
+        assert part_index.next_available_idx("/ppt/media/image") == 1
+
+        image.partname = PackURI("/ppt/media/image1.png")
+
+        assert "/ppt/media/image3.png" not in part_index
+        assert "/ppt/media/image1.png" in part_index
+        assert part_index.next_available_idx("/ppt/media/image") == 2
+
+    def it_knows_whether_a_part_is_in_the_package(self, graph):
+        package, prs, slide, image, orphan = graph
+        part_index = package._part_index
+        assert part_index.contains_part(image) is True
+        assert part_index.contains_part(orphan) is False
+
+        slide.drop_rel("rId1")
+
+        assert part_index.contains_part(image) is False
+
+    def it_keeps_a_partname_while_another_part_still_has_it(self, graph):
+        package, prs, slide, image, orphan = graph
+        slide_2 = Part(PackURI("/ppt/slides/slide2.xml"), None, package)
+        prs.relate_to(slide_2, RT.SLIDE)
+        part_index = package._part_index
+        assert "/ppt/slides/slide2.xml" in part_index
+
+        # --- swap partnames, as reordering slides does, one part at a time ---
+        slide.partname = PackURI("/ppt/slides/slide2.xml")
+        slide_2.partname = PackURI("/ppt/slides/slide1.xml")
+
+        assert "/ppt/slides/slide1.xml" in part_index
+        assert "/ppt/slides/slide2.xml" in part_index
+        assert part_index.idx_count("/ppt/slides/slide") == 2
+        assert package.next_partname("/ppt/slides/slide%d.xml") == (
+            "/ppt/slides/slide3.xml"
+        )
+
+    def it_finds_the_next_available_idx(self):
+        package = OpcPackage(None)
+        for n in (1, 2, 4):
+            package.relate_to(
+                Part(PackURI("/ppt/media/image%d.png" % n), None, package), RT.IMAGE
+            )
+        part_index = package._part_index
+
+        assert part_index.next_available_idx("/ppt/media/image") == 3
+        package.relate_to(
+            Part(PackURI("/ppt/media/image3.png"), None, package), RT.IMAGE
+        )
+        assert part_index.next_available_idx("/ppt/media/image") == 5
+        assert part_index.next_available_idx("/ppt/media/media") == 1
+
+    @pytest.mark.parametrize(
+        "partname, expected_value",
+        (
+            ("/ppt/slides/slide12.xml", ("/ppt/slides/slide", 12)),
+            ("/ppt/embeddings/Excel_Sheet3.xlsx", ("/ppt/embeddings/Excel_Sheet", 3)),
+            ("/ppt/media/image7", ("/ppt/media/image", 7)),
+            ("/ppt/presentation.xml", ("/ppt/presentation.xml", None)),
+            ("/ppt/42.xml", ("/ppt/42.xml", None)),
+        ),
+    )
+    def it_splits_a_partname_into_prefix_and_idx_to_help(
+        self, partname, expected_value
+    ):
+        assert _PartIndex._split_partname(partname) == expected_value
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def graph(self):
+        package = OpcPackage(None)
+        prs = XmlPart(PackURI("/ppt/presentation.xml"), None, package, element("p:x"))
+        slide = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"), None, package, element("p:sld")
+        )
+        image = Part(PackURI("/ppt/media/image3.png"), None, package)
+        orphan = Part(PackURI("/ppt/orphan1.xml"), None, package)
+        package.relate_to(prs, RT.OFFICE_DOCUMENT)
+        prs.relate_to(slide, RT.SLIDE)
+        slide.relate_to(image, RT.IMAGE)
+        slide.relate_to(prs, RT.SLIDE_MASTER)
+        slide.relate_to("http://url", RT.HYPERLINK, is_external=True)
+        return package, prs, slide, image, orphan
+
+
 class Describe_Relationships(object):
     """Unit-test suite for `pptx.opc.package._Relationships` objects."""
 
@@ -744,6 +1319,51 @@ class Describe_Relationships(object):
             call("/ppt/slides", xml_rels[1], parts),
         ]
         assert relationships._rels == {"rId1": rels_[0], "rId2": rels_[1]}
+        assert relationships._rels_by_reltype[rels_[0].reltype] == [rels_[0]]
+        assert relationships._rels_by_reltype[rels_[1].reltype] == [rels_[1]]
+
+    def it_can_load_copies_of_the_relationships_in_another_collection(
+        self, request
+    ):
+        part_, part_2_, clone_, clone_2_ = (
+            instance_mock(request, Part) for _ in range(4)
+        )
+        rels = _Relationships("/ppt")
+        rels._add_relationship(RT.SLIDE, part_)
+        rels._add_relationship(RT.HYPERLINK, "http://url", is_external=True)
+        rels._add_relationship(RT.SLIDE, part_2_)
+        rels.pop("rId1")
+        relationships = _Relationships("/ppt/slides")
+        relationships._add_relationship(RT.IMAGE, clone_)
+
+        relationships.load_from_rels(rels, {part_: clone_, part_2_: clone_2_})
+
+        assert sorted(relationships._rels) == ["rId2", "rId3"]
+        assert relationships["rId2"].target_ref == "http://url"
+        assert relationships["rId2"].is_external is True
+        assert relationships["rId3"].reltype == RT.SLIDE
+        assert relationships["rId3"].target_part is clone_2_
+        assert relationships._rels_by_reltype[RT.IMAGE] == []
+        assert relationships._get_matching(RT.SLIDE, clone_2_) == "rId3"
+
+    def it_can_load_the_relationships_in_a_snapshot(self, request):
+        part_, part_2_ = (instance_mock(request, Part) for _ in range(2))
+        relationships = _Relationships("/ppt/slides")
+        relationships._add_relationship(RT.IMAGE, part_)
+
+        relationships.load_from_snapshot(
+            (
+                ("rId2", RT.HYPERLINK, True, "http://url"),
+                ("rId3", RT.SLIDE_LAYOUT, False, 1),
+            ),
+            [part_, part_2_],
+        )
+
+        assert sorted(relationships._rels) == ["rId2", "rId3"]
+        assert relationships["rId2"].target_ref == "http://url"
+        assert relationships["rId3"].target_part is part_2_
+        assert relationships.part_with_reltype(RT.SLIDE_LAYOUT) is part_2_
+        assert relationships._get_matching(RT.IMAGE, part_) is None
 
     def it_can_find_a_part_with_reltype(
         self, _rels_by_reltype_prop_, relationship_, part_
@@ -881,6 +1501,7 @@ class Describe_Relationships(object):
                     request,
                     _Relationship,
                     rId=rId,
+                    reltype=RT.SLIDE,
                     target_part=target_part,
                     target_ref=ref,
                     is_external=external,
@@ -943,6 +1564,53 @@ class Describe_Relationships(object):
         assert rels["rId4"] in rels_by_reltype[RT.HYPERLINK]
         assert rels_by_reltype[RT.CHART] == []
 
+    def it_keeps_its_indexes_current_as_relationships_are_added_and_removed(
+        self, request
+    ):
+        part_, part_2_ = (instance_mock(request, Part) for _ in range(2))
+        relationships = _Relationships("/ppt/slides")
+        rId = relationships.get_or_add(RT.IMAGE, part_)
+        assert relationships._rels_by_reltype[RT.IMAGE][0].rId == rId
+
+        rId_2 = relationships.get_or_add(RT.IMAGE, part_2_)
+        rId_3 = relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url")
+
+        assert relationships.get_or_add(RT.IMAGE, part_2_) == rId_2
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url") == rId_3
+        assert relationships._rIds_by_target == {
+            (RT.IMAGE, part_, False): rId,
+            (RT.IMAGE, part_2_, False): rId_2,
+            (RT.HYPERLINK, "http://url", True): rId_3,
+        }
+
+        relationships.pop(rId)
+
+        assert [r.rId for r in relationships._rels_by_reltype[RT.IMAGE]] == [rId_2]
+        assert relationships._get_matching(RT.IMAGE, part_) is None
+        assert relationships.get_or_add(RT.IMAGE, part_) == rId
+
+    def and_it_indexes_a_duplicate_relationship_when_the_first_is_removed(
+        self, request, part_
+    ):
+        rels = {
+            "rId%d" % (i + 1): instance_mock(
+                request,
+                _Relationship,
+                rId="rId%d" % (i + 1),
+                reltype=RT.IMAGE,
+                target_part=part_,
+                is_external=False,
+            )
+            for i in range(2)
+        }
+        relationships = _Relationships(None)
+        relationships._rels.update(rels)
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId1"
+
+        relationships.pop("rId1")
+
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId2"
+
     # fixture components -----------------------------------
 
     @pytest.fixture
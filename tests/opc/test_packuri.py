@@ -10,11 +10,29 @@ from pptx.opc.packuri import PackURI
 class DescribePackURI(object):
     """Unit-test suite for the `pptx.opc.packuri.PackURI` objects."""
 
-    def it_can_construct_from_relative_ref(self):
-        pack_uri = PackURI.from_rel_ref(
-            "/ppt/slides", "../slideLayouts/slideLayout1.xml"
-        )
-        assert pack_uri == "/ppt/slideLayouts/slideLayout1.xml"
+    @pytest.mark.parametrize(
+        "base_uri, relative_ref, expected_value",
+        (
+            (
+                "/ppt/slides",
+                "../slideLayouts/slideLayout1.xml",
+                "/ppt/slideLayouts/slideLayout1.xml",
+            ),
+            ("/ppt", "slides/slide1.xml", "/ppt/slides/slide1.xml"),
+            ("/", "ppt/presentation.xml", "/ppt/presentation.xml"),
+            ("/", "../docProps/core.xml", "/docProps/core.xml"),
+            ("/ppt/slides", "../../media/image1.png", "/media/image1.png"),
+            ("/ppt/slides", "./../media//image1.png", "/ppt/media/image1.png"),
+            ("/ppt/slides", "/ppt/media/image1.png", "/ppt/media/image1.png"),
+        ),
+    )
+    def it_can_construct_from_relative_ref(
+        self, base_uri, relative_ref, expected_value
+    ):
+        pack_uri = PackURI.from_rel_ref(base_uri, relative_ref)
+
+        assert isinstance(pack_uri, PackURI)
+        assert pack_uri == expected_value
 
     def it_should_raise_on_construct_with_bad_pack_uri_str(self):
         with pytest.raises(ValueError):
@@ -94,3 +112,11 @@ class DescribePackURI(object):
     )
     def it_knows_the_uri_of_its_rels_part(self, uri, expected_value):
         assert PackURI(uri).rels_uri == expected_value
+
+    def it_computes_its_derived_values_only_once(self):
+        pack_uri = PackURI("/ppt/slides/slide1.xml")
+
+        rels_uri = pack_uri.rels_uri
+
+        assert rels_uri == "/ppt/slides/_rels/slide1.xml.rels"
+        assert pack_uri.rels_uri is rels_uri
@@ -4,23 +4,37 @@
 
 import hashlib
 import pytest
+import sys
 import zipfile
+import zlib
 
 from pptx.compat import BytesIO
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.oxml import serialize_part_xml
 from pptx.opc.package import Part, _Relationships
 from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from pptx.opc.serialized import (
+    CompressionPolicy,
+    DeferredBlob,
+    FileBlob,
     PackageReader,
     PackageWriter,
     _ContentTypesItem,
     _DirPkgReader,
+    _DirPkgWriter,
+    _LazyZipPkgReader,
     _PhysPkgReader,
     _PhysPkgWriter,
+    _StreamPkgWriter,
     _ZipPkgReader,
     _ZipPkgWriter,
+    _CAN_STREAM_MEMBERS,
+    _can_compress_at_level,
+    _can_copy_raw,
+    _check_raw_copy,
 )
+from pptx.oxml import parse_xml
 
 from ..unitutil.file import absjoin, snippet_text, test_file_dir
 from ..unitutil.mock import (
@@ -32,6 +46,7 @@ from ..unitutil.mock import (
     instance_mock,
     method_mock,
     property_mock,
+    var_mock,
 )
 
 
@@ -39,6 +54,17 @@ test_pptx_path = absjoin(test_file_dir, "test.pptx")
 dir_pkg_path = absjoin(test_file_dir, "expanded_pptx")
 zip_pkg_path = test_pptx_path
 
+requires_compression_level = pytest.mark.skipif(
+    not _can_compress_at_level(),
+    reason="compression level not supported in this version of Python",
+)
+requires_raw_copy = pytest.mark.skipif(
+    not _can_copy_raw(), reason="raw zip member copying does not work in this Python"
+)
+requires_streaming = pytest.mark.skipif(
+    not _CAN_STREAM_MEMBERS, reason="ZipFile cannot write a member in chunks"
+)
+
 
 class DescribePackageReader(object):
     """Unit-test suite for `pptx.opc.serialized.PackageReader` objects."""
@@ -68,6 +94,24 @@ class DescribePackageReader(object):
 
         assert package_reader.rels_xml_for(PackURI("/ppt/slides.slide1.xml")) is None
 
+    def it_can_provide_a_deferred_blob_for_a_partname(self, _blob_reader_prop_):
+        _blob_reader_prop_.return_value = {"/ppt/slides/slide1.xml": b"blob"}
+        package_reader = PackageReader(None)
+
+        deferred_blob = package_reader.deferred_blob("/ppt/slides/slide1.xml")
+
+        assert isinstance(deferred_blob, DeferredBlob)
+        assert deferred_blob.load() == b"blob"
+
+    def it_can_close_its_blob_reader(self, request, _blob_reader_prop_):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        _blob_reader_prop_.return_value = phys_pkg_reader_
+        package_reader = PackageReader(None)
+
+        package_reader.close()
+
+        phys_pkg_reader_.close.assert_called_once_with()
+
     def it_constructs_its_blob_reader_to_help(self, request):
         phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
         _PhysPkgReader_ = class_mock(request, "pptx.opc.serialized._PhysPkgReader")
@@ -76,7 +120,7 @@ class DescribePackageReader(object):
 
         blob_reader = package_reader._blob_reader
 
-        _PhysPkgReader_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgReader_.factory.assert_called_once_with("prs.pptx", lazy=False)
         assert blob_reader is phys_pkg_reader_
 
     # fixture components -----------------------------------
@@ -96,7 +140,7 @@ class DescribePackageWriter(object):
         PackageWriter.write("prs.pptx", relationships_, ("part_1", "part_2"))
 
         _init_.assert_called_once_with(
-            ANY, "prs.pptx", relationships_, ("part_1", "part_2")
+            ANY, "prs.pptx", relationships_, ("part_1", "part_2"), None, None
         )
         _write_.assert_called_once_with(ANY)
 
@@ -113,7 +157,7 @@ class DescribePackageWriter(object):
 
         package_writer._write()
 
-        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx", None)
         _write_content_types_stream_.assert_called_once_with(
             package_writer, phys_writer_
         )
@@ -124,17 +168,13 @@ class DescribePackageWriter(object):
         _ContentTypesItem_ = class_mock(
             request, "pptx.opc.serialized._ContentTypesItem"
         )
-        _ContentTypesItem_.xml_for.return_value = "part_xml"
-        serialize_part_xml_ = function_mock(
-            request, "pptx.opc.serialized.serialize_part_xml", return_value=b"xml"
-        )
+        _ContentTypesItem_.xml_for.return_value = b"xml"
         package_writer = PackageWriter(None, None, ("part_1", "part_2"))
 
         package_writer._write_content_types_stream(phys_writer_)
 
         _ContentTypesItem_.xml_for.assert_called_once_with(("part_1", "part_2"))
-        serialize_part_xml_.assert_called_once_with("part_xml")
-        phys_writer_.write.assert_called_once_with(CONTENT_TYPES_URI, b"xml")
+        phys_writer_.write.assert_called_once_with(CONTENT_TYPES_URI, b"xml", CT.XML)
 
     def it_can_write_a_sequence_of_parts(self, request, phys_writer_):
         parts_ = (
@@ -142,7 +182,9 @@ class DescribePackageWriter(object):
                 request,
                 Part,
                 partname=PackURI("/ppt/%s.xml" % x),
+                content_type="ct_%s" % x,
                 blob="blob_%s" % x,
+                deferred_blob=None,
                 rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
             )
             for x in ("a", "b", "c")
@@ -152,21 +194,69 @@ class DescribePackageWriter(object):
         package_writer._write_parts(phys_writer_)
 
         assert phys_writer_.write.call_args_list == [
-            call("/ppt/a.xml", "blob_a"),
-            call("/ppt/_rels/a.xml.rels", "rels_xml_a"),
-            call("/ppt/b.xml", "blob_b"),
-            call("/ppt/_rels/b.xml.rels", "rels_xml_b"),
-            call("/ppt/c.xml", "blob_c"),
-            call("/ppt/_rels/c.xml.rels", "rels_xml_c"),
+            call("/ppt/a.xml", "blob_a", "ct_a"),
+            call("/ppt/_rels/a.xml.rels", "rels_xml_a", CT.OPC_RELATIONSHIPS),
+            call("/ppt/b.xml", "blob_b", "ct_b"),
+            call("/ppt/_rels/b.xml.rels", "rels_xml_b", CT.OPC_RELATIONSHIPS),
+            call("/ppt/c.xml", "blob_c", "ct_c"),
+            call("/ppt/_rels/c.xml.rels", "rels_xml_c", CT.OPC_RELATIONSHIPS),
         ]
 
+    def it_can_write_parts_using_worker_threads(self, request, phys_writer_):
+        parts_ = tuple(
+            instance_mock(
+                request,
+                Part,
+                partname=PackURI("/ppt/%s.xml" % x),
+                content_type="ct_%s" % x,
+                blob="blob_%s" % x,
+                deferred_blob=None,
+                rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
+            )
+            for x in ("a", "b", "c")
+        )
+        phys_writer_.prepare.side_effect = lambda *args: args
+        package_writer = PackageWriter(None, None, parts_, workers=3)
+
+        package_writer._write_parts(phys_writer_)
+
+        assert phys_writer_.write_prepared.call_args_list == [
+            call(("/ppt/a.xml", "blob_a", "ct_a")),
+            call(("/ppt/_rels/a.xml.rels", "rels_xml_a", CT.OPC_RELATIONSHIPS)),
+            call(("/ppt/b.xml", "blob_b", "ct_b")),
+            call(("/ppt/_rels/b.xml.rels", "rels_xml_b", CT.OPC_RELATIONSHIPS)),
+            call(("/ppt/c.xml", "blob_c", "ct_c")),
+            call(("/ppt/_rels/c.xml.rels", "rels_xml_c", CT.OPC_RELATIONSHIPS)),
+        ]
+
+    def but_it_writes_a_deferred_blob_as_such(self, request, phys_writer_):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/media/image1.png"),
+            content_type=CT.PNG,
+            deferred_blob=deferred_blob_,
+            _rels=None,
+        )
+        package_writer = PackageWriter(None, None, (part_,))
+
+        package_writer._write_parts(phys_writer_)
+
+        phys_writer_.write_deferred.assert_called_once_with(
+            "/ppt/media/image1.png", deferred_blob_, CT.PNG
+        )
+        phys_writer_.write.assert_not_called()
+
     def it_can_write_a_pkg_rels_item(self, request, phys_writer_, relationships_):
         relationships_.xml = b"pkg-rels-xml"
         package_writer = PackageWriter(None, relationships_, None)
 
         package_writer._write_pkg_rels(phys_writer_)
 
-        phys_writer_.write.assert_called_once_with("/_rels/.rels", b"pkg-rels-xml")
+        phys_writer_.write.assert_called_once_with(
+            "/_rels/.rels", b"pkg-rels-xml", CT.OPC_RELATIONSHIPS
+        )
 
     # fixture components -----------------------------------
 
@@ -179,6 +269,49 @@ class DescribePackageWriter(object):
         return instance_mock(request, _Relationships)
 
 
+class DescribeCompressionPolicy(object):
+    """Unit-test suite for `pptx.opc.serialized.CompressionPolicy` objects."""
+
+    @pytest.mark.parametrize(
+        "content_type, expected_value",
+        (
+            (CT.JPEG, (zipfile.ZIP_STORED, None)),
+            (CT.MP4, (zipfile.ZIP_STORED, None)),
+            (CT.SML_SHEET, (zipfile.ZIP_STORED, None)),
+            (CT.PML_SLIDE, (zipfile.ZIP_DEFLATED, None)),
+            (CT.BMP, (zipfile.ZIP_DEFLATED, None)),
+        ),
+    )
+    def it_stores_precompressed_content_types_by_default(
+        self, content_type, expected_value
+    ):
+        assert CompressionPolicy().compression_for(content_type) == expected_value
+
+    @requires_compression_level
+    def it_can_be_configured_with_stored_patterns_and_a_level(self):
+        policy = CompressionPolicy(stored=("image/*",), level=1)
+
+        assert policy.compression_for(CT.BMP) == (zipfile.ZIP_STORED, None)
+        assert policy.compression_for(CT.MP4) == (zipfile.ZIP_DEFLATED, 1)
+        assert policy.compression_for(CT.XML) == (zipfile.ZIP_DEFLATED, 1)
+
+    def but_it_rejects_a_level_this_python_cannot_apply(self, request):
+        function_mock(
+            request, "pptx.opc.serialized._can_compress_at_level", return_value=False
+        )
+
+        with pytest.raises(ValueError) as e:
+            CompressionPolicy(level=1)
+
+        assert str(e.value) == (
+            "compression level is not supported in this version of Python"
+        )
+        assert CompressionPolicy().compression_for(CT.XML) == (
+            zipfile.ZIP_DEFLATED,
+            None,
+        )
+
+
 class Describe_PhysPkgReader(object):
     """Unit-test suite for `pptx.opc.serialized._PhysPkgReader` objects."""
 
@@ -215,6 +348,19 @@ class Describe_PhysPkgReader(object):
         _ZipPkgReader_.assert_called_once_with(pkg_file_path)
         assert phys_reader is zip_pkg_reader_
 
+    def and_it_constructs_LazyZipPkgReader_when_lazy_is_specified(self, request):
+        lazy_zip_pkg_reader_ = instance_mock(request, _LazyZipPkgReader)
+        _LazyZipPkgReader_ = class_mock(
+            request,
+            "pptx.opc.serialized._LazyZipPkgReader",
+            return_value=lazy_zip_pkg_reader_,
+        )
+
+        phys_reader = _PhysPkgReader.factory(zip_pkg_path, lazy=True)
+
+        _LazyZipPkgReader_.assert_called_once_with(zip_pkg_path)
+        assert phys_reader is lazy_zip_pkg_reader_
+
     def but_it_raises_when_pkg_path_is_not_a_package(self):
         with pytest.raises(PackageNotFoundError) as e:
             _PhysPkgReader.factory("foobar")
@@ -251,6 +397,15 @@ class Describe_DirPkgReader(object):
             dir_pkg_reader[PackURI("/ppt/foobar.xml")]
         assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
 
+    def it_can_read_a_member_in_chunks(self, dir_pkg_reader):
+        pack_uri = PackURI("/ppt/presentation.xml")
+
+        size, chunks = dir_pkg_reader.member_chunks(pack_uri)
+
+        blob = b"".join(chunks)
+        assert blob == dir_pkg_reader[pack_uri]
+        assert size == len(blob)
+
     # --- fixture components -------------------------------
 
     @pytest.fixture(scope="class")
@@ -291,20 +446,225 @@ class Describe_ZipPkgReader(object):
         return _ZipPkgReader(zip_pkg_path)
 
 
+class Describe_LazyZipPkgReader(object):
+    """Unit-test suite for `pptx.opc.serialized._LazyZipPkgReader` objects."""
+
+    def it_knows_whether_it_contains_a_partname(self, zip_pkg_reader):
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        assert PackURI("/ppt/foobar.xml") not in zip_pkg_reader
+
+    def it_can_get_a_blob_by_partname(self, zip_pkg_reader):
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+        assert hashlib.sha1(blob).hexdigest() == (
+            "efa7bee0ac72464903a67a6744c1169035d52a54"
+        )
+
+    def but_it_raises_KeyError_when_requested_member_is_not_present(
+        self, zip_pkg_reader
+    ):
+        with pytest.raises(KeyError) as e:
+            zip_pkg_reader[PackURI("/ppt/foobar.xml")]
+        assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
+
+    def it_can_read_a_member_in_chunks(self, zip_pkg_reader):
+        pack_uri = PackURI("/ppt/presentation.xml")
+
+        size, chunks = zip_pkg_reader.member_chunks(pack_uri)
+
+        blob = b"".join(chunks)
+        assert blob == zip_pkg_reader[pack_uri]
+        assert size == len(blob)
+
+    @requires_raw_copy
+    def it_provides_the_stored_form_of_a_member(self, zip_pkg_reader):
+        zinfo, chunks = zip_pkg_reader.raw_member(PackURI("/ppt/presentation.xml"))
+
+        raw = b"".join(chunks)
+        assert zinfo.filename == "ppt/presentation.xml"
+        assert len(raw) == zinfo.compress_size
+        blob = zlib.decompress(raw, -15)
+        assert hashlib.sha1(blob).hexdigest() == (
+            "efa7bee0ac72464903a67a6744c1169035d52a54"
+        )
+
+    def but_not_when_raw_copying_does_not_work(self, request, zip_pkg_reader):
+        function_mock(request, "pptx.opc.serialized._can_copy_raw", return_value=False)
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/presentation.xml")) is None
+
+    def it_can_close_its_zip_archive(self):
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+
+        zip_pkg_reader.close()
+
+        assert zip_pkg_reader._zipf.fp is None
+        with pytest.raises((RuntimeError, ValueError)):
+            zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+    def it_does_not_inflate_members_until_they_are_requested(self, request):
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        read_ = method_mock(request, zipfile.ZipFile, "read")
+
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        assert read_.call_count == 0
+
+    # --- fixture components -------------------------------
+
+    @pytest.fixture(scope="class")
+    def zip_pkg_reader(self, request):
+        return _LazyZipPkgReader(zip_pkg_path)
+
+
 class Describe_PhysPkgWriter(object):
     """Unit-test suite for `pptx.opc.serialized._PhysPkgWriter` objects."""
 
-    def it_constructs_ZipPkgWriter_unconditionally(self, request):
+    @pytest.mark.parametrize("pkg_file", ("prs.pptx", BytesIO()))
+    def it_constructs_ZipPkgWriter_for_a_path_or_seekable_stream(
+        self, request, pkg_file
+    ):
         zip_pkg_writer_ = instance_mock(request, _ZipPkgWriter)
         _ZipPkgWriter_ = class_mock(
             request, "pptx.opc.serialized._ZipPkgWriter", return_value=zip_pkg_writer_
         )
 
-        phys_writer = _PhysPkgWriter.factory("prs.pptx")
+        phys_writer = _PhysPkgWriter.factory(pkg_file)
 
-        _ZipPkgWriter_.assert_called_once_with("prs.pptx")
+        _ZipPkgWriter_.assert_called_once_with(pkg_file, None)
         assert phys_writer is zip_pkg_writer_
 
+    def and_it_constructs_DirPkgWriter_for_a_directory_path(self, request):
+        dir_pkg_writer_ = instance_mock(request, _DirPkgWriter)
+        _DirPkgWriter_ = class_mock(
+            request, "pptx.opc.serialized._DirPkgWriter", return_value=dir_pkg_writer_
+        )
+
+        phys_writer = _PhysPkgWriter.factory(dir_pkg_path)
+
+        _DirPkgWriter_.assert_called_once_with(dir_pkg_path)
+        assert phys_writer is dir_pkg_writer_
+
+    def and_it_constructs_StreamPkgWriter_for_a_stream_that_cannot_seek(
+        self, request
+    ):
+        stream_pkg_writer_ = instance_mock(request, _StreamPkgWriter)
+        _StreamPkgWriter_ = class_mock(
+            request,
+            "pptx.opc.serialized._StreamPkgWriter",
+            return_value=stream_pkg_writer_,
+        )
+        stream = _UnseekableStream()
+
+        phys_writer = _PhysPkgWriter.factory(stream)
+
+        _StreamPkgWriter_.assert_called_once_with(stream, None)
+        assert phys_writer is stream_pkg_writer_
+
+    def it_writes_a_prepared_member_as_given_by_default(self, request):
+        write_ = method_mock(request, _DirPkgWriter, "write")
+        pkg_writer = _DirPkgWriter("dir")
+
+        member = pkg_writer.prepare("/ppt/foo.xml", b"blob", CT.XML)
+        pkg_writer.write_prepared(member)
+
+        write_.assert_called_once_with(pkg_writer, "/ppt/foo.xml", b"blob", CT.XML)
+
+
+class DescribeDeferredBlob(object):
+    """Unit-test suite for `pptx.opc.serialized.DeferredBlob` objects."""
+
+    def it_can_load_the_bytes_it_refers_to(self, phys_reader_):
+        phys_reader_.__getitem__.return_value = b"blob"
+        deferred_blob = DeferredBlob(phys_reader_, "/ppt/media/image1.png")
+
+        blob = deferred_blob.load()
+
+        phys_reader_.__getitem__.assert_called_once_with("/ppt/media/image1.png")
+        assert blob == b"blob"
+
+    def it_provides_access_to_the_stored_form_of_its_member(self, phys_reader_):
+        phys_reader_.raw_member.return_value = ("zinfo", "chunks")
+        deferred_blob = DeferredBlob(phys_reader_, "/ppt/media/image1.png")
+
+        raw_member = deferred_blob.raw_member()
+
+        phys_reader_.raw_member.assert_called_once_with("/ppt/media/image1.png")
+        assert raw_member == ("zinfo", "chunks")
+
+    def it_provides_access_to_its_bytes_in_chunks(self, phys_reader_):
+        phys_reader_.member_chunks.return_value = (42, "chunks")
+        deferred_blob = DeferredBlob(phys_reader_, "/ppt/media/image1.png")
+
+        member_chunks = deferred_blob.member_chunks()
+
+        phys_reader_.member_chunks.assert_called_once_with("/ppt/media/image1.png")
+        assert member_chunks == (42, "chunks")
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def phys_reader_(self, request):
+        return instance_mock(request, _LazyZipPkgReader)
+
+
+class DescribeFileBlob(object):
+    """Unit-test suite for `pptx.opc.serialized.FileBlob` objects."""
+
+    def it_can_load_the_bytes_of_its_file(self, tmpdir):
+        path = tmpdir.join("movie.mp4")
+        path.write_binary(b"foobar")
+
+        assert FileBlob(str(path)).load() == b"foobar"
+
+    def it_provides_access_to_the_bytes_of_its_file_in_chunks(self, tmpdir):
+        path = tmpdir.join("movie.mp4")
+        path.write_binary(b"foobar")
+
+        size, chunks = FileBlob(str(path)).member_chunks()
+
+        assert size == 6
+        assert b"".join(chunks) == b"foobar"
+
+    def but_it_has_no_stored_form(self):
+        assert FileBlob("movie.mp4").raw_member() is None
+
+
+class Describe_DirPkgWriter(object):
+    """Unit-test suite for `pptx.opc.serialized._DirPkgWriter` objects."""
+
+    def it_has_an__enter__method_for_context_management(self):
+        pkg_writer = _DirPkgWriter("dir")
+        assert pkg_writer.__enter__() is pkg_writer
+
+    def it_can_write_a_blob(self, tmpdir):
+        pkg_writer = _DirPkgWriter(str(tmpdir))
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"blob")
+        pkg_writer.write(PackURI("/[Content_Types].xml"), b"types")
+
+        assert tmpdir.join("ppt", "slides", "slide1.xml").read_binary() == b"blob"
+        assert tmpdir.join("[Content_Types].xml").read_binary() == b"types"
+
+    def it_can_write_a_deferred_blob(self, request, tmpdir):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.member_chunks.return_value = 6, iter((b"foo", b"bar"))
+        pkg_writer = _DirPkgWriter(str(tmpdir))
+
+        pkg_writer.write_deferred(PackURI("/ppt/media/media1.mp4"), deferred_blob_)
+
+        assert tmpdir.join("ppt", "media", "media1.mp4").read_binary() == b"foobar"
+        deferred_blob_.load.assert_not_called()
+
+    def it_writes_a_package_a_DirPkgReader_can_read(self, tmpdir):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+
+        with _DirPkgWriter(str(tmpdir)) as pkg_writer:
+            for pack_uri, blob in zip_pkg_reader._blobs.items():
+                pkg_writer.write(pack_uri, blob)
+
+        dir_pkg_reader = _DirPkgReader(str(tmpdir))
+        for pack_uri, blob in zip_pkg_reader._blobs.items():
+            assert dir_pkg_reader[pack_uri] == blob
+
 
 class Describe_ZipPkgWriter(object):
     """Unit-test suite for `pptx.opc.serialized._ZipPkgWriter` objects."""
@@ -329,6 +689,184 @@ class Describe_ZipPkgWriter(object):
         assert len(members) == 1
         assert members[pack_uri] == b"blob"
 
+    @requires_compression_level
+    @pytest.mark.parametrize(
+        "content_type, expected_compress_type",
+        ((CT.PNG, zipfile.ZIP_STORED), (CT.PML_SLIDE, zipfile.ZIP_DEFLATED)),
+    )
+    def it_compresses_according_to_its_compression_policy(
+        self, _zipf_prop_, content_type, expected_compress_type
+    ):
+        _zipf_prop_.return_value = zipf = zipfile.ZipFile(BytesIO(), "w")
+        pkg_writer = _ZipPkgWriter(None, CompressionPolicy(level=1))
+
+        pkg_writer.write(PackURI("/ppt/foo.bar"), b"blob" * 100, content_type)
+
+        zinfo = zipf.getinfo("ppt/foo.bar")
+        assert zinfo.compress_type == expected_compress_type
+        assert zipf.read("ppt/foo.bar") == b"blob" * 100
+
+    @pytest.mark.parametrize(
+        "compression, expected_compress_type",
+        (
+            (None, zipfile.ZIP_DEFLATED),
+            pytest.param(
+                {"level": 1}, zipfile.ZIP_DEFLATED, marks=requires_compression_level
+            ),
+            ({"stored": ("*",)}, zipfile.ZIP_STORED),
+        ),
+    )
+    def it_can_prepare_a_member_in_advance_and_write_it_later(
+        self, _zipf_prop_, compression, expected_compress_type
+    ):
+        """Integrates with zipfile.ZipFile."""
+        pack_uri = PackURI("/part/name.xml")
+        zipf = zipfile.ZipFile(BytesIO(), "w", compression=zipfile.ZIP_DEFLATED)
+        _zipf_prop_.return_value = zipf
+        pkg_writer = _ZipPkgWriter(
+            None, None if compression is None else CompressionPolicy(**compression)
+        )
+
+        member = pkg_writer.prepare(pack_uri, b"blob" * 100, CT.XML)
+        assert zipf.namelist() == []
+        pkg_writer.write_prepared(member)
+
+        zinfo = zipf.getinfo("part/name.xml")
+        assert zinfo.compress_type == expected_compress_type
+        assert zipf.read("part/name.xml") == b"blob" * 100
+
+    @requires_raw_copy
+    def it_copies_the_stored_form_of_a_deferred_blob(self, _zipf_prop_):
+        """Integrates with zipfile.ZipFile."""
+        pack_uri = PackURI("/ppt/media/image9.png")
+        _zipf_prop_.return_value = zipf = zipfile.ZipFile(BytesIO(), "w")
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        deferred_blob = DeferredBlob(zip_pkg_reader, PackURI("/ppt/presentation.xml"))
+        pkg_writer = _ZipPkgWriter(None)
+
+        pkg_writer.write_deferred(pack_uri, deferred_blob)
+
+        src_zinfo = zip_pkg_reader._zipf.getinfo("ppt/presentation.xml")
+        zinfo = zipf.getinfo("ppt/media/image9.png")
+        assert zinfo.compress_type == src_zinfo.compress_type
+        assert zinfo.compress_size == src_zinfo.compress_size
+        assert zinfo.CRC == src_zinfo.CRC
+        assert zipf.read("ppt/media/image9.png") == deferred_blob.load()
+
+    def but_it_recompresses_a_deferred_blob_when_its_policy_differs(
+        self, request, _zipf_prop_
+    ):
+        _zipf_prop_.return_value = zipf = zipfile.ZipFile(BytesIO(), "w")
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        deferred_blob = DeferredBlob(zip_pkg_reader, PackURI("/ppt/presentation.xml"))
+        pkg_writer = _ZipPkgWriter(None, CompressionPolicy(stored=("*",)))
+
+        pkg_writer.write_deferred(PackURI("/ppt/a.xml"), deferred_blob, CT.XML)
+
+        assert zipf.getinfo("ppt/a.xml").compress_type == zipfile.ZIP_STORED
+        assert zipf.read("ppt/a.xml") == deferred_blob.load()
+
+    @requires_streaming
+    @pytest.mark.parametrize(
+        "compression, expected_compress_type",
+        (
+            (None, zipfile.ZIP_DEFLATED),
+            (CompressionPolicy(stored=("video/*",)), zipfile.ZIP_STORED),
+        ),
+    )
+    def but_it_streams_the_bytes_when_no_stored_form_is_available(
+        self, request, _zipf_prop_, compression, expected_compress_type
+    ):
+        _zipf_prop_.return_value = zipf = zipfile.ZipFile(BytesIO(), "w")
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.raw_member.return_value = None
+        deferred_blob_.member_chunks.return_value = 9, iter((b"foo", b"bar", b"baz"))
+        pkg_writer = _ZipPkgWriter(None, compression)
+
+        pkg_writer.write_deferred(
+            PackURI("/ppt/media/media1.mp4"), deferred_blob_, CT.MP4
+        )
+
+        deferred_blob_.load.assert_not_called()
+        zinfo = zipf.getinfo("ppt/media/media1.mp4")
+        assert zinfo.compress_type == expected_compress_type
+        assert zinfo.file_size == 9
+        assert zipf.read("ppt/media/media1.mp4") == b"foobarbaz"
+
+    @pytest.mark.parametrize(
+        "can_stream, compression",
+        (
+            (False, None),
+            pytest.param(
+                True, {"stored": (), "level": 9}, marks=requires_compression_level
+            ),
+        ),
+    )
+    def but_it_writes_the_bytes_whole_when_they_cannot_be_streamed(
+        self, request, _zipf_prop_, can_stream, compression
+    ):
+        var_mock(request, "pptx.opc.serialized._CAN_STREAM_MEMBERS", new=can_stream)
+        zipf = zipfile.ZipFile(BytesIO(), "w", compression=zipfile.ZIP_DEFLATED)
+        _zipf_prop_.return_value = zipf
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.raw_member.return_value = None
+        deferred_blob_.load.return_value = b"foobarbaz"
+        pkg_writer = _ZipPkgWriter(
+            None, None if compression is None else CompressionPolicy(**compression)
+        )
+
+        pkg_writer.write_deferred(
+            PackURI("/ppt/media/media1.mp4"), deferred_blob_, CT.MP4
+        )
+
+        deferred_blob_.member_chunks.assert_not_called()
+        assert zipf.getinfo("ppt/media/media1.mp4").compress_type == (
+            zipfile.ZIP_DEFLATED
+        )
+        assert zipf.read("ppt/media/media1.mp4") == b"foobarbaz"
+
+    def it_writes_copied_and_compressed_members_to_a_valid_zip_file(self, tmpdir):
+        """Integrates with zipfile.ZipFile, fails when its internals change."""
+        pkg_path = str(tmpdir.join("copy.pptx"))
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        partnames = sorted(zip_pkg_reader._membernames)
+
+        with _ZipPkgWriter(pkg_path) as pkg_writer:
+            for idx, partname in enumerate(partnames):
+                pack_uri = PackURI(partname)
+                deferred_blob = DeferredBlob(zip_pkg_reader, pack_uri)
+                if idx % 2:
+                    pkg_writer.write_deferred(pack_uri, deferred_blob)
+                else:
+                    pkg_writer.write_prepared(
+                        pkg_writer.prepare(pack_uri, deferred_blob.load())
+                    )
+
+        zipf = zipfile.ZipFile(pkg_path)
+        assert zipf.testzip() is None
+        for partname in partnames:
+            assert zipf.read(partname[1:]) == zip_pkg_reader[PackURI(partname)]
+
+    def but_it_recompresses_members_when_raw_copying_does_not_work(
+        self, request, _zipf_prop_
+    ):
+        function_mock(request, "pptx.opc.serialized._can_copy_raw", return_value=False)
+        _zipf_prop_.return_value = zipf = zipfile.ZipFile(BytesIO(), "w")
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        deferred_blob = DeferredBlob(zip_pkg_reader, PackURI("/ppt/presentation.xml"))
+        pkg_writer = _ZipPkgWriter(None)
+        _write_raw_ = method_mock(request, _ZipPkgWriter, "_write_raw")
+
+        pkg_writer.write_deferred(PackURI("/ppt/a.xml"), deferred_blob, CT.XML)
+        member = pkg_writer.prepare(PackURI("/ppt/b.xml"), b"blob", CT.XML)
+        pkg_writer.write_prepared(member)
+
+        _write_raw_.assert_not_called()
+        assert member == (PackURI("/ppt/b.xml"), b"blob", CT.XML)
+        assert zipf.testzip() is None
+        assert zipf.read("ppt/a.xml") == deferred_blob.load()
+        assert zipf.read("ppt/b.xml") == b"blob"
+
     def it_provides_access_to_the_open_zip_file_to_help(self, request):
         ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
         pkg_writer = _ZipPkgWriter("prs.pptx")
@@ -347,6 +885,59 @@ class Describe_ZipPkgWriter(object):
         return property_mock(request, _ZipPkgWriter, "_zipf")
 
 
+class Describe_can_copy_raw(object):
+    """Unit-test suite for `pptx.opc.serialized._can_copy_raw()`."""
+
+    def it_finds_whether_raw_copying_works_in_this_python(self):
+        """Fails loudly when `zipfile` internals no longer work as relied on.
+
+        They differ in Python 2, where members are always recompressed.
+        """
+        assert _check_raw_copy() is (sys.version_info >= (3, 6))
+
+    def but_not_when_raw_copying_raises(self, request):
+        method_mock(
+            request, _ZipPkgWriter, "_write_raw", side_effect=AttributeError("fp")
+        )
+        assert _check_raw_copy() is False
+
+    def but_not_when_a_raw_copied_member_reads_back_differently(self, request):
+        method_mock(
+            request, _LazyZipPkgReader, "_iter_raw_chunks", return_value=iter(())
+        )
+        assert _check_raw_copy() is False
+
+    def it_checks_only_once(self, request):
+        var_mock(request, "pptx.opc.serialized._raw_copy_works", new=None)
+        _check_raw_copy_ = function_mock(
+            request, "pptx.opc.serialized._check_raw_copy", return_value=True
+        )
+
+        assert _can_copy_raw() is True
+        assert _can_copy_raw() is True
+
+        _check_raw_copy_.assert_called_once_with()
+
+
+class Describe_StreamPkgWriter(object):
+    """Unit-test suite for `pptx.opc.serialized._StreamPkgWriter` objects."""
+
+    def it_can_write_a_package_to_a_stream_that_cannot_seek(self):
+        """Integrates with zipfile.ZipFile."""
+        stream = _UnseekableStream()
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        deferred_blob = DeferredBlob(zip_pkg_reader, PackURI("/ppt/presentation.xml"))
+
+        with _StreamPkgWriter(stream) as pkg_writer:
+            pkg_writer.write(PackURI("/part/name.xml"), b"blob")
+            pkg_writer.write_deferred(PackURI("/ppt/presentation.xml"), deferred_blob)
+
+        zipf = zipfile.ZipFile(BytesIO(stream.getvalue()))
+        assert zipf.testzip() is None
+        assert zipf.read("part/name.xml") == b"blob"
+        assert zipf.read("ppt/presentation.xml") == deferred_blob.load()
+
+
 class Describe_ContentTypesItem(object):
     """Unit-test suite for `pptx.opc.serialized._ContentTypesItem` objects."""
 
@@ -373,17 +964,17 @@ class Describe_ContentTypesItem(object):
             return_value=(defaults, overrides),
         )
 
-        content_types = _ContentTypesItem(None)._xml
+        content_types_xml = _ContentTypesItem(None)._xml
 
-        assert content_types.xml == snippet_text("content-types-xml").strip()
+        assert content_types_xml == serialize_part_xml(
+            parse_xml(snippet_text("content-types-xml"))
+        )
 
-    def it_computes_defaults_and_overrides_to_help(self, request):
+    def it_computes_defaults_and_overrides_to_help(self):
         parts = (
-            instance_mock(
-                request, Part, partname=PackURI(partname), content_type=content_type
-            )
+            Part(PackURI(partname), content_type, None)
             for partname, content_type in (
-                ("/media/image1.png", CT.PNG),
+                ("/media/image1.PNG", CT.PNG),
                 ("/ppt/slides/slide1.xml", CT.PML_SLIDE),
                 ("/foo/bar.xml", CT.XML),
                 ("/docProps/core.xml", CT.OPC_CORE_PROPERTIES),
@@ -398,3 +989,24 @@ class Describe_ContentTypesItem(object):
             "/ppt/slides/slide1.xml": CT.PML_SLIDE,
             "/docProps/core.xml": CT.OPC_CORE_PROPERTIES,
         }
+
+
+# --------------------------------------------------------------------
+# static fixture
+# --------------------------------------------------------------------
+
+
+class _UnseekableStream(object):
+    """Stand-in for a write-only stream like a socket or HTTP response."""
+
+    def __init__(self):
+        self._buffer = BytesIO()
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+    def seekable(self):
+        return False
+
+    def write(self, data):
+        return self._buffer.write(data)
@@ -96,6 +96,19 @@ class DescribeCT_GroupShape(object):
         x, y, cx, cy = xSp._child_extents
         assert (x, y, cx, cy) == expected_values
 
+    @pytest.mark.parametrize(
+        "spTree_cxml, expected_value",
+        (
+            ("p:spTree", 0),
+            ("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}", 1),
+            ("p:spTree/(p:cNvPr{id=6},p:grpSp/p:cNvPr{id=42},p:cNvPr{id=9})", 42),
+            ("p:spTree/(p:cNvPr{id=6},p:foo{id=bar},p:cNvPr{id=9})", 9),
+            ("p:spTree/(p:cNvPr{id=6},p:foo{id=-7},p:cNvPr{id=9})", 9),
+        ),
+    )
+    def it_knows_the_largest_id_in_use(self, spTree_cxml, expected_value):
+        assert element(spTree_cxml).max_shape_id == expected_value
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
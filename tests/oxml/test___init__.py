@@ -6,11 +6,19 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 
 from __future__ import print_function, unicode_literals
 
+import threading
+
 import pytest
 
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
+from pptx.oxml import (
+    _thread_parser,
+    oxml_parser,
+    parse_prototype,
+    parse_xml,
+    register_element_cls,
+)
 from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
@@ -31,6 +39,22 @@ class DescribeParseXml(object):
         fromstring.assert_called_once_with(mock_xml_bytes, mock_oxml_parser)
         assert element is fromstring.return_value
 
+    def it_uses_a_parser_of_its_own_on_other_threads(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        results = []
+
+        def parse():
+            results.append((parse_xml(xml_bytes), _thread_parser.parser))
+
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+
+        foo, parser = results[0]
+        assert parser is not None
+        assert parser is not oxml_parser
+        assert type(foo) is CustElmCls
+
     def it_prefers_to_parse_bytes(self, xml_bytes):
         parse_xml(xml_bytes)
 
@@ -49,6 +73,35 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeParsePrototype(object):
+    def it_returns_a_new_copy_of_the_parsed_xml_on_each_call(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+
+        foo = parse_prototype(xml_bytes)
+        foo_2 = parse_prototype(xml_bytes)
+
+        assert type(foo) is CustElmCls
+        assert foo is not foo_2
+        assert etree.tostring(foo) == etree.tostring(foo_2)
+
+    def it_parses_each_xml_string_only_once(self, request, xml_bytes):
+        var_mock(request, "pptx.oxml._prototypes", new={})
+        parse_xml_ = function_mock(
+            request, "pptx.oxml.parse_xml", side_effect=parse_xml
+        )
+        parse_prototype(xml_bytes)
+
+        parse_prototype(xml_bytes)
+
+        parse_xml_.assert_called_once_with(xml_bytes)
+
+    def it_does_not_change_the_prototype_when_a_copy_is_changed(self, xml_bytes):
+        foo = parse_prototype(xml_bytes)
+        foo.find(qn("a:bar")).text = "barfoo"
+
+        assert parse_prototype(xml_bytes).find(qn("a:bar")).text == "foobar"
+
+
 class DescribeRegisterCustomElementClass(object):
     def it_determines_cust_elm_class_constructed_for_specified_tag(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
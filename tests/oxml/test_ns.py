@@ -56,6 +56,10 @@ class DescribeQn(object):
     ):
         assert qn(nsptag_str) == clark_name
 
+    def it_computes_each_clark_name_only_once(self, nsptag_str):
+        clark_name = qn(nsptag_str)
+        assert qn(nsptag_str) is clark_name
+
 
 # ===========================================================================
 # fixtures
@@ -8,7 +8,10 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from pptx.oxml.presentation import CT_SlideIdList
+
 from ..unitutil.cxml import element, xml
+from ..unitutil.mock import method_mock
 
 
 class DescribeCT_SlideIdList(object):
@@ -17,6 +20,40 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId("rId1")
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_a_batch_of_sldId_elements(self):
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId4,id=300}")
+
+        sldIds = sldIdLst.add_sldIds(["rId1", "rId2"])
+
+        assert sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId4,id=300},p:sldId{r:id=rId1,id=301},p:sldId"
+            "{r:id=rId2,id=302})"
+        )
+        assert sldIds == sldIdLst.sldId_lst[1:]
+
+    def it_remembers_the_largest_slide_id_it_allocated(self, request):
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId4,id=300}")
+        sldIdLst.add_sldId("rId5")
+        xpath_ = method_mock(request, CT_SlideIdList, "xpath")
+
+        sldId = sldIdLst.add_sldId("rId6")
+
+        xpath_.assert_not_called()
+        assert sldId.id == 302
+
+    def but_it_examines_the_slide_ids_again_when_slides_were_added_or_removed(self):
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId4,id=300}")
+        sldIdLst.add_sldId("rId5")
+        sldIdLst.append(element("p:sldId{r:id=rId9,id=900}"))
+
+        sldId = sldIdLst.add_sldId("rId6")
+        sldIdLst.remove(sldIdLst[-2])
+        sldIdLst.remove(sldIdLst[-1])
+        next_id = sldIdLst._next_id
+
+        assert sldId.id == 901
+        assert next_id == 302
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
@@ -10,9 +10,11 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from lxml import etree
+
 from pptx.exc import InvalidXmlError
-from pptx.oxml import register_element_cls
-from pptx.oxml.ns import qn
+from pptx.oxml import parse_xml, register_element_cls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
@@ -24,6 +26,7 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    _xpaths,
 )
 
 from ..unitdata import BaseBuilder
@@ -34,6 +37,54 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeBaseOxmlElement(object):
+    def it_evaluates_xpath_with_the_standard_namespace_mapping(self):
+        spTree = parse_xml(
+            "<p:spTree %s><p:sp/><p:pic/><p:sp/></p:spTree>" % nsdecls("p")
+        )
+        assert spTree.xpath("./p:sp") == spTree.findall(qn("p:sp"))
+        assert spTree.xpath("count(./p:*)") == 3.0
+
+    @pytest.mark.parametrize(
+        "children, expected_idx",
+        (
+            ("", 0),
+            ("<p:sp/><p:pic/>", 2),
+            ("<p:sp/><p:extLst/>", 1),
+            ("<p:sp/><p:sp/><p:extLst/><p:ext/>", 2),
+            ("<p:sp/><!-- comment --><p:extLst/>", 1),
+        ),
+    )
+    def it_can_insert_an_element_before_its_successors(self, children, expected_idx):
+        spTree = parse_xml("<p:spTree %s>%s</p:spTree>" % (nsdecls("p"), children))
+        cxnSp = parse_xml("<p:cxnSp %s/>" % nsdecls("p"))
+
+        returned = spTree.insert_element_before(cxnSp, "p:extLst", "p:ext")
+
+        assert returned is cxnSp
+        assert list(spTree.iterchildren(etree.Element)).index(cxnSp) == expected_idx
+
+    def it_compiles_each_xpath_expression_only_once(self):
+        spTree = parse_xml("<p:spTree %s><p:sp/></p:spTree>" % nsdecls("p"))
+        spTree.xpath("./p:sp[1]")
+        compiled = _xpaths["./p:sp[1]"]
+
+        spTree.xpath("./p:sp[1]")
+
+        assert _xpaths["./p:sp[1]"] is compiled
+
+    def it_empties_the_xpath_registry_when_it_is_full(self, monkeypatch):
+        monkeypatch.setattr("pptx.oxml.xmlchemy._XPATH_CACHE_MAX", 2)
+        spTree = parse_xml("<p:spTree %s><p:sp/></p:spTree>" % nsdecls("p"))
+        _xpaths.clear()
+        spTree.xpath("./p:sp[1]")
+        spTree.xpath("./p:sp[2]")
+
+        spTree.xpath("./p:sp[3]")
+
+        assert list(_xpaths) == ["./p:sp[3]"]
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
@@ -3,6 +3,7 @@
 """Unit test suite for `pptx.parts.media` module."""
 
 from pptx.media import Video
+from pptx.opc.serialized import DeferredBlob, FileBlob
 from pptx.package import Package
 from pptx.parts.media import MediaPart
 
@@ -13,7 +14,7 @@ class DescribeMediaPart(object):
     """Unit-test suite for `pptx.parts.media.MediaPart` objects."""
 
     def it_can_construct_from_a_media_object(self, request):
-        media_ = instance_mock(request, Video)
+        media_ = instance_mock(request, Video, deferred_blob=None, sha1="1234")
         _init_ = initializer_mock(request, MediaPart)
         package_ = instance_mock(request, Package)
         package_.next_media_partname.return_value = "media42.mp4"
@@ -23,11 +24,36 @@ class DescribeMediaPart(object):
 
         package_.next_media_partname.assert_called_once_with(media_.ext)
         _init_.assert_called_once_with(
-            media_part, "media42.mp4", media_.content_type, package_, media_.blob
+            media_part,
+            "media42.mp4",
+            media_.content_type,
+            package_,
+            media_.blob,
+            sha1="1234",
         )
         assert isinstance(media_part, MediaPart)
 
+    def and_it_refers_to_the_media_file_when_the_media_has_one(self, request):
+        file_blob_ = instance_mock(request, FileBlob)
+        media_ = instance_mock(request, Video, deferred_blob=file_blob_, sha1="1234")
+        package_ = instance_mock(request, Package)
+        package_.next_media_partname.return_value = "media42.mp4"
+
+        media_part = MediaPart.new(package_, media_)
+
+        assert media_part.deferred_blob is file_blob_
+        assert media_part.sha1 == "1234"
+        file_blob_.load.assert_not_called()
+
     def it_knows_the_sha1_hash_of_the_media(self):
         assert MediaPart(None, None, None, b"blobish-bytes").sha1 == (
             "61efc464c21e54cfc1382fb5b6ef7512e141ceae"
         )
+
+    def and_it_hashes_a_deferred_blob_in_chunks(self, request):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        deferred_blob_.member_chunks.return_value = 13, iter((b"blobish", b"-bytes"))
+        media_part = MediaPart(None, None, None, deferred_blob_)
+
+        assert media_part.sha1 == "61efc464c21e54cfc1382fb5b6ef7512e141ceae"
+        deferred_blob_.load.assert_not_called()
@@ -5,6 +5,7 @@
 import pytest
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _PartIndex
 from pptx.opc.packuri import PackURI
 from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
@@ -127,9 +128,15 @@ class DescribePresentationPart(object):
             PackURI("/ppt/slides/slide%d.xml" % (i + 1)) for i in range(len(rIds))
         ]
 
+    def it_can_close_the_package(self, package_):
+        PresentationPart(None, None, package_, None).close()
+        package_.close.assert_called_once_with()
+
     def it_can_save_the_package_to_a_file(self, package_):
         PresentationPart(None, None, package_, None).save("prs.pptx")
-        package_.save.assert_called_once_with("prs.pptx")
+        package_.save.assert_called_once_with(
+            "prs.pptx", compression=None, workers=None, prune=False
+        )
 
     def it_can_add_a_new_slide(
         self, request, package_, slide_part_, slide_, relate_to_
@@ -153,6 +160,42 @@ class DescribePresentationPart(object):
         assert rId == "rId42"
         assert slide is slide_
 
+    def it_can_add_a_batch_of_new_slides(self, request, package_, relate_to_):
+        slide_layout_ = instance_mock(request, SlideLayout)
+        slide_parts_ = [instance_mock(request, SlidePart) for _ in range(2)]
+        SlidePart_ = class_mock(request, "pptx.parts.presentation.SlidePart")
+        SlidePart_.new.side_effect = iter(slide_parts_)
+        relate_to_.side_effect = iter(("rId8", "rId9"))
+        property_mock(
+            request,
+            PresentationPart,
+            "_next_slide_partname",
+            side_effect=iter(
+                (PackURI("/ppt/slides/slide2.xml"), PackURI("/ppt/slides/slide3.xml"))
+            ),
+        )
+        sld = element("p:sld/p:cSld")
+        prs_part = PresentationPart(None, None, package_, None)
+
+        rIds_and_slides = prs_part.add_slides(slide_layout_, 2, sld)
+
+        new_calls = SlidePart_.new.call_args_list
+        assert [c[0] for c in new_calls] == [
+            ("/ppt/slides/slide2.xml", package_, slide_layout_.part),
+            ("/ppt/slides/slide3.xml", package_, slide_layout_.part),
+        ]
+        slds = [c[1]["sld"] for c in new_calls]
+        assert all(s is not sld and s.xml == sld.xml for s in slds)
+        assert slds[0] is not slds[1]
+        assert prs_part.relate_to.call_args_list == [
+            call(prs_part, slide_parts_[0], RT.SLIDE),
+            call(prs_part, slide_parts_[1], RT.SLIDE),
+        ]
+        assert rIds_and_slides == [
+            ("rId8", slide_parts_[0].slide),
+            ("rId9", slide_parts_[1].slide),
+        ]
+
     def it_finds_the_slide_id_of_a_slide_part(self, slide_part_, related_part_):
         prs_elm = element(
             "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
@@ -198,11 +241,18 @@ class DescribePresentationPart(object):
 
         assert slide == expected_value
 
-    def it_knows_the_next_slide_partname_to_help(self):
-        prs_elm = element("p:presentation/p:sldIdLst/(p:sldId,p:sldId)")
-        prs_part = PresentationPart(None, None, None, prs_elm)
+    def it_knows_the_next_slide_partname_to_help(self, request):
+        part_index_ = instance_mock(request, _PartIndex)
+        part_index_.next_available_idx.return_value = 3
+        property_mock(
+            request, PresentationPart, "_part_index", return_value=part_index_
+        )
+        prs_part = PresentationPart(None, None, None, None)
+
+        partname = prs_part._next_slide_partname
 
-        assert prs_part._next_slide_partname == PackURI("/ppt/slides/slide3.xml")
+        part_index_.next_available_idx.assert_called_once_with("/ppt/slides/slide")
+        assert partname == PackURI("/ppt/slides/slide3.xml")
 
     # fixture components ---------------------------------------------
 
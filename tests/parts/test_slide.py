@@ -2,8 +2,12 @@
 
 """Unit-test suite for `pptx.parts.slide` module."""
 
+import copy
+
 import pytest
 
+from pptx.api import Presentation
+
 from pptx.chart.data import ChartData
 from pptx.enum.chart import XL_CHART_TYPE as XCT
 from pptx.enum.shapes import PROG_ID
@@ -77,6 +81,95 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId == "rId6"
 
+    @pytest.mark.parametrize(
+        "spTree_cxml, expected_ids",
+        (
+            ("p:spTree/p:nvSpPr", (1, 2)),
+            ("p:spTree/p:nvSpPr/p:cNvPr{id=0}", (1, 2)),
+            ("p:spTree/p:nvSpPr/p:cNvPr{id=2}", (3, 4)),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})", (4, 5)),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})", (3, 4)),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})", (3, 4)),
+            (
+                "p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:"
+                "cNvPr{id=1},p:cNvPr{id=4})",
+                (5, 6),
+            ),
+        ),
+    )
+    def it_assigns_the_id_for_each_new_shape(self, spTree_cxml, expected_ids):
+        sld = element("p:sld/p:cSld/%s" % spTree_cxml)
+        slide_part = BaseSlidePart(None, None, None, sld)
+
+        ids = slide_part.next_shape_id(), slide_part.next_shape_id()
+
+        assert ids == expected_ids
+
+    def it_sees_shapes_added_by_any_means(self):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=6},p:grpSp/p:nvGrpSpPr/p"
+            ":cNvPr{id=7})"
+        )
+        slide_part = BaseSlidePart(None, None, None, sld)
+        spTree = sld.cSld.spTree
+        assert slide_part.next_shape_id() == 8
+
+        spTree.xpath("p:grpSp")[0].append(element("p:sp/p:nvSpPr/p:cNvPr{id=42}"))
+        assert slide_part.next_shape_id() == 43
+
+        spTree.remove(spTree.xpath("p:sp")[0])
+        spTree.append(element("p:sp/p:nvSpPr/p:cNvPr{id=99}"))
+        assert slide_part.next_shape_id() == 100
+
+    def it_assigns_unique_ids_after_shapes_are_copied_into_the_slide(self):
+        """Integrates with the shapes collection of a slide."""
+        prs = Presentation()
+        shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        for _ in range(3):
+            shapes.add_textbox(0, 0, 0, 0)
+        for shape_id, shape in zip((5, 6, 7), list(shapes)):
+            sp = copy.deepcopy(shape._element)
+            sp.nvSpPr.cNvPr.id = shape_id
+            shapes._spTree.append(sp)
+
+        textbox = shapes.add_textbox(0, 0, 0, 0)
+
+        assert [shape.shape_id for shape in shapes] == [2, 3, 4, 5, 6, 7, 8]
+        assert textbox.shape_id == 8
+
+    @pytest.mark.parametrize(
+        "basename, numpart, expected_name",
+        (
+            ("Content Placeholder", 2, "Content Placeholder 2"),
+            ("Table Placeholder", 3, "Table Placeholder 4"),
+            ("Vertical Table Placeholder", 6, "Vertical Table Placeholder 6"),
+            ("Title", 1, "Title 2"),
+        ),
+    )
+    def it_chooses_a_unique_shape_name(self, basename, numpart, expected_name):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeh"
+            "older 3})"
+        )
+        slide_part = BaseSlidePart(None, None, None, sld)
+        assert slide_part.unique_shape_name(basename, numpart) == expected_name
+
+    def it_sees_shapes_added_or_renamed_by_any_means(self):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Title 1},p:grpSp/p"
+            ":nvGrpSpPr/p:cNvPr{id=3,name=Group 2})"
+        )
+        slide_part = BaseSlidePart(None, None, None, sld)
+        assert slide_part.unique_shape_name("Title", 1) == "Title 2"
+
+        sld.xpath("//p:cNvPr")[0].set("name", "Title 2")
+        sld.cSld.spTree.xpath("p:grpSp")[0].append(
+            element("p:sp/p:nvSpPr/p:cNvPr{id=4,name=Title 3}")
+        )
+
+        assert slide_part.unique_shape_name("Title", 1) == "Title 1"
+        assert slide_part.unique_shape_name("Title", 2) == "Title 4"
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -402,6 +495,21 @@ class DescribeSlidePart(object):
         )
         assert isinstance(slide_part, SlidePart)
 
+    def but_it_can_contain_a_provided_slide_element(
+        self, request, package_, relate_to_
+    ):
+        partname = PackURI("/foobar.xml")
+        _init_ = initializer_mock(request, SlidePart)
+        CT_Slide_ = class_mock(request, "pptx.parts.slide.CT_Slide")
+        sld = element("p:sld")
+
+        slide_part = SlidePart.new(partname, package_, None, sld=sld)
+
+        _init_.assert_called_once_with(
+            slide_part, partname, CT.PML_SLIDE, package_, sld
+        )
+        CT_Slide_.new.assert_not_called()
+
     def it_provides_access_to_its_slide(self, slide_fixture):
         slide_part, Slide_, sld, slide_ = slide_fixture
         slide = slide_part.slide
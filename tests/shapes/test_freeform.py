@@ -329,10 +329,13 @@ class DescribeFreeformBuilder(object):
         return builder, expected_value
 
     @pytest.fixture
-    def sp_fixture(self, _left_prop_, _top_prop_, _width_prop_, _height_prop_):
+    def sp_fixture(
+        self, request, _left_prop_, _top_prop_, _width_prop_, _height_prop_
+    ):
         origin_x, origin_y = 42, 24
         spTree = element("p:spTree")
         shapes = SlideShapes(spTree, None)
+        method_mock(request, SlideShapes, "_next_shape_id", return_value=1)
         _left_prop_.return_value, _top_prop_.return_value = 12, 34
         _width_prop_.return_value, _height_prop_.return_value = 56, 78
 
@@ -133,9 +133,12 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
-    def it_can_clone_a_placeholder(self, clone_ph_fixture):
+    def it_can_clone_a_placeholder(self, clone_ph_fixture, slide_part_):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
+        slide_part_.unique_shape_name.assert_called_once_with(
+            "Vertical Chart Placeholder", 0
+        )
         assert shapes._element.xml == expected_xml
 
     def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
@@ -148,19 +151,34 @@ class Describe_BaseShapes(object):
         shapes.turbo_add_enabled = value
         assert shapes.turbo_add_enabled == expected_value
 
-    def it_finds_the_next_shape_id_to_help(self, next_id_fixture):
-        shapes, expected_value = next_id_fixture
-        assert shapes._next_shape_id == expected_value
+    def it_gets_the_next_shape_id_from_its_part_to_help(self, request):
+        slide_part_ = instance_mock(request, SlidePart)
+        slide_part_.next_shape_id.side_effect = [42, 43]
+        property_mock(request, _BaseShapes, "part", return_value=slide_part_)
+        shapes = _BaseShapes(None, None)
+
+        assert shapes._next_shape_id() == 42
+        assert shapes._next_shape_id() == 43
 
-    def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
-        shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
-        assert shapes._next_ph_name(ph_type, sp_id, orient) == expected_value
+    def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture, slide_part_):
+        shapes, ph_type, sp_id, orient, basename, numpart = ph_name_fixture
+        slide_part_.unique_shape_name.return_value = "Foo 42"
+
+        name = shapes._next_ph_name(ph_type, sp_id, orient)
+
+        slide_part_.unique_shape_name.assert_called_once_with(basename, numpart)
+        assert name == "Foo 42"
 
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def clone_ph_fixture(self, placeholder_):
+    def clone_ph_fixture(
+        self, placeholder_, _next_shape_id_, part_prop_, slide_part_
+    ):
         shapes = SlideShapes(element("p:spTree{a:b=c}"), None)
+        _next_shape_id_.return_value = 1
+        part_prop_.return_value = slide_part_
+        slide_part_.unique_shape_name.return_value = "Vertical Chart Placeholder 0"
         expected_xml = xml(
             "p:spTree{a:b=c}/p:sp/(p:nvSpPr/(p:cNvPr{id=1,name=Vertical Char"
             "t Placeholder 0},p:cNvSpPr/a:spLocks{noGrp=1},p:nvPr/p:ph{type="
@@ -210,52 +228,29 @@ class Describe_BaseShapes(object):
 
     @pytest.fixture(
         params=[
-            ("p:spTree/p:nvSpPr", 1),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=0}", 1),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=1}", 2),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=2}", 3),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})", 4),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})", 3),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})", 3),
-            (
-                "p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:"
-                "cNvPr{id=1},p:cNvPr{id=4})",
-                5,
-            ),
-        ]
-    )
-    def next_id_fixture(self, request):
-        spTree_cxml, expected_value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        return shapes, expected_value
-
-    @pytest.fixture(
-        params=[
-            (PP_PLACEHOLDER.OBJECT, 3, ST_Direction.HORZ, "Content Placeholder 2"),
-            (PP_PLACEHOLDER.TABLE, 4, ST_Direction.HORZ, "Table Placeholder 4"),
+            (PP_PLACEHOLDER.OBJECT, 3, ST_Direction.HORZ, "Content Placeholder", 2),
+            (PP_PLACEHOLDER.TABLE, 4, ST_Direction.HORZ, "Table Placeholder", 3),
             (
                 PP_PLACEHOLDER.TABLE,
                 7,
                 ST_Direction.VERT,
-                "Vertical Table Placeholder 6",
+                "Vertical Table Placeholder",
+                6,
             ),
-            (PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ, "Title 2"),
+            (PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ, "Title", 1),
         ]
     )
-    def ph_name_fixture(self, request):
-        ph_type, sp_id, orient, expected_name = request.param
-        spTree = element(
-            "p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder " "3})"
-        )
-        shapes = SlideShapes(spTree, None)
-        return shapes, ph_type, sp_id, orient, expected_name
+    def ph_name_fixture(self, request, part_prop_, slide_part_):
+        ph_type, sp_id, orient, basename, numpart = request.param
+        shapes = SlideShapes(element("p:spTree"), None)
+        part_prop_.return_value = slide_part_
+        return shapes, ph_type, sp_id, orient, basename, numpart
 
-    @pytest.fixture(params=[(None, False), (42, True)])
+    @pytest.fixture(params=[(False, False), (True, True)])
     def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
+        turbo_add_enabled, expected_value = request.param
         shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
+        shapes._turbo_add_enabled = turbo_add_enabled
         return shapes, expected_value
 
     @pytest.fixture(
@@ -287,6 +282,14 @@ class Describe_BaseShapes(object):
             autospec=True,
         )
 
+    @pytest.fixture
+    def _next_shape_id_(self, request):
+        return method_mock(request, _BaseShapes, "_next_shape_id")
+
+    @pytest.fixture
+    def part_prop_(self, request):
+        return property_mock(request, _BaseShapes, "part")
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, Shape)
@@ -295,6 +298,10 @@ class Describe_BaseShapes(object):
     def shape_(self, request):
         return instance_mock(request, BaseShape)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, SlidePart)
+
 
 class Describe_BaseGroupShapes(object):
     """Unit-test suite for `pptx.shapes.shapetree._BaseGroupShapes`."""
@@ -357,14 +364,14 @@ class Describe_BaseGroupShapes(object):
 
         group_shape = shapes.add_group_shape()
 
-        spTree.add_grpSp.assert_called_once_with(spTree)
+        spTree.add_grpSp.assert_called_once_with(spTree, 42)
         shapes._shape_factory.assert_called_once_with(shapes, grpSp)
         assert group_shape is group_shape_
 
     def it_can_add_an_ole_object(
-        self, request, _next_shape_id_prop_, _recalculate_extents_, _shape_factory_
+        self, request, _next_shape_id_, _recalculate_extents_, _shape_factory_
     ):
-        _next_shape_id_prop_.return_value = 42
+        _next_shape_id_.return_value = 42
         graphicFrame = element("p:graphicFrame")
         _OleObjectElementCreator_ = class_mock(
             request, "pptx.shapes.shapetree._OleObjectElementCreator"
@@ -476,8 +483,10 @@ class Describe_BaseGroupShapes(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def add_cht_gr_frm_fixture(self):
+    def add_cht_gr_frm_fixture(self, _next_shape_id_, part_prop_, slide_part_):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
+        _next_shape_id_.return_value = 1
+        part_prop_.return_value = slide_part_
         rId, x, y, cx, cy = "rId42", 1, 2, 3, 4
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -510,9 +519,11 @@ class Describe_BaseGroupShapes(object):
             ),
         ]
     )
-    def add_cxnSp_fixture(self, request):
+    def add_cxnSp_fixture(self, request, _next_shape_id_, part_prop_, slide_part_):
         begin_x, begin_y, end_x, end_y, spPr_cxml = request.param
         shapes = _BaseGroupShapes(element("p:spTree"), None)
+        _next_shape_id_.return_value = 1
+        part_prop_.return_value = slide_part_
         connector_type = MSO_CONNECTOR.STRAIGHT
         tmpl_cxml = (
             "p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=1,name=Connector 0},p:cNvCxnSp"
@@ -525,11 +536,14 @@ class Describe_BaseGroupShapes(object):
         return (shapes, connector_type, begin_x, begin_y, end_x, end_y, expected_xml)
 
     @pytest.fixture
-    def add_pic_fixture(self, image_part_, _next_shape_id_prop_):
+    def add_pic_fixture(
+        self, image_part_, _next_shape_id_, part_prop_, slide_part_
+    ):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
         rId, x, y, cx, cy = "rId24", 10, 11, 12, 13
 
-        _next_shape_id_prop_.return_value = 42
+        _next_shape_id_.return_value = 42
+        part_prop_.return_value = slide_part_
         image_part_.scale.return_value = (101, 102)
         image_part_.desc = "sprocket.jpg"
         expected_xml = (
@@ -550,11 +564,14 @@ class Describe_BaseGroupShapes(object):
         return shapes, image_part_, rId, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_sp_fixture(self, autoshape_type_, _next_shape_id_prop_):
+    def add_sp_fixture(
+        self, autoshape_type_, _next_shape_id_, part_prop_, slide_part_
+    ):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
         x, y, cx, cy = 8, 7, 6, 5
 
-        _next_shape_id_prop_.return_value = 7
+        _next_shape_id_.return_value = 7
+        part_prop_.return_value = slide_part_
         autoshape_type_.basename = "Rounded Rectangle"
         autoshape_type_.prst = "roundRect"
 
@@ -580,11 +597,12 @@ class Describe_BaseGroupShapes(object):
         return shapes, autoshape_type_, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_textbox_sp_fixture(self, _next_shape_id_prop_):
+    def add_textbox_sp_fixture(self, _next_shape_id_, part_prop_, slide_part_):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
         x, y, cx, cy = 1, 2, 3, 4
 
-        _next_shape_id_prop_.return_value = 6
+        _next_shape_id_.return_value = 6
+        part_prop_.return_value = slide_part_
 
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -647,10 +665,17 @@ class Describe_BaseGroupShapes(object):
         )
 
     @pytest.fixture
-    def group_fixture(self, CT_GroupShape_add_grpSp_, _shape_factory_, group_shape_):
+    def group_fixture(
+        self,
+        CT_GroupShape_add_grpSp_,
+        _next_shape_id_,
+        _shape_factory_,
+        group_shape_,
+    ):
         spTree = element("p:spTree{id=2e838acdc755e83113ed03904d2fe081f}")
         grpSp = element("p:grpSp{id=052874e154b48f9bec4266f80913cae38f}")
         shapes = _BaseGroupShapes(spTree, None)
+        _next_shape_id_.return_value = 42
 
         CT_GroupShape_add_grpSp_.return_value = grpSp
         _shape_factory_.return_value = group_shape_
@@ -689,8 +714,8 @@ class Describe_BaseGroupShapes(object):
         return shapes, shape_
 
     @pytest.fixture
-    def _next_shape_id_prop_(self, request):
-        return property_mock(request, _BaseGroupShapes, "_next_shape_id")
+    def _next_shape_id_(self, request):
+        return method_mock(request, _BaseGroupShapes, "_next_shape_id")
 
     @pytest.fixture
     def picture_fixture(
@@ -1311,7 +1336,7 @@ class DescribeSlideShapes(object):
         _add_video_timing_,
         _shape_factory_,
         movie_,
-        _next_shape_id_prop_,
+        _next_shape_id_,
     ):
         shapes = SlideShapes(element("p:spTree"), None)
         movie_file, x, y, cx, cy = "foobar.mp4", 1, 2, 3, 4
@@ -1319,7 +1344,7 @@ class DescribeSlideShapes(object):
         movie_pic = element("p:pic")
         _MoviePicElementCreator_.new_movie_pic.return_value = movie_pic
         _shape_factory_.return_value = movie_
-        shape_id_ = _next_shape_id_prop_.return_value
+        shape_id_ = _next_shape_id_.return_value
         return (
             shapes,
             movie_file,
@@ -1338,8 +1363,12 @@ class DescribeSlideShapes(object):
         )
 
     @pytest.fixture
-    def table_fixture(self, table_, _shape_factory_):
+    def table_fixture(self, request, table_, _shape_factory_):
         shapes = SlideShapes(element("p:spTree"), None)
+        method_mock(request, SlideShapes, "_next_shape_id", return_value=1)
+        property_mock(
+            request, SlideShapes, "part", return_value=instance_mock(request, SlidePart)
+        )
         rows, cols, x, y, cx, cy = 1, 2, 10, 11, 12, 13
         _shape_factory_.return_value = table_
         expected_xml = (
@@ -1404,8 +1433,8 @@ class DescribeSlideShapes(object):
         )
 
     @pytest.fixture
-    def _next_shape_id_prop_(self, request, shape_id_):
-        return property_mock(
+    def _next_shape_id_(self, request, shape_id_):
+        return method_mock(
             request, SlideShapes, "_next_shape_id", return_value=shape_id_
         )
 
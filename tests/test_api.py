@@ -6,22 +6,33 @@ Test suite for pptx.api module
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import io
 import os
+import shutil
+import zipfile
 
 import pytest
 
-from pptx.api import Presentation
+from pptx.api import Presentation, PresentationFactory
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
 
-from .unitutil.mock import class_mock, instance_mock
+from .unitutil.file import absjoin, test_file_dir
+from .unitutil.mock import (
+    class_mock,
+    function_mock,
+    initializer_mock,
+    instance_mock,
+    method_mock,
+)
 
 
 class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, lazy=False, workers=None)
         assert prs is prs_
 
     # fixtures -------------------------------------------------------
@@ -51,3 +62,173 @@ class DescribePresentation(object):
     @pytest.fixture
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
+
+
+class DescribePresentationFactory(object):
+    def it_loads_its_package_once(self, Package_, package_, prs_part_):
+        Package_.open.return_value = package_
+        package_.main_document_part = prs_part_
+        prs_part_.content_type = CT.PML_PRESENTATION_MAIN
+
+        factory = PresentationFactory("foo.pptx")
+
+        Package_.open.assert_called_once_with("foo.pptx", lazy=False, workers=None)
+        assert factory._package is package_
+        assert factory._pptx_copy is None
+
+    def it_loads_a_lazy_package_from_a_private_copy(
+        self, request, Package_, package_, prs_part_
+    ):
+        _private_copy_ = function_mock(request, "pptx.api._private_copy")
+        _private_copy_.return_value = pptx_copy = object()
+        Package_.open.return_value = package_
+        package_.main_document_part = prs_part_
+        prs_part_.content_type = CT.PML_PRESENTATION_MAIN
+        pptx_path = absjoin(test_file_dir, "test.pptx")
+
+        factory = PresentationFactory(pptx_path, lazy=True, workers=2)
+
+        _private_copy_.assert_called_once_with(pptx_path)
+        Package_.open.assert_called_once_with(pptx_copy, lazy=True, workers=2)
+        assert factory._pptx_copy is pptx_copy
+
+    def but_it_loads_an_expanded_package_in_full(
+        self, Package_, package_, prs_part_
+    ):
+        Package_.open.return_value = package_
+        package_.main_document_part = prs_part_
+        prs_part_.content_type = CT.PML_PRESENTATION_MAIN
+        pkg_dir = absjoin(test_file_dir, "expanded_pptx")
+
+        factory = PresentationFactory(pkg_dir, lazy=True)
+
+        Package_.open.assert_called_once_with(pkg_dir, lazy=False, workers=None)
+        assert factory._pptx_copy is None
+
+    def but_it_raises_when_that_is_not_a_presentation(
+        self, Package_, package_, prs_part_
+    ):
+        Package_.open.return_value = package_
+        package_.main_document_part = prs_part_
+        prs_part_.content_type = CT.WML_DOCUMENT_MAIN
+
+        with pytest.raises(ValueError) as e:
+            PresentationFactory("foo.docx")
+
+        assert str(e.value) == (
+            "file 'foo.docx' is not a PowerPoint file, content type is '%s'"
+            % CT.WML_DOCUMENT_MAIN
+        )
+
+    def it_provides_a_new_presentation_from_a_clone_of_its_package(
+        self, request, package_, prs_part_, prs_
+    ):
+        clone_ = instance_mock(request, Package)
+        package_.clone.return_value = clone_
+        clone_.main_document_part = prs_part_
+        prs_part_.presentation = prs_
+        initializer_mock(request, PresentationFactory)
+        factory = PresentationFactory("foo.pptx")
+        factory._package = package_
+
+        prs = factory()
+
+        package_.clone.assert_called_once_with()
+        assert prs is prs_
+
+    def it_can_be_restored_from_a_snapshot(self, Package_, package_):
+        Package_.from_snapshot.return_value = package_
+
+        factory = PresentationFactory.from_snapshot(b"snapshot")
+
+        Package_.from_snapshot.assert_called_once_with(b"snapshot")
+        assert isinstance(factory, PresentationFactory)
+        assert factory._package is package_
+
+    def it_can_close(self, request, package_):
+        pptx_copy_ = instance_mock(request, io.BytesIO)
+        initializer_mock(request, PresentationFactory)
+        factory = PresentationFactory("foo.pptx")
+        factory._package = package_
+        factory._pptx_copy = pptx_copy_
+
+        calls = []
+        package_.close.side_effect = lambda: calls.append("package")
+        pptx_copy_.close.side_effect = lambda: calls.append("pptx_copy")
+
+        factory.close()
+        factory.close()
+
+        package_.close.assert_called_once_with()
+        pptx_copy_.close.assert_called_once_with()
+        assert calls == ["package", "pptx_copy"]
+        with pytest.raises(ValueError) as e:
+            factory()
+        assert str(e.value) == "I/O operation on closed PresentationFactory"
+
+    def it_releases_the_package_file_when_closed(self):
+        factory = PresentationFactory(absjoin(test_file_dir, "test.pptx"), lazy=True)
+        package = factory._package
+        zipf = package._package_reader._blob_reader._zipf
+        pptx_copy = factory._pptx_copy
+
+        factory.close()
+
+        assert package._package_reader is None
+        assert zipf.fp is None
+        assert pptx_copy.closed
+        with pytest.raises(ValueError) as e:
+            factory()
+        assert str(e.value) == "I/O operation on closed PresentationFactory"
+
+    def it_closes_on_exit_from_a_context(self, request):
+        close_ = method_mock(request, PresentationFactory, "close")
+        initializer_mock(request, PresentationFactory)
+
+        with PresentationFactory("foo.pptx") as factory:
+            pass
+
+        close_.assert_called_once_with(factory)
+
+    def it_keeps_lazy_presentations_intact_when_one_is_saved_over_its_source(
+        self, tmpdir
+    ):
+        pptx_path = str(tmpdir.join("source.pptx"))
+        shutil.copy(absjoin(test_file_dir, "test.pptx"), pptx_path)
+
+        with PresentationFactory(pptx_path, lazy=True) as factory:
+            factory().save(pptx_path)
+            prs = factory()
+            prs.save(str(tmpdir.join("other.pptx")))
+            prs.close()
+
+        for filename in ("source.pptx", "other.pptx"):
+            with zipfile.ZipFile(str(tmpdir.join(filename))) as zipf:
+                assert zipf.testzip() is None
+        assert len(prs.slides) == len(Presentation(pptx_path).slides)
+
+    def it_can_take_a_snapshot_of_its_package(self, request, package_):
+        package_.snapshot.return_value = b"snapshot"
+        initializer_mock(request, PresentationFactory)
+        factory = PresentationFactory("foo.pptx")
+        factory._package = package_
+
+        assert factory.snapshot() == b"snapshot"
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def Package_(self, request):
+        return class_mock(request, "pptx.api.Package")
+
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, Package)
+
+    @pytest.fixture
+    def prs_(self, request):
+        return instance_mock(request, Presentation)
+
+    @pytest.fixture
+    def prs_part_(self, request):
+        return instance_mock(request, PresentationPart)
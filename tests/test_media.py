@@ -6,9 +6,16 @@ import pytest
 
 from pptx.compat import BytesIO
 from pptx.media import Video
+from pptx.opc.serialized import FileBlob
 
 from .unitutil.file import absjoin, test_file_dir
-from .unitutil.mock import initializer_mock, instance_mock, method_mock, property_mock
+from .unitutil.mock import (
+    class_mock,
+    initializer_mock,
+    instance_mock,
+    method_mock,
+    property_mock,
+)
 
 
 TEST_VIDEO_PATH = absjoin(test_file_dir, "dummy.mp4")
@@ -17,14 +24,15 @@ TEST_VIDEO_PATH = absjoin(test_file_dir, "dummy.mp4")
 class DescribeVideo(object):
     """Unit-test suite for `pptx.media.Video` objects."""
 
-    def it_can_construct_from_a_path(self, video_, from_blob_):
-        with open(TEST_VIDEO_PATH, "rb") as f:
-            blob = f.read()
+    def it_can_construct_from_a_path(self, request, video_, from_blob_):
+        file_blob_ = instance_mock(request, FileBlob)
+        FileBlob_ = class_mock(request, "pptx.media.FileBlob", return_value=file_blob_)
         from_blob_.return_value = video_
 
         video = Video.from_path_or_file_like(TEST_VIDEO_PATH, "video/mp4")
 
-        Video.from_blob.assert_called_once_with(blob, "video/mp4", "dummy.mp4")
+        FileBlob_.assert_called_once_with(TEST_VIDEO_PATH)
+        Video.from_blob.assert_called_once_with(file_blob_, "video/mp4", "dummy.mp4")
         assert video is video_
 
     def it_can_construct_from_a_stream(self, from_stream_fixture):
@@ -43,6 +51,19 @@ class DescribeVideo(object):
         video, expected_value = blob_fixture
         assert video.blob == expected_value
 
+    def and_it_reads_the_video_file_for_that_when_loaded_from_a_path(self):
+        video = Video(FileBlob(TEST_VIDEO_PATH), None, None)
+
+        with open(TEST_VIDEO_PATH, "rb") as f:
+            assert video.blob == f.read()
+
+    @pytest.mark.parametrize("is_file", (True, False))
+    def it_provides_access_to_its_deferred_blob(self, request, is_file):
+        blob = instance_mock(request, FileBlob) if is_file else b"blob"
+        video = Video(blob, None, None)
+
+        assert video.deferred_blob is (blob if is_file else None)
+
     def it_knows_its_content_type(self, content_type_fixture):
         video, expected_value = content_type_fixture
         assert video.content_type == expected_value
@@ -59,6 +80,14 @@ class DescribeVideo(object):
         video, expected_value = sha1_fixture
         assert video.sha1 == expected_value
 
+    def and_it_hashes_a_video_file_in_chunks(self, request):
+        file_blob_ = instance_mock(request, FileBlob)
+        file_blob_.member_chunks.return_value = 7, iter((b"blob", b"ish"))
+        video = Video(file_blob_, None, None)
+
+        assert video.sha1 == "de731a6eed12f427642325193b8e57af3c624d62"
+        file_blob_.load.assert_not_called()
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
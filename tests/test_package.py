@@ -2,11 +2,12 @@
 
 """Unit-test suite for `pptx.package` module."""
 
+import collections
 import pytest
 
 from pptx.media import Video
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part, _Relationship
+from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
 from pptx.package import _ImageParts, _MediaParts, Package
 from pptx.parts.coreprops import CorePropertiesPart
@@ -76,19 +77,21 @@ class DescribePackage(object):
         return package, _MediaParts_, media_parts_
 
     @pytest.fixture(params=[((3, 4, 2), 1), ((4, 2, 1), 3), ((2, 3, 1), 4)])
-    def next_fixture(self, request, iter_parts_):
+    def next_fixture(self, request):
         idxs, idx = request.param
         package = Package(None)
-        package.iter_parts.return_value = self.i_image_parts(request, idxs)
+        for image_part_ in self.i_image_parts(request, idxs):
+            package.relate_to(image_part_, RT.IMAGE)
         ext = "foo"
         expected_value = "/ppt/media/image%d.%s" % (idx, ext)
         return package, ext, expected_value
 
     @pytest.fixture(params=[((3, 4, 2), 1), ((4, 2, 1), 3), ((2, 3, 1), 4)])
-    def nmp_fixture(self, request, iter_parts_):
+    def nmp_fixture(self, request):
         idxs, idx = request.param
         package = Package(None)
-        package.iter_parts.return_value = self.i_media_parts(request, idxs)
+        for media_part_ in self.i_media_parts(request, idxs):
+            package.relate_to(media_part_, RT.MEDIA)
         ext = "foo"
         expected_value = "/ppt/media/media%d.%s" % (idx, ext)
         return package, ext, expected_value
@@ -110,21 +113,17 @@ class DescribePackage(object):
     def i_image_parts(self, request, idxs):
         def part(idx):
             partname = PackURI("/ppt/media/image%d.png" % idx)
-            return instance_mock(request, Part, partname=partname)
+            return instance_mock(request, Part, partname=partname, rels=())
 
         return iter([part(idx) for idx in idxs])
 
     def i_media_parts(self, request, idxs):
         def part(idx):
             partname = PackURI("/ppt/media/media%d.mp4" % idx)
-            return instance_mock(request, Part, partname=partname)
+            return instance_mock(request, Part, partname=partname, rels=())
 
         return iter([part(idx) for idx in idxs])
 
-    @pytest.fixture
-    def iter_parts_(self, request):
-        return property_mock(request, Package, "iter_parts")
-
     @pytest.fixture
     def media_(self, request):
         return instance_mock(request, Video)
@@ -149,9 +148,13 @@ class DescribePackage(object):
 class Describe_ImageParts(object):
     """Unit-test suite for `pptx.package._ImageParts` objects."""
 
-    def it_can_iterate_over_the_package_image_parts(self, iter_fixture):
-        image_parts, expected_parts = iter_fixture
-        assert list(image_parts) == expected_parts
+    def it_can_iterate_over_the_package_image_parts(self, request, package_):
+        image_parts_ = [instance_mock(request, ImagePart) for _ in range(2)]
+        package_.iter_parts_with_reltypes.return_value = iter(image_parts_)
+        image_parts = _ImageParts(package_)
+
+        assert list(image_parts) == image_parts_
+        package_.iter_parts_with_reltypes.assert_called_once_with(RT.IMAGE)
 
     def it_can_get_a_matching_image_part(
         self, Image_, image_, image_part_, _find_by_sha1_
@@ -186,24 +189,63 @@ class Describe_ImageParts(object):
         image_part = image_parts._find_by_sha1(sha1)
         assert image_part is expected_value
 
-    def but_it_skips_unsupported_image_types(self, request, _iter_):
+    def but_it_skips_unsupported_image_types(self, request, _iter_, package_):
         sha1 = "f00beed"
         svg_part_ = instance_mock(request, Part, name="svg_part_")
         png_part_ = instance_mock(request, ImagePart, name="png_part_", sha1=sha1)
         # ---order iteration to encounter svg part before target part---
         _iter_.return_value = iter((svg_part_, png_part_))
-        image_parts = _ImageParts(None)
+        image_parts = _ImageParts(package_)
 
         result = image_parts._find_by_sha1(sha1)
 
         assert result == png_part_
 
+    def it_indexes_the_image_parts_by_sha1_only_once(self, request, _iter_, package_):
+        image_part_, image_part_2_ = (
+            instance_mock(request, ImagePart, sha1="f00beed") for _ in range(2)
+        )
+        _iter_.return_value = iter((image_part_, image_part_2_))
+        in_package = set((image_part_, image_part_2_))
+        package_._part_index.contains_part.side_effect = lambda p: p in in_package
+        image_parts = _ImageParts(package_)
+
+        assert image_parts._find_by_sha1("f00beed") is image_part_
+        # ---image_part_ drops out of the package, like when its picture is deleted---
+        in_package.remove(image_part_)
+        assert image_parts._find_by_sha1("f00beed") is image_part_2_
+        in_package.add(image_part_)
+        assert image_parts._find_by_sha1("f00beed") is image_part_2_
+        assert image_parts._find_by_sha1("deadbee") is None
+        assert _iter_.call_count == 1
+
+    def and_it_adds_each_new_image_part_to_its_sha1_index(
+        self, request, package_, Image_, image_, ImagePart_, image_part_
+    ):
+        Image_.from_file.return_value = image_
+        image_.sha1 = "f00beed"
+        ImagePart_.new.return_value = image_part_
+        property_mock(
+            request,
+            _ImageParts,
+            "_image_parts_by_sha1",
+            return_value=collections.defaultdict(list),
+        )
+        image_parts = _ImageParts(package_)
+
+        image_part = image_parts.get_or_add_image_part("image.png")
+        image_part_2 = image_parts.get_or_add_image_part("image.png")
+
+        ImagePart_.new.assert_called_once_with(package_, image_)
+        assert image_part is image_part_
+        assert image_part_2 is image_part_
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
-    def find_fixture(self, request, _iter_, image_part_):
+    def find_fixture(self, request, _iter_, image_part_, package_):
         image_part_is_present = request.param
-        image_parts = _ImageParts(None)
+        image_parts = _ImageParts(package_)
         _iter_.return_value = iter((image_part_,))
         sha1 = "foobar"
         if image_part_is_present:
@@ -214,25 +256,6 @@ class Describe_ImageParts(object):
             expected_value = None
         return image_parts, sha1, expected_value
 
-    @pytest.fixture
-    def iter_fixture(self, request, package_):
-        def rel(is_external, reltype):
-            part = instance_mock(request, Part)
-            return instance_mock(
-                request,
-                _Relationship,
-                is_external=is_external,
-                reltype=reltype,
-                target_part=part,
-            )
-
-        rels = (rel(True, RT.IMAGE), rel(False, RT.SLIDE), rel(False, RT.IMAGE))
-
-        package_.iter_rels.return_value = iter((rels[0], rels[1], rels[2], rels[2]))
-        image_parts = _ImageParts(package_)
-        expected_parts = [rels[2].target_part]
-        return image_parts, expected_parts
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -267,9 +290,13 @@ class Describe_ImageParts(object):
 class Describe_MediaParts(object):
     """Unit-test suite for `pptx.package._MediaParts` objects."""
 
-    def it_can_iterate_the_media_parts_in_the_package(self, iter_fixture):
-        media_parts, expected_parts = iter_fixture
-        assert list(media_parts) == expected_parts
+    def it_can_iterate_the_media_parts_in_the_package(self, request, package_):
+        media_parts_ = [instance_mock(request, MediaPart) for _ in range(2)]
+        package_.iter_parts_with_reltypes.return_value = iter(media_parts_)
+        media_parts = _MediaParts(package_)
+
+        assert list(media_parts) == media_parts_
+        package_.iter_parts_with_reltypes.assert_called_once_with(RT.MEDIA, RT.VIDEO)
 
     def it_can_get_or_add_a_media_part(self, get_or_add_fixture):
         media_parts, media_, sha1, MediaPart_, calls = get_or_add_fixture[:5]
@@ -286,12 +313,24 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def but_not_one_that_has_dropped_out_of_the_package(
+        self, request, _iter_, package_, media_part_
+    ):
+        media_part_.sha1 = "f00beed"
+        _iter_.return_value = iter((media_part_,))
+        package_._part_index.contains_part.return_value = False
+        media_parts = _MediaParts(package_)
+
+        assert media_parts._find_by_sha1("f00beed") is None
+        package_._part_index.contains_part.assert_called_once_with(media_part_)
+        assert media_parts._media_parts_by_sha1["f00beed"] == []
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
-    def find_fixture(self, request, _iter_, media_part_):
+    def find_fixture(self, request, _iter_, media_part_, package_):
         media_part_is_present = request.param
-        media_parts = _MediaParts(None)
+        media_parts = _MediaParts(package_)
         _iter_.return_value = iter((media_part_,))
         sha1 = "foobar"
         if media_part_is_present:
@@ -314,37 +353,6 @@ class Describe_MediaParts(object):
         MediaPart_.new.return_value = None if media_present else media_part_
         return media_parts, media_, sha1, MediaPart_, calls, media_part_
 
-    @pytest.fixture
-    def iter_fixture(self, request, package_):
-        def rel(is_external, reltype, part):
-            return instance_mock(
-                request,
-                _Relationship,
-                is_external=is_external,
-                reltype=reltype,
-                target_part=part,
-            )
-
-        part_mocks = (
-            instance_mock(request, Part, name="linked-media"),
-            instance_mock(request, Part, name="slide"),
-            instance_mock(request, Part, name="embeded-media"),
-        )
-
-        rels = (
-            rel(True, RT.MEDIA, part_mocks[0]),
-            rel(True, RT.VIDEO, part_mocks[0]),
-            rel(False, RT.SLIDE, part_mocks[1]),
-            rel(False, RT.MEDIA, part_mocks[2]),
-            rel(False, RT.VIDEO, part_mocks[2]),
-        )
-
-        package_.iter_rels.return_value = iter(rels)
-
-        media_parts = _MediaParts(package_)
-        expected_parts = [part_mocks[2]]
-        return media_parts, expected_parts
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -80,7 +80,19 @@ class DescribePresentation(object):
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(
+            file_, compression=None, workers=None, prune=False
+        )
+
+    def it_can_be_closed(self, prs_part_):
+        Presentation(None, prs_part_).close()
+        prs_part_.close.assert_called_once_with()
+
+    def it_closes_itself_on_exit_when_used_as_a_context_manager(self, prs_part_):
+        with Presentation(None, prs_part_) as prs:
+            assert prs_part_.close.call_count == 0
+        assert isinstance(prs, Presentation)
+        prs_part_.close.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
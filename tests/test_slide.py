@@ -502,6 +502,31 @@ class DescribeSlides(object):
         assert slides._sldIdLst.xml == expected_xml
         assert slide is slide_
 
+    def it_can_add_a_batch_of_new_slides(self, request, slide_layout_, part_prop_):
+        sld = element("p:sld")
+        slide = Slide(sld, None)
+        slide_2_, slide_3_ = (instance_mock(request, Slide) for _ in range(2))
+        add_slide_ = method_mock(request, Slides, "add_slide", return_value=slide)
+        part_ = part_prop_.return_value
+        part_.add_slides.return_value = [("rId3", slide_2_), ("rId4", slide_3_)]
+        slides = Slides(element("p:sldIdLst/p:sldId{r:id=rId2,id=256}"), None)
+
+        new_slides = slides.add_slides(slide_layout_, 3)
+
+        add_slide_.assert_called_once_with(slides, slide_layout_)
+        part_.add_slides.assert_called_once_with(slide_layout_, 2, sld)
+        assert slides._sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId2,id=256},p:sldId{r:id=rId3,id=257},p:sldId"
+            "{r:id=rId4,id=258})"
+        )
+        assert new_slides == [slide, slide_2_, slide_3_]
+
+    def but_it_adds_no_slides_for_a_count_less_than_one(self, request):
+        add_slide_ = method_mock(request, Slides, "add_slide")
+
+        assert Slides(None, None).add_slides(None, 0) == []
+        add_slide_.assert_not_called()
+
     def it_finds_a_slide_by_slide_id(self, get_fixture):
         slides, slide_id, default, prs_part_, expected_value = get_fixture
         slide = slides.get(slide_id, default)